@@ -0,0 +1,76 @@
+"""Compare per-table statistics loops with the columnar ArticleIndex."""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from data.data_manager import DataManager  # noqa: E402
+from objects import ArticleDataClass, MainNumberDataClass  # noqa: E402
+
+
+def build_manager(tables: int, articles: int) -> DataManager:
+    rnd = random.Random(1)
+    dm = DataManager()
+    for t in range(1, tables + 1):
+        rows = [ArticleDataClass(artikelnummer=str(a), beschreibung=rnd.choice(["", "Hose"]),
+                                 groesse="116", preis=rnd.choice(["", "1.50", "2,00", "12.00"]))
+                for a in range(1, articles + 1)]
+        dm.main_numbers_list.append(MainNumberDataClass(name=f"stnr{t}", data=rows))
+    return dm
+
+
+def legacy_statistics(dm: DataManager):
+    complete = partial = open_cnt = 0
+    for table in dm.main_numbers_list:
+        for article in table.data:
+            desc = bool(article.beschreibung.strip())
+            preis = article.preis not in (None, "", "None")
+            if desc and preis:
+                complete += 1
+            elif desc or preis:
+                partial += 1
+            else:
+                open_cnt += 1
+    return complete, partial, open_cnt
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tables", type=int, default=1000)
+    parser.add_argument("--articles", type=int, default=50)
+    args = parser.parse_args()
+
+    dm = build_manager(args.tables, args.articles)
+    start = time.perf_counter()
+    legacy = legacy_statistics(dm)
+    t_legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = dm.get_article_index()
+    t_build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    counts = index.status_counts()
+    index.progress_buckets()
+    index.price_cents_per_table()
+    t_query = time.perf_counter() - start
+    assert tuple(counts.values()) == legacy
+
+    table = dm.main_numbers_list[0]
+    start = time.perf_counter()
+    dm.update_article(table.name[4:], table.data[0].artikelnummer, "Jacke", "128", "5.00")
+    t_update = time.perf_counter() - start
+
+    print(f"Artikel:                {len(index)}")
+    print(f"Schleife (alt):         {t_legacy * 1000:8.2f} ms")
+    print(f"Index aufbauen:         {t_build * 1000:8.2f} ms")
+    print(f"Index Statistik:        {t_query * 1000:8.2f} ms")
+    print(f"Artikel ändern + Index: {t_update * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Micro-benchmark: bulk row decoder vs. per-row ``__post_init__`` conversion.
+
+Usage::
+
+    python benchmarks/bench_bulk_decoder.py [--rows 100000] [--repeat 10]
+
+Decodes ``--rows`` article rows once with the former per-row conversion
+(``dict.get`` + ``str()`` per field) and once with
+:func:`objects.data_class_definition.decode_article_rows`, checks that both
+produce identical instances and prints the best time of ``--repeat`` runs.
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from objects.data_class_definition import ArticleDataClass, decode_article_rows  # noqa: E402
+
+
+def legacy_decode(rows: list) -> list:
+    """Per-row conversion as done by ``MainNumberDataClass.__post_init__`` before."""
+    converted = []
+    for article in rows:
+        if isinstance(article, dict):
+            converted.append(ArticleDataClass(
+                artikelnummer=str(article.get('artikelnummer', '')),
+                beschreibung=str(article.get('beschreibung', '')),
+                groesse=str(article.get('groesse', '')),
+                preis=str(article.get('preis', '')),
+                created_at=str(article.get('created_at', '')),
+                updated_at=str(article.get('updated_at', ''))
+            ))
+        else:
+            converted.append(article)
+    return converted
+
+
+def build_rows(count: int) -> list:
+    """Return ``count`` export-like article rows (mostly strings, some numbers/gaps)."""
+    rows = []
+    for i in range(count):
+        row = {
+            "artikelnummer": str(i % 40 + 1),
+            "beschreibung": f"Artikel {i}",
+            "groesse": "M",
+            "preis": f"{i % 25}.50",
+            "created_at": "2025-06-01 12:00:00",
+            "updated_at": "2025-06-01 12:00:00",
+        }
+        if i % 50 == 0:
+            row["preis"] = i % 25          # numeric value from a hand-edited export
+        if i % 97 == 0:
+            del row["groesse"]             # missing column
+        rows.append(row)
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    rows = build_rows(args.rows)
+    assert legacy_decode(rows) == decode_article_rows(rows), "decoders disagree"
+
+    legacy = min(timeit.repeat(lambda: legacy_decode(rows), number=1, repeat=args.repeat))
+    bulk = min(timeit.repeat(lambda: decode_article_rows(rows), number=1, repeat=args.repeat))
+    print(f"{args.rows} Artikelzeilen")
+    print(f"  pro Zeile (bisher): {legacy * 1000:8.1f} ms")
+    print(f"  Bulk-Decoder:       {bulk * 1000:8.1f} ms   (Faktor {legacy / bulk:.2f})")
+
+
+if __name__ == "__main__":
+    main()
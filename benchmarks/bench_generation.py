@@ -0,0 +1,55 @@
+"""Compare the data file generators with and without the shared GenerationSnapshot."""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import data  # noqa: E402,F401  (import order: data before objects.main_number)
+from objects import FleatMarket, MainNumberDataClass, SellerDataClass  # noqa: E402
+from generator.generation_snapshot import GenerationSnapshot  # noqa: E402
+from generator.price_list_generator import PriceListGenerator  # noqa: E402
+from generator.seller_data_generator import SellerDataGenerator  # noqa: E402
+from generator.statistic_data_generator import StatisticDataGenerator  # noqa: E402
+
+
+def build_market(tables: int, articles: int) -> FleatMarket:
+    rnd = random.Random(1)
+    fm = FleatMarket()
+    fm.load_sellers([SellerDataClass(id=str(t), vorname="A", nachname="B") for t in range(1, tables + 1)])
+    fm.load_main_numbers([
+        MainNumberDataClass(name=f"stnr{t}", data=[
+            {"artikelnummer": str(a), "beschreibung": rnd.choice(["", "Hose"]), "groesse": "",
+             "preis": rnd.choice(["", "1.50", "2,00", "12"])} for a in range(1, articles + 1)])
+        for t in range(1, tables + 1)])
+    return fm
+
+
+def run(fm: FleatMarket, path: Path, shared: bool) -> float:
+    start = time.perf_counter()
+    snapshot = GenerationSnapshot.from_market(fm) if shared else None
+    SellerDataGenerator(fm, str(path), snapshot=snapshot).generate()
+    PriceListGenerator(fm, path=path, snapshot=snapshot).generate()
+    StatisticDataGenerator(fm, str(path), snapshot=snapshot).generate()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tables", type=int, default=1000)
+    parser.add_argument("--articles", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, shared in (("je Generator eigener Durchlauf", False), ("gemeinsamer Snapshot", True)):
+            # fresh market per run, so no validation results are cached from the previous run
+            fm = build_market(args.tables, args.articles)
+            print(f"{label:32s} {run(fm, Path(tmp), shared) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
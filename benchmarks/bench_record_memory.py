@@ -0,0 +1,83 @@
+"""Compare the memory per article of dict-backed and slotted record types (tracemalloc)."""
+
+import argparse
+import gc
+import json
+import random
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import data  # noqa: E402,F401  (import order: data before objects.main_number)
+from objects import MainNumber, MainNumberDataClass, decode_article_rows  # noqa: E402
+
+
+@dataclass
+class LegacyArticleDataClass:
+    """ArticleDataClass as it was before: a plain dataclass with ``__dict__``."""
+    artikelnummer: str = ""
+    beschreibung: str = ""
+    groesse: str = ""
+    preis: str = ""
+    created_at: str = ""
+    updated_at: str = ""
+
+
+class LegacyArticle(LegacyArticleDataClass):
+    """Copy held by the old MainNumber next to the ArticleDataClass."""
+
+
+def build_export(articles: int) -> str:
+    rnd = random.Random(1)
+    rows = [{"artikelnummer": str(a % 100), "beschreibung": rnd.choice(["Hose", "Jacke", "Buch", ""]),
+             "groesse": rnd.choice(["", "116", "128", "M"]), "preis": rnd.choice(["1.50", "2,00", "12"]),
+             "created_at": "2024-03-01 10:00:00", "updated_at": "2024-03-02 18:30:00"}
+            for a in range(articles)]
+    return json.dumps(rows)
+
+
+def measure(text: str, build) -> int:
+    """Bytes still allocated after parsing ``text`` and building the records (raw rows dropped)."""
+    gc.collect()
+    tracemalloc.start()
+    rows = json.loads(text)
+    records = build(rows)
+    del rows
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return current
+
+
+def legacy(rows):
+    articles = [LegacyArticleDataClass(**row) for row in rows]
+    return articles, [LegacyArticle(**vars(a)) for a in articles]
+
+
+def slotted(rows):
+    return decode_article_rows(rows)
+
+
+def records(rows):
+    return MainNumber(MainNumberDataClass(name="stnr1", data=rows))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=50000)
+    args = parser.parse_args()
+
+    text = build_export(args.articles)
+    for label, build in (("alt (Dataclass + Article, __dict__)", legacy),
+                         ("ArticleDataClass (slots)", slotted),
+                         ("MainNumber-Records (slots)", records)):
+        per_article = measure(text, build) / args.articles
+        print(f"{label:38s} {per_article:8.1f} Byte/Artikel")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Compare a linear scan over all articles with the SearchIndex for prefix queries."""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from data.data_manager import DataManager  # noqa: E402
+from objects import ArticleDataClass, MainNumberDataClass  # noqa: E402
+
+WORDS = ["Hose", "Jacke", "Pullover", "Kleid", "Schuhe", "Buch", "Puzzle", "Mütze", "Schal", "Body",
+         "blau", "rot", "grün", "gestreift", "Winter", "Sommer", "Jeans", "Strampler", "Lego", "Spiel"]
+QUERIES = ["jack", "blau hos", "winter jacke 1", "lego", "xyz"]
+
+
+def build_manager(tables: int, articles: int) -> DataManager:
+    rnd = random.Random(1)
+    dm = DataManager()
+    for t in range(1, tables + 1):
+        rows = [ArticleDataClass(artikelnummer=str(a), beschreibung=" ".join(rnd.sample(WORDS, 3)),
+                                 groesse=rnd.choice(["", "104", "116", "128", "M"]), preis="2.00")
+                for a in range(1, articles + 1)]
+        dm.main_numbers_list.append(MainNumberDataClass(name=f"stnr{t}", data=rows))
+    return dm
+
+
+def linear_search(dm: DataManager, query: str) -> int:
+    words = query.casefold().split()
+    found = 0
+    for table in dm.main_numbers_list:
+        for article in table.data:
+            text = f"{article.beschreibung} {article.groesse}".casefold().split()
+            if all(any(w.startswith(q) for w in text) for q in words):
+                found += 1
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tables", type=int, default=1000)
+    parser.add_argument("--articles", type=int, default=50)
+    args = parser.parse_args()
+
+    dm = build_manager(args.tables, args.articles)
+    start = time.perf_counter()
+    dm.get_search_index()
+    print(f"Index aufbauen:   {(time.perf_counter() - start) * 1000:8.1f} ms")
+    for query in QUERIES:
+        start = time.perf_counter()
+        linear = linear_search(dm, query)
+        t_linear = time.perf_counter() - start
+        start = time.perf_counter()
+        hits = dm.search(query, limit=200)
+        t_index = time.perf_counter() - start
+        print(f"{query!r:18s} linear {t_linear * 1000:8.1f} ms ({linear} Treffer)   "
+              f"Index {t_index * 1000:6.2f} ms ({len(hits)} angezeigt)")
+
+
+if __name__ == "__main__":
+    main()
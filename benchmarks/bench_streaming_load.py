@@ -0,0 +1,100 @@
+"""Memory benchmark: streamed table-by-table load vs. classic ``json.load``.
+
+Usage::
+
+    python benchmarks/bench_streaming_load.py [--sellers 500] [--articles 80]
+
+A synthetic phpMyAdmin export is written to a temporary directory and loaded
+twice through :class:`BaseData` – once with ``streaming=False`` (whole document
+decoded, raw list kept in ``json_data``) and once with the incremental loader.
+Peak memory is measured with :mod:`tracemalloc`.
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from data.base_data import BaseData  # noqa: E402
+
+
+def build_export(sellers: int, articles: int) -> list:
+    """Return a synthetic export with ``sellers`` stnr tables of ``articles`` rows."""
+    stamp = "2025-06-01 12:00:00"
+    export = [
+        {"type": "header", "version": "5.2.1", "comment": "Export to JSON plugin for PHPMyAdmin"},
+        {"type": "database", "name": "flohmarkt"},
+        {"type": "table", "name": "einstellungen", "database": "flohmarkt", "data": [
+            {"max_stammnummern": str(sellers), "max_artikel": str(articles)}
+        ]},
+    ]
+    for stnr in range(1, sellers + 1):
+        export.append({
+            "type": "table", "name": f"stnr{stnr}", "database": "flohmarkt",
+            "data": [
+                {
+                    "artikelnummer": str(nr),
+                    "beschreibung": f"Artikel {nr} von Verkäufer {stnr}",
+                    "groesse": "M",
+                    "preis": f"{(nr % 20) + 0.5:.2f}",
+                    "created_at": stamp,
+                    "updated_at": stamp,
+                }
+                for nr in range(1, articles + 1)
+            ],
+        })
+    export.append({
+        "type": "table", "name": "verkaeufer", "database": "flohmarkt",
+        "data": [
+            {
+                "id": str(stnr), "vorname": f"Vorname{stnr}", "nachname": f"Nachname{stnr}",
+                "telefon": "0123456789", "email": f"verkaeufer{stnr}@example.org",
+                "passwort": "geheim", "created_at": stamp, "updated_at": stamp,
+            }
+            for stnr in range(1, sellers + 1)
+        ],
+    })
+    return export
+
+
+def measure(path: Path, streaming: bool) -> tuple:
+    """Load ``path`` and return ``(peak_bytes, retained_bytes, seconds)``."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    data = BaseData()
+    data.load(str(path), streaming=streaming)
+    duration = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert data.get_main_number_as_list(), "load failed"
+    del data
+    return peak, retained, duration
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sellers", type=int, default=500)
+    parser.add_argument("--articles", type=int, default=80)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "export.json"
+        path.write_text(json.dumps(build_export(args.sellers, args.articles), indent=4), encoding="utf-8")
+        size_mb = path.stat().st_size / 1e6
+        print(f"Export: {args.sellers} Tabellen x {args.articles} Artikel, {size_mb:.1f} MB")
+
+        for label, streaming in (("json.load (bisher)", False), ("streaming", True)):
+            peak, retained, duration = measure(path, streaming)
+            print(f"{label:<20} peak {peak / 1e6:8.1f} MB   "
+                  f"gehalten {retained / 1e6:8.1f} MB   {duration:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -31,6 +31,9 @@ EXAMPLES:
 
   6. Show only warnings and errors on console:
      {prog_name} -f input.json -l WARNING
+
+  7. Generate DAT files and PDF in parallel (4 workers):
+     {prog_name} -f input.json -w 4
 --------------------------------------------------
 """
 
@@ -84,6 +87,15 @@ EXAMPLES:
              "affect file logging if configured separately.\n"
              "Default: INFO. Overridden by --verbose (which sets DEBUG)."
     )
+    parser.add_argument(
+        '--validate',
+        action='store_true',
+        required=False,
+        help="Optional: Only validates the input JSON file (prices, descriptions,\n"
+             "duplicate article numbers, sellers without article list and vice\n"
+             "versa), prints the report and exits without generating files.\n"
+             "Exit code 1 if the report contains errors."
+    )
     parser.add_argument(
         '--pdf-template',
         default='Abholung_Template.pdf',
@@ -131,5 +143,17 @@ EXAMPLES:
              "statistics data file. The '.dat' extension is appended automatically.\n"
              "Default: 'versand' (generates 'versand.dat')."
     )
+    parser.add_argument(
+        '-w', '--workers',
+        type=int,
+        default=1,
+        required=False,
+        metavar='<count>',
+        help="Optional: Number of generation tasks (DAT files, PDF) run at the\n"
+             "same time. With more than 1 the DAT files are written in parallel\n"
+             "and the PDF is rendered in a separate process; the files are the\n"
+             "same as with sequential generation.\n"
+             "Default: 1 (sequential)."
+    )
 
     return parser.parse_args()
@@ -1,19 +1,40 @@
 """Convenience imports for the data layer."""
 
 from .base import Base
+from .article_index import ArticleIndex
+from .backup_store import BackupStore
+from .http_cache import HttpCache
 from .json_handler import JsonHandler
 from .base_data import BaseData
+from .change_journal import ChangeJournal
+from .change_log import ChangeLog
 from .data_manager import DataManager
 from .market_config_handler import MarketConfigHandler
 from .market_facade import MarketFacade
+from .market_snapshot import MarketSnapshot
+from .market_summary import MarketSummary, MarketSummarySnapshot
 from .pdf_display_config import PdfDisplayConfig
+from .search_index import SearchHit, SearchIndex
+from .validation import ValidationEngine, ValidationReport
 
 __all__ = [
     "Base",
+    "ArticleIndex",
+    "BackupStore",
+    "HttpCache",
     "JsonHandler",
     "BaseData",
+    "ChangeJournal",
+    "ChangeLog",
     "DataManager",
     "MarketConfigHandler",
     "MarketFacade",
+    "MarketSnapshot",
+    "MarketSummary",
+    "MarketSummarySnapshot",
     "PdfDisplayConfig",
+    "SearchHit",
+    "SearchIndex",
+    "ValidationEngine",
+    "ValidationReport",
 ]
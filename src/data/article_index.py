@@ -0,0 +1,234 @@
+"""Columnar (NumPy) index over all articles of a market."""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from log import CustomLogger
+from objects import MainNumberDataClass, ArticleDataClass, row_is_filled
+from util.price_utils import price_state, PRICE_EMPTY
+from .base import Base
+
+_INT16_MAX = int(np.iinfo(np.int16).max)
+
+
+class ArticleIndex(Base):
+    """
+    Keep one row per article in flat NumPy columns for market-wide statistics.
+
+    Columns: ``stnr`` (int32), ``artikelnummer`` (int16, ``-1`` if not
+    numeric), ``price_cents`` (int64, ``0`` if empty or invalid),
+    ``price_status`` (uint8, ``PRICE_EMPTY`` / ``PRICE_OK`` /
+    ``PRICE_INVALID`` of :func:`util.price_utils.price_state`) and ``status``
+    (uint8, see :attr:`COMPLETE`, :attr:`PARTIAL`, :attr:`OPEN`).
+    The rows of a table are contiguous, so the figures of one table are
+    reductions over a slice and per-table figures need a single ``bincount``
+    or running sum over all rows.
+
+    The status follows ``DataManager._article_status_counts``: an article is
+    complete with description and price, partial with one of them and open
+    otherwise. Rows cleared by ``DataManager.delete_article`` (no
+    description, price :data:`CLEARED_PRICE`) are open, as in
+    :func:`row_is_filled`.
+    """
+
+    COMPLETE = 0
+    PARTIAL = 1
+    OPEN = 2
+    STATUS_KEYS = ("vollstaendig", "teilweise", "offen")
+    BUCKET_KEYS = ("voll", "fast", "halb", "arbeit", "start")
+
+    def __init__(self, tables: Iterable[MainNumberDataClass] = (), logger: Optional[CustomLogger] = None) -> None:
+        """
+        Args:
+            tables (Iterable[MainNumberDataClass]): Tables to index; only ``stnr*`` tables are used.
+            logger (Optional[CustomLogger]): Optional logger.
+        """
+        Base.__init__(self, logger)
+        self.rebuild(tables)
+
+    # ------------------------------------------------------------------
+    # Building / updating
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _values(preis_raw: str, beschreibung: str) -> Tuple[int, int, int]:
+        if not row_is_filled(beschreibung, preis_raw):
+            return 0, ArticleIndex.OPEN, PRICE_EMPTY  # unused or cleared row
+        has_description = bool(beschreibung.strip())
+        cents, price_status = price_state(preis_raw)
+        if price_status == PRICE_EMPTY:
+            return 0, ArticleIndex.PARTIAL if has_description else ArticleIndex.OPEN, price_status
+        return cents, ArticleIndex.COMPLETE if has_description else ArticleIndex.PARTIAL, price_status
+
+    @staticmethod
+    def _row_values(article: ArticleDataClass) -> Tuple[int, int, int]:
+        return ArticleIndex._values(article.preis, article.beschreibung)
+
+    @staticmethod
+    def _raw_row_values(row: dict) -> Tuple[int, int, int]:
+        # Same rules as _row_values on an undecoded export row (values not yet str)
+        return ArticleIndex._values(str(row.get("preis", "")), str(row.get("beschreibung", "")))
+
+    @staticmethod
+    def _raw_article_number(row: dict) -> int:
+        return ArticleIndex._number_value(str(row.get("artikelnummer", "")))
+
+    @staticmethod
+    def _article_number(article: ArticleDataClass) -> int:
+        return ArticleIndex._number_value(article.artikelnummer)
+
+    @staticmethod
+    def _number_value(raw: str) -> int:
+        # isdigit() is cheap and covers the exported numbers; anything else is -1
+        if raw.isdigit() and len(raw) <= 5:
+            number = int(raw)
+            return number if number <= _INT16_MAX else -1
+        return -1
+
+    def rebuild(self, tables: Iterable[MainNumberDataClass]) -> None:
+        """(Re)build all columns from ``tables``."""
+        self._tables: Dict[str, MainNumberDataClass] = {}
+        self._slices: Dict[str, slice] = {}
+        stnr: List[int] = []
+        numbers: List[int] = []
+        cents: List[int] = []
+        status: List[int] = []
+        price_status: List[int] = []
+        for table in tables:
+            if not table.name.startswith("stnr"):
+                continue
+            start = len(status)
+            try:
+                table_number = int(table.name[4:])
+            except ValueError:
+                table_number = -1
+            # Tables that were not opened yet are read from their raw rows
+            rows = table.raw_rows()
+            if rows is None:
+                rows, row_values, article_number = table.data, self._row_values, self._article_number
+            else:
+                row_values, article_number = self._raw_row_values, self._raw_article_number
+            stnr.extend([table_number] * len(rows))
+            numbers.extend([article_number(a) for a in rows])
+            for price, state, parsed in map(row_values, rows):
+                cents.append(price)
+                status.append(state)
+                price_status.append(parsed)
+            self._tables[table.name] = table
+            self._slices[table.name] = slice(start, len(status))
+
+        self.stnr = np.array(stnr, dtype=np.int32)
+        self.artikelnummer = np.array(numbers, dtype=np.int16)
+        self.price_cents = np.array(cents, dtype=np.int64)
+        self.status = np.array(status, dtype=np.uint8)
+        self.price_status = np.array(price_status, dtype=np.uint8)
+        # Table ordinal per row for grouped reductions
+        self._names: List[str] = list(self._slices)
+        self._table_ord = np.repeat(
+            np.arange(len(self._names), dtype=np.int32),
+            [s.stop - s.start for s in self._slices.values()])
+        self._log("DEBUG", f"Artikelindex: {len(self.status)} Artikel in {len(self._names)} Tabellen.")
+
+    def update_table(self, table_name: str) -> None:
+        """Refresh the rows of ``table_name`` in place after its articles changed."""
+        table = self._tables.get(table_name)
+        if table is None:
+            return
+        rows = self._slices[table_name]
+        if rows.stop - rows.start != len(table.data):
+            self.rebuild(self._tables.values())  # row count changed
+            return
+        for offset, article in enumerate(table.data, rows.start):
+            self.price_cents[offset], self.status[offset], self.price_status[offset] = self._row_values(article)
+            self.artikelnummer[offset] = self._article_number(article)
+
+    def __len__(self) -> int:
+        return len(self.status)
+
+    # ------------------------------------------------------------------
+    # Aggregates
+    # ------------------------------------------------------------------
+    def _rows(self, table_name: Optional[str]) -> slice:
+        if table_name is None:
+            return slice(0, len(self.status))
+        return self._slices.get(table_name, slice(0, 0))
+
+    def status_counts(self, table_name: Optional[str] = None) -> Dict[str, int]:
+        """Return complete / partial / open counts for one table or the whole market."""
+        counts = np.bincount(self.status[self._rows(table_name)], minlength=3)
+        return dict(zip(self.STATUS_KEYS, (int(c) for c in counts[:3])))
+
+    def price_sum_cents(self, table_name: Optional[str] = None) -> int:
+        """Return the sum of all valid prices in cents."""
+        return int(self.price_cents[self._rows(table_name)].sum())
+
+    def table_prices(self, table_name: str) -> Optional[Tuple[List[int], List[int]]]:
+        """
+        Return the parsed prices of ``table_name`` in row order.
+
+        Args:
+            table_name (str): Table name, e.g. ``"stnr12"``.
+
+        Returns:
+            Optional[Tuple[List[int], List[int]]]: ``price_cents`` and ``price_status`` per
+            article, ``None`` if the table is not indexed.
+        """
+        rows = self._slices.get(table_name)
+        if rows is None:
+            return None
+        return self.price_cents[rows].tolist(), self.price_status[rows].tolist()
+
+    def table_names(self) -> List[str]:
+        """Return the indexed table names in row order."""
+        return list(self._names)
+
+    def status_counts_per_table(self) -> np.ndarray:
+        """Return an ``(n_tables, 3)`` array of complete / partial / open counts."""
+        n = len(self._names)
+        flat = np.bincount(self._table_ord.astype(np.int64) * 3 + self.status, minlength=3 * n)
+        return flat.reshape(n, 3)
+
+    def price_cents_per_table(self) -> np.ndarray:
+        """Return the price sum in cents per table (``int64``)."""
+        # Rows of a table are contiguous: difference of the running sum at the slice bounds
+        running = np.concatenate(([0], np.cumsum(self.price_cents, dtype=np.int64)))
+        starts = np.fromiter((s.start for s in self._slices.values()), dtype=np.int64, count=len(self._names))
+        stops = np.fromiter((s.stop for s in self._slices.values()), dtype=np.int64, count=len(self._names))
+        return running[stops] - running[starts]
+
+    def price_histogram(self, edges_cents: Sequence[int], table_name: Optional[str] = None) -> np.ndarray:
+        """
+        Count priced articles per price bin for one table or the whole market.
+
+        Bin ``i`` holds prices below ``edges_cents[i]`` (and at or above the
+        previous edge); the last bin holds everything from the last edge on.
+        Articles without a valid price are not counted.
+        """
+        prices = self.price_cents[self._rows(table_name)]
+        prices = prices[prices > 0]
+        return np.bincount(np.searchsorted(edges_cents, prices, side="right"), minlength=len(edges_cents) + 1)
+
+    def price_histogram_per_table(self, edges_cents: Sequence[int]) -> np.ndarray:
+        """Return an ``(n_tables, len(edges_cents) + 1)`` array of :meth:`price_histogram` counts."""
+        n, bins = len(self._names), len(edges_cents) + 1
+        priced = self.price_cents > 0
+        flat = np.bincount(self._table_ord[priced].astype(np.int64) * bins
+                           + np.searchsorted(edges_cents, self.price_cents[priced], side="right"),
+                           minlength=n * bins)
+        return flat.reshape(n, bins)
+
+    def progress_buckets(self) -> Dict[str, int]:
+        """
+        Count tables by their share of complete articles.
+
+        Buckets: ``voll`` (100 %), ``fast`` (>= 75 %), ``halb`` (>= 50 %),
+        ``arbeit`` (>= 25 %) and ``start`` (rest, including empty tables).
+        """
+        counts = self.status_counts_per_table()
+        totals = counts.sum(axis=1)
+        ratio = np.divide(counts[:, self.COMPLETE], totals,
+                          out=np.zeros(len(totals), dtype=np.float64), where=totals > 0)
+        bucket = np.select([ratio == 1, ratio >= 0.75, ratio >= 0.50, ratio >= 0.25],
+                           [0, 1, 2, 3], default=4)
+        per_bucket = np.bincount(bucket, minlength=5)
+        return dict(zip(self.BUCKET_KEYS, (int(c) for c in per_bucket)))
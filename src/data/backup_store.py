@@ -0,0 +1,192 @@
+"""Content-addressed, compressed backups of a single file."""
+
+import gzip
+import hashlib
+import json
+import lzma
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from log import CustomLogger
+from .base import Base
+
+
+class BackupStore(Base):
+    """
+    Keep compressed backups of one file in ``.backups/<file name>/``.
+
+    Every backup is stored once per content (``objects/<sha256>.gz`` or
+    ``.xz``); ``index.json`` lists the backups in creation order together with
+    the next sequence number, so neither finding the latest backup nor the
+    next slot needs to scan the directory. A backup whose content equals the
+    latest one is not recorded again.
+
+    Retention: the newest ``keep_last`` backups are kept, plus the newest
+    backup of each of the last ``keep_daily`` days that have backups.
+    Objects no longer referenced by the index are deleted.
+    """
+
+    DIR_NAME = ".backups"
+    INDEX_NAME = "index.json"
+    INDEX_VERSION = 1
+    _COMPRESSORS = {"gzip": (".gz", gzip.open), "lzma": (".xz", lzma.open)}
+
+    def __init__(self, store_dir: Union[str, Path], compression: str = "gzip", keep_last: int = 10,
+                 keep_daily: int = 7, logger: Optional[CustomLogger] = None) -> None:
+        """
+        Args:
+            store_dir (Union[str, Path]): Directory holding index and objects.
+            compression (str): ``"gzip"`` (fast) or ``"lzma"`` (smaller).
+            keep_last (int): Number of newest backups that are always kept.
+            keep_daily (int): Number of days for which the newest backup is kept.
+            logger (Optional[CustomLogger]): Optional logger.
+
+        Raises:
+            ValueError: If ``compression`` is unknown.
+        """
+        Base.__init__(self, logger)
+        if compression not in self._COMPRESSORS:
+            raise ValueError(f"Unbekannte Kompression: {compression}")
+        self._dir = Path(store_dir)
+        self._compression = compression
+        self.keep_last = keep_last
+        self.keep_daily = keep_daily
+        self._index: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def for_file(cls, file_path: Union[str, Path], **kwargs: Any) -> "BackupStore":
+        """Return the store for ``file_path`` (``<dir>/.backups/<file name>/``)."""
+        path = Path(file_path)
+        return cls(path.parent / cls.DIR_NAME / path.name, **kwargs)
+
+    @property
+    def path(self) -> Path:
+        """Directory of the store."""
+        return self._dir
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+    def _load_index(self) -> Dict[str, Any]:
+        if self._index is None:
+            index_file = self._dir / self.INDEX_NAME
+            self._index = {"version": self.INDEX_VERSION, "next_seq": 1, "entries": []}
+            if index_file.is_file():
+                try:
+                    data = json.loads(index_file.read_text(encoding="utf-8"))
+                    if data.get("version") == self.INDEX_VERSION:
+                        self._index = data
+                except (OSError, ValueError) as err:
+                    self._log("WARNING", f"Backup-Index {index_file} nicht lesbar, wird neu angelegt: {err}")
+        return self._index
+
+    def _write_index(self) -> None:
+        index_file = self._dir / self.INDEX_NAME
+        tmp = index_file.with_name(index_file.name + ".tmp")
+        tmp.write_text(json.dumps(self._index, indent=1), encoding="utf-8")
+        os.replace(tmp, index_file)
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Return the index entries (``seq``, ``hash``, ``file``, ``created``, ``size``), oldest first."""
+        return list(self._load_index()["entries"])
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """Return the newest entry or ``None``."""
+        entries = self._load_index()["entries"]
+        return entries[-1] if entries else None
+
+    # ------------------------------------------------------------------
+    # Backup / restore
+    # ------------------------------------------------------------------
+    def add(self, file_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+        """
+        Back up ``file_path``.
+
+        The file is hashed first; it is only compressed if no object with the
+        same content is stored yet, so saving an unchanged file costs one read.
+
+        Returns:
+            Optional[Dict[str, Any]]: The new entry, or the latest entry if the content is unchanged.
+        """
+        index = self._load_index()
+        suffix, opener = self._COMPRESSORS[self._compression]
+        objects = self._dir / "objects"
+
+        digest = hashlib.sha256()
+        size = 0
+        with open(file_path, "rb") as src:
+            for chunk in iter(lambda: src.read(1 << 20), b""):
+                digest.update(chunk)
+                size += len(chunk)
+        content_hash = digest.hexdigest()
+
+        latest = self.latest()
+        if latest is not None and latest["hash"] == content_hash:
+            return latest
+
+        existing = next((e["file"] for e in index["entries"] if e["hash"] == content_hash), None)
+        if existing is not None and (objects / existing).is_file():
+            object_name = existing
+        else:
+            objects.mkdir(parents=True, exist_ok=True)
+            tmp = objects / f".incoming{suffix}"
+            with open(file_path, "rb") as src, opener(tmp, "wb") as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+            object_name = content_hash + suffix
+            os.replace(tmp, objects / object_name)
+
+        entry = {
+            "seq": index["next_seq"],
+            "hash": content_hash,
+            "file": object_name,
+            "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "size": size,
+        }
+        index["next_seq"] += 1
+        index["entries"].append(entry)
+        self._apply_retention()
+        self._write_index()
+        return entry
+
+    def restore(self, target: Union[str, Path], seq: Optional[int] = None) -> bool:
+        """
+        Write the backup ``seq`` (default: latest) to ``target``.
+
+        Returns:
+            bool: True if a backup was restored.
+        """
+        entries = self._load_index()["entries"]
+        entry = entries[-1] if seq is None and entries else next((e for e in entries if e["seq"] == seq), None)
+        if entry is None:
+            return False
+        opener = gzip.open if entry["file"].endswith(".gz") else lzma.open
+        with opener(self._dir / "objects" / entry["file"], "rb") as src, open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst, 1 << 20)
+        return True
+
+    def _apply_retention(self) -> None:
+        entries = self._index["entries"]
+        keep = {e["seq"] for e in entries[-self.keep_last:]} if self.keep_last > 0 else set()
+        days: Dict[str, int] = {}
+        for entry in reversed(entries):
+            day = entry["created"][:10]
+            if day not in days and len(days) < self.keep_daily:
+                days[day] = entry["seq"]
+        keep.update(days.values())
+        if len(keep) == len(entries):
+            return
+
+        self._index["entries"] = [e for e in entries if e["seq"] in keep]
+        referenced = {e["file"] for e in self._index["entries"]}
+        for entry in entries:
+            if entry["file"] not in referenced:
+                referenced.add(entry["file"])  # delete each object only once
+                try:
+                    (self._dir / "objects" / entry["file"]).unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError as err:
+                    self._log("WARNING", f"Backup {entry['file']} konnte nicht gelöscht werden: {err}")
@@ -6,6 +6,9 @@ from display import OutputInterfaceAbstraction
 
 
 class Base:
+    # No instance state: keeps slotted subclasses (records in objects/) free of a __dict__
+    __slots__ = ()
+
     logger: Optional[CustomLogger] = None          # Klassen-Attr.
     output_interface: Optional[OutputInterfaceAbstraction] = None
 
@@ -1,11 +1,14 @@
 # --- START OF FILE base_data.py ---
 
-from typing import Optional, Callable, Dict, List, Any  # Added Any
+from typing import Optional, Callable, Dict, List, Any, Iterable  # Added Any
+import json
 import sys
 import time
 from pathlib import Path  # Import Path from pathlib
+from urllib.parse import urlparse
 
 from .json_handler import JsonHandler
+from .validation import ValidationEngine, ValidationReport
 from log import CustomLogger, LogType
 from objects.data_class_definition import *
 
@@ -24,16 +27,24 @@ class BaseData(JsonHandler, JSONData):
             json_file_path (str): Path or URL to the main JSON data file.
             logger (Optional[CustomLogger]): Logger instance for logging.
         """
+        # Set by _parse_json_items; a streamed load parses while JsonHandler loads
+        self._data_parsed: bool = False
+        # Bumped whenever the data classes change; keys the cached validation report
+        self._data_version: int = 0
+        self._validation: Optional[tuple] = None  # (data version, ValidationReport)
+
         # Initialize JsonHandler first to load data and set up logger
         # The logger passed here will be available as self.logger
         super().__init__(json_path_or_data=json_file_path, logger=logger)
 
+        if self._data_parsed:
+            return  # Already parsed by load() (streaming path)
+
         # Check if data loading was successful in JsonHandler's __init__
         if self.json_data is None:
             self._log("ERROR", f"BaseData initialization failed: Could not load JSON data from {json_file_path}.")
             # Initialize JSONData with defaults even if loading failed, to prevent AttributeErrors later
-            JSONData.__init__(self, export_header=HeaderDataClass(), base_info=BaseInfoDataClass(),
-                              settings=SettingDataClass(), main_numbers_list=[], sellers=SellerListDataClass())
+            self._reset_json_data()
             return  # Stop further processing if data loading failed
 
         # Proceed with parsing if data loaded successfully
@@ -53,11 +64,13 @@ class BaseData(JsonHandler, JSONData):
                 except Exception as e:
                     print(f"BASE_DATA LOGGING FAILED ({level}): {message} | Error: {e}", file=sys.stderr)
 
+    def _reset_json_data(self) -> None:
+        """ Initializes the JSONData part with empty defaults. """
+        JSONData.__init__(self, export_header=HeaderDataClass(), base_info=BaseInfoDataClass(),
+                          settings=SettingDataClass(), main_numbers_list=[], sellers=SellerListDataClass())
+
     def _parse_json_data(self) -> bool:
         """ Parses the loaded self.json_data into the data class structure. """
-
-        ret: bool = False
-        self._log("INFO", "Parsing loaded JSON data into data classes...")
         json_data = self.get_data()  # Already loaded by JsonHandler.__init__
 
         # Ensure json_data is a list as expected by the original logic
@@ -65,40 +78,52 @@ class BaseData(JsonHandler, JSONData):
             self._log(
                 "ERROR", f"JSON data structure error: Expected a List, got {type(json_data).__name__}. Cannot parse.")
             # Initialize JSONData with defaults
-            JSONData.__init__(self, export_header=HeaderDataClass(), base_info=BaseInfoDataClass(),
-                              settings=SettingDataClass(), main_numbers_list=[], sellers=SellerListDataClass())
-            return ret
+            self._reset_json_data()
+            return False
+
+        return self._parse_json_items(json_data)
+
+    def _parse_json_items(self, items: Iterable[Dict[str, Any]]) -> bool:
+        """
+        Converts top-level export objects into the data class structure.
+
+        Every item is turned into its data class as soon as it is seen, so
+        ``items`` may be a lazy iterator (see :meth:`JsonHandler.iter_local_items`)
+        and the raw dictionaries can be released table by table.
+
+        Args:
+            items (Iterable[Dict[str, Any]]): Header, database and table objects of an export.
+
+        Returns:
+            bool: True if parsing succeeded, False otherwise (data is reset to defaults).
+        """
+        ret: bool = False
+        self._data_parsed = False
+        self._log("INFO", "Parsing loaded JSON data into data classes...")
 
         try:
-            header_dict = {}
-            base_info_dict = {}
-            settings_dict = {}
-            main_number_dicts: List[Dict[str, Any]] = []  # List to hold multiple main number dicts
-            sellers_dict = {}
-            for item in json_data:
+            _export_header = HeaderDataClass()
+            _base_info = BaseInfoDataClass()
+            _settings = SettingDataClass()
+            _main_numbers: List[MainNumberDataClass] = []
+            _sellers = SellerListDataClass()
+            for item in items:
 
                 if item.get("type") == "header":
-                    header_dict = item
+                    _export_header = HeaderDataClass(**item)
                 elif item.get("type") == "database":
-                    base_info_dict = item
+                    _base_info = BaseInfoDataClass(**item)
                 elif item.get("type") == "table" and item.get("name") == "einstellungen":
-                    settings_dict = item
+                    _settings = SettingDataClass(**item)
                 elif item.get("type") == "table" and item.get("name").find("stnr") != -1:
                     # Hier wird angenommen, dass "table" die MainNumbers repräsentiert
-                   # main_number_dicts = main_number_dicts if 'main_number_dicts' in locals() else []
-                    main_number_dicts.append(item)
+                    _main_numbers.append(MainNumberDataClass(**item))
                 elif item.get("type") == "table" and item.get("name") == "verkaeufer":
-                    sellers_dict = item
+                    _sellers = SellerListDataClass(**item)
                 else:
                     pass
                     # Suche anhand des "type" Schlüssels
-
-            _export_header = HeaderDataClass(**header_dict)
-            _base_info = BaseInfoDataClass(**base_info_dict)
-            _settings = SettingDataClass(**settings_dict)
-
-            _main_numbers = [MainNumberDataClass(**table) for table in main_number_dicts]
-            _sellers = SellerListDataClass(**sellers_dict)
+                del item  # drop the raw dict before the next table is decoded
 
             # Initialisierung des JSONData-Teils der Klasse
             JSONData.__init__(self, export_header=_export_header, base_info=_base_info, settings=_settings,
@@ -106,34 +131,38 @@ class BaseData(JsonHandler, JSONData):
 
             self._log("INFO", "JSON data parsed successfully.")
             ret = True
+            self._data_version += 1
+            self._on_data_parsed()
         except TypeError as e:
             # Catch errors often related to unexpected data types in **kwargs
             self._log("ERROR", f"Data structure error during parsing (likely unexpected data type): {e}")
-            JSONData.__init__(self, export_header=HeaderDataClass(), base_info=BaseInfoDataClass(),
-                              settings=SettingDataClass(), main_numbers_list=[], sellers=SellerListDataClass())  # Reset to defaults
+            self._reset_json_data()  # Reset to defaults
+            ret = False
+        except json.JSONDecodeError as e:
+            self._log_error("_parse_json_items", f"JSON decoding failed for: {self.get_storage_full_path()}", e)
+            self._reset_json_data()
             ret = False
         except Exception as e:
             self._log("ERROR", f"Unexpected error during JSON parsing: {e}")
             # Reset to default state in case of partial parsing failure
-            JSONData.__init__(self, export_header=HeaderDataClass(), base_info=BaseInfoDataClass(),
-                              settings=SettingDataClass(), main_numbers_list=[], sellers=SellerListDataClass())
+            self._reset_json_data()
             ret = False
 
+        self._data_parsed = ret
         return ret
 
+    def _on_data_parsed(self) -> None:
+        """ Hook called after the data classes were (re)built from an export. """
+
     def reload_data(self, json_file_path: str) -> bool:
         """ Explicitly reloads JSON data from the given path and reparses it. """
         self._log("INFO", f"Reloading data from {json_file_path}...")
-        # Use the load method from JsonHandler (which also updates self.json_data)
-        self.load(json_file_path)
-        if self.json_data is not None:
-            return self._parse_json_data()  # Reparse the newly loaded data
-        else:
+        ret = self.load(json_file_path)
+        if not ret:
             self._log("ERROR", "Reload failed: Could not load new JSON data.")
             # Keep the old parsed data or reset? Resetting might be safer.
-            JSONData.__init__(self, export_header=HeaderDataClass(), base_info=BaseInfoDataClass(), settings=SettingDataClass(),
-                              main_numbers_list=[], sellers=SellerListDataClass())
-            return False
+            self._reset_json_data()
+        return ret
 
     def get_seller_as_list(self) -> List[SellerDataClass]:
         """ Returns the list of seller data objects. """
@@ -148,43 +177,79 @@ class BaseData(JsonHandler, JSONData):
     def get_settings(self):
         return getattr(self, 'settings', SettingDataClass())
 
-    def verify_data(self):
-        """ Performs a basic check comparing the number of sellers and main number lists. """
-        self._log("INFO", "Prüfe Datenbank:")
-        # time.sleep(1) # Reduced sleep time, logging provides separation
+    def validate(self) -> ValidationReport:
+        """
+        Validate sellers and article lists (see :class:`ValidationEngine`).
 
-        # Handle potential AttributeError if initialization failed badly
-        try:
-            seller_quantity = len(self.get_seller_as_list())
-            article_list_quantity = len(self.get_main_number_as_list())
-            status = ">> Datenbank OK" if seller_quantity == article_list_quantity else ">> Datenbank FEHLER: Anzahl Verkäufer und Artikellisten stimmt nicht überein!"
-            mismatch = "" if seller_quantity == article_list_quantity else f" (Differenz: {abs(seller_quantity - article_list_quantity)})"
-
-            log_message = ("========================\n" +
-                           f"         >> Anzahl Verkäufer: {seller_quantity}\n" +
-                           f"         >> Anzahl Artikel Listen: {article_list_quantity}{mismatch}\n" +
-                           f"         {status}\n" +
-                           "      ========================")
-            # Log INFO if OK, WARNING if mismatch
-            log_level = "INFO" if seller_quantity == article_list_quantity else "WARNING"
-            self._log(log_level, log_message)
+        The report is cached until the data changes, so repeated calls (UI,
+        generators) do not walk the market again.
 
+        Returns:
+            ValidationReport: The report for the current data.
+        """
+        if self._validation is None or self._validation[0] != self._data_version:
+            engine = ValidationEngine(logger=self.logger)
+            report = engine.validate(self.get_main_number_as_list(), self.get_seller_as_list())
+            self._validation = (self._data_version, report)
+        return self._validation[1]
+
+    def verify_data(self) -> Optional[ValidationReport]:
+        """ Validates the data and logs a summary of the report. """
+        self._log("INFO", "Prüfe Datenbank:")
+        try:
+            report = self.validate()
         except AttributeError as e:
             self._log("ERROR", f"Fehler bei Datenüberprüfung: Attribute nicht initialisiert. {e}")
+            return None
         except Exception as e:
             self._log("ERROR", f"Unerwarteter Fehler bei Datenüberprüfung: {e}")
-
-        # time.sleep(1) # Reduced sleep time
-
-    def load(self, path_or_url: str) -> bool:
+            return None
+
+        status = ">> Datenbank OK" if report.ok else ">> Datenbank FEHLER: siehe Validierungsbericht!"
+        counts = report.counts()
+        log_message = ("========================\n" +
+                       f"         >> Anzahl Verkäufer: {report.seller_count}\n" +
+                       f"         >> Anzahl Artikel Listen: {len(report.valid_articles)}\n" +
+                       f"         >> Verkäufer ohne Liste: {counts.get('SELLER_WITHOUT_TABLE', 0)}, "
+                       f"Listen ohne Verkäufer: {counts.get('ORPHAN_TABLE', 0)}\n" +
+                       f"         {status}\n" +
+                       "      ========================")
+        self._log("INFO" if report.ok and not report.issues else "WARNING", log_message)
+        return report
+
+    def load(self, path_or_url: str, streaming: bool = True) -> bool:
         """
         Load JSON data from a file or URL and parse it into data classes.
 
+        Files are decoded table by table by default: each top-level object is
+        converted into its data class right away and the raw JSON is not kept
+        in ``self.json_data``. URLs are downloaded into the HTTP cache first
+        (see :meth:`JsonHandler.download_url`). ``streaming=False`` uses the
+        classic load-then-parse path.
+
         Args:
             path_or_url (str): Path to the JSON file or URL.
+            streaming (bool): Decode the file incrementally.
         """
         ret: bool = False
         self._log("INFO", f"Loading JSON data from {path_or_url}...")
+        parsed = urlparse(str(path_or_url))
+        if streaming and parsed.scheme and parsed.netloc:
+            # Remote exports are streamed to the HTTP cache first, then decoded from disk
+            self.json_data = None
+            local_file = self.download_url(str(path_or_url))
+            if local_file is None:
+                return False
+            ret = self._parse_json_items(self.iter_local_items(str(local_file)))
+            self.set_path_or_url(str(path_or_url))
+            return ret
+        if streaming:
+            self.json_data = None
+            if not Path(path_or_url).is_file():
+                self._log_error("load", f"JSON file not found: {path_or_url}")
+                return False
+            return self._parse_json_items(self.iter_local_items(str(path_or_url)))
+
         ret = super().load(path_or_url)
         if ret:
             ret = self._parse_json_data()
@@ -0,0 +1,132 @@
+"""Append-only on-disk journal of DataManager edits."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+
+from log import CustomLogger
+from .base import Base
+
+
+class ChangeJournal(Base):
+    """
+    Persist edits as JSON lines next to the export they apply to.
+
+    Every :meth:`append` writes one line and syncs it to disk, so an edit is
+    durable without rewriting the export. On load the records are replayed on
+    top of the export (see :meth:`DataManager.open_journal`); a save folds them
+    into the export and :meth:`reset` empties the journal again.
+
+    A line that was only partially written (e.g. power loss during an append)
+    is dropped when reading, together with everything after it.
+    """
+
+    SUFFIX = ".journal"
+    COMPACT_THRESHOLD: int = 4 << 20  # bytes; DataManager compacts beyond this size
+
+    def __init__(self, journal_path: Union[str, Path], sync: bool = True,
+                 logger: Optional[CustomLogger] = None) -> None:
+        """
+        Args:
+            journal_path (Union[str, Path]): Location of the journal file.
+            sync (bool): Sync every append to disk (``fdatasync``).
+            logger (Optional[CustomLogger]): Optional logger.
+        """
+        Base.__init__(self, logger)
+        self._path = Path(journal_path)
+        self._sync = sync
+        self._fh = None
+        self._size = self._path.stat().st_size if self._path.is_file() else 0
+
+    @classmethod
+    def for_export(cls, export_path: Union[str, Path], sync: bool = True,
+                   logger: Optional[CustomLogger] = None) -> "ChangeJournal":
+        """Return the journal that belongs to ``export_path`` (``<export>.journal``)."""
+        export = Path(export_path)
+        return cls(export.with_name(export.name + cls.SUFFIX), sync, logger)
+
+    @property
+    def path(self) -> Path:
+        """Path of the journal file."""
+        return self._path
+
+    @property
+    def sync(self) -> bool:
+        """Whether appends are synced to disk."""
+        return self._sync
+
+    @property
+    def size(self) -> int:
+        """Current size of the journal in bytes."""
+        return self._size
+
+    def needs_compaction(self) -> bool:
+        """Return ``True`` once the journal grew beyond :attr:`COMPACT_THRESHOLD`."""
+        return self._size > self.COMPACT_THRESHOLD
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+    def append(self, record: Dict[str, Any]) -> None:
+        """
+        Append ``record`` as one JSON line and sync it to disk.
+
+        Raises:
+            OSError: If the journal cannot be written.
+        """
+        line = (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+        if self._fh is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = open(self._path, "ab", buffering=0)
+        self._fh.write(line)
+        if self._sync:
+            # fdatasync skips the metadata update where the platform supports it
+            getattr(os, "fdatasync", os.fsync)(self._fh.fileno())
+        self._size += len(line)
+
+    def reset(self) -> None:
+        """Empty the journal after its records were folded into the export."""
+        self.close()
+        try:
+            self._path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as err:
+            self._log("WARNING", f"Journal {self._path} konnte nicht gelöscht werden: {err}")
+        self._size = 0
+
+    def close(self) -> None:
+        """Close the file handle (the next append reopens it)."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the journaled records in write order.
+
+        A damaged tail is cut off so later appends follow the last good record.
+        """
+        if not self._path.is_file():
+            return
+        good = 0
+        with open(self._path, "rb") as fh:
+            for number, raw in enumerate(fh, start=1):
+                try:
+                    if not raw.endswith(b"\n"):
+                        raise ValueError("unvollständige Zeile")
+                    record = json.loads(raw)
+                except ValueError as err:
+                    self._log("WARNING", f"Journal {self._path.name}: Zeile {number} verworfen ({err}).")
+                    break
+                good += len(raw)
+                if isinstance(record, dict):
+                    yield record
+        if good < self._path.stat().st_size:
+            self.close()
+            os.truncate(self._path, good)
+            self._size = good
@@ -0,0 +1,226 @@
+"""Indexed, size-bounded change log of DataManager edits."""
+
+import json
+import tempfile
+import uuid
+from collections import deque
+from dataclasses import asdict
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Set, Tuple
+
+from log import CustomLogger
+from objects import ChangeLogEntry
+from .base import Base
+
+
+class ChangeLog(Base):
+    """
+    Ordered change log with O(1) access by entry id.
+
+    Repeated edits of one target collapse into a single entry: the new entry
+    replaces the previous one of its target and inherits the older
+    ``old_value``, so reverting it restores the state before the first edit.
+    Entries only collapse while no other edit of the same scope came in
+    between (scope = the ``stnr`` table for table and article targets,
+    otherwise the target itself), which keeps reverting in reverse order
+    correct. Grouped entries (action :attr:`GROUP_ACTION`, written by
+    ``DataManager.batch``) never collapse and count as an edit of every
+    scope their changes touch.
+
+    At most :attr:`MAX_IN_MEMORY` ``old_value`` dicts are kept in memory;
+    older ones are spilled to an anonymous temporary file and read back on
+    demand (see :meth:`old_value`).
+
+    Large "before" states are not copied into ``old_value`` at all: the
+    caller hands the replaced object itself to :meth:`keep_snapshot` (copy on
+    write, e.g. the previous article list of a table) and stores the returned
+    reference. Snapshots live in memory until they are restored, their entry
+    collapses or the log is cleared. For the change journal,
+    :meth:`journal_entry` adds the snapshot encoded by the ``encode``
+    function given to :meth:`keep_snapshot` under ``"data"``, so the state
+    can still be restored after a restart.
+    """
+
+    MAX_IN_MEMORY: int = 2000
+    GROUP_ACTION = "BATCH"  # old_value = {"changes": [{"action", "target", "old_value"}, ...]}
+
+    def __init__(self, max_in_memory: Optional[int] = None, logger: Optional[CustomLogger] = None) -> None:
+        """
+        Args:
+            max_in_memory (Optional[int]): Number of ``old_value`` dicts kept in memory
+                (defaults to :attr:`MAX_IN_MEMORY`).
+            logger (Optional[CustomLogger]): Optional logger.
+        """
+        Base.__init__(self, logger)
+        self._max_in_memory = self.MAX_IN_MEMORY if max_in_memory is None else max_in_memory
+        self._entries: Dict[str, ChangeLogEntry] = {}
+        self._head_by_target: Dict[str, str] = {}  # target -> id of its latest entry
+        self._last_by_scope: Dict[str, str] = {}   # scope -> id of its latest entry
+        self._resident: Deque[str] = deque()       # ids whose old_value is in memory, oldest first
+        self._spilled: Dict[str, Tuple[int, int]] = {}  # id -> (offset, length) in the spill file
+        self._spill_file = None
+        self._snapshots: Dict[str, Any] = {}  # token -> object kept for undo
+        self._encoders: Dict[str, Callable[[Any], Any]] = {}  # token -> JSON encoder for the journal
+
+    @staticmethod
+    def _scope(target: str) -> str:
+        # "stnr12:3" and "stnr12" share a scope: a table edit overlaps its articles
+        return target.split(":", 1)[0] if target.startswith("stnr") else target
+
+    def _scopes(self, entry: ChangeLogEntry) -> Set[str]:
+        scopes = {self._scope(entry.target)}
+        if entry.action == self.GROUP_ACTION and entry.old_value:
+            scopes.update(self._scope(change["target"]) for change in entry.old_value.get("changes", []))
+        return scopes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[ChangeLogEntry]:
+        return iter(list(self._entries.values()))
+
+    def __reversed__(self) -> Iterator[ChangeLogEntry]:
+        return reversed(list(self._entries.values()))
+
+    def get(self, entry_id: str) -> Optional[ChangeLogEntry]:
+        """Return the entry with ``entry_id`` or ``None``."""
+        return self._entries.get(entry_id)
+
+    @property
+    def spilled_count(self) -> int:
+        """Number of entries whose ``old_value`` currently lives on disk."""
+        return len(self._spilled)
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+    def append(self, entry: ChangeLogEntry) -> ChangeLogEntry:
+        """Add ``entry``, collapsing it with the previous entry of its target where possible."""
+        target, scope = entry.target, self._scope(entry.target)
+        previous_id = self._head_by_target.get(target)
+        if (previous_id is not None and entry.action != self.GROUP_ACTION
+                and self._last_by_scope.get(scope) == previous_id):
+            previous = self._entries.pop(previous_id)
+            self.release_snapshot(entry.old_value)  # superseded by the older state
+            entry.old_value = self._load(previous)
+            self._spilled.pop(previous_id, None)
+        self._entries[entry.id] = entry
+        self._head_by_target[target] = entry.id
+        for touched in self._scopes(entry):
+            self._last_by_scope[touched] = entry.id
+        if entry.old_value is not None:
+            self._resident.append(entry.id)
+            self._spill_overflow()
+        return entry
+
+    def clear(self) -> None:
+        """Remove all entries and drop the spill file."""
+        self._entries.clear()
+        self._head_by_target.clear()
+        self._last_by_scope.clear()
+        self._resident.clear()
+        self._spilled.clear()
+        self._snapshots.clear()
+        self._encoders.clear()
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+    def keep_snapshot(self, obj: Any, encode: Optional[Callable[[Any], Any]] = None) -> dict:
+        """
+        Keep *obj* for undo and return the ``old_value`` that references it.
+
+        Args:
+            obj (Any): Replaced object; must not be modified afterwards.
+            encode (Optional[Callable[[Any], Any]]): Converts *obj* into JSON data for the journal
+                (see :meth:`journal_entry`). Without it the snapshot is lost on restart.
+
+        Returns:
+            dict: ``{"snapshot": token}``.
+        """
+        token = uuid.uuid4().hex
+        self._snapshots[token] = obj
+        if encode is not None:
+            self._encoders[token] = encode
+        return {"snapshot": token}
+
+    def take_snapshot(self, old_value: Optional[dict]) -> Optional[Any]:
+        """Return and release the object referenced by *old_value* (``None`` if unknown, e.g. after a restart)."""
+        if not old_value:
+            return None
+        token = old_value.get("snapshot", "")
+        self._encoders.pop(token, None)
+        return self._snapshots.pop(token, None)
+
+    def release_snapshot(self, old_value: Optional[dict]) -> None:
+        """Drop the object referenced by *old_value* (no-op for plain values)."""
+        self.take_snapshot(old_value)
+
+    def _journal_value(self, old_value: Optional[dict]) -> Optional[dict]:
+        token = old_value.get("snapshot") if old_value else None
+        encode = self._encoders.get(token) if token else None
+        if encode is None:
+            return old_value
+        return {**old_value, "data": encode(self._snapshots[token])}
+
+    def journal_entry(self, entry: ChangeLogEntry) -> dict:
+        """Return ``entry`` as dictionary for the change journal, with its snapshots encoded under ``"data"``."""
+        record = asdict(entry)
+        if entry.action == self.GROUP_ACTION and entry.old_value:
+            record["old_value"] = {**entry.old_value, "changes": [
+                {**change, "old_value": self._journal_value(change["old_value"])}
+                for change in entry.old_value.get("changes", [])]}
+        else:
+            record["old_value"] = self._journal_value(entry.old_value)
+        return record
+
+    # ------------------------------------------------------------------
+    # Old values
+    # ------------------------------------------------------------------
+    def old_value(self, entry: ChangeLogEntry) -> Optional[dict]:
+        """Return the ``old_value`` of ``entry``, reading it back from disk if it was spilled."""
+        return self._load(entry)
+
+    def _load(self, entry: ChangeLogEntry) -> Optional[dict]:
+        location = self._spilled.get(entry.id)
+        if location is None:
+            return entry.old_value
+        offset, length = location
+        self._spill_file.seek(offset)
+        return json.loads(self._spill_file.read(length).decode("utf-8"))
+
+    def _spill_overflow(self) -> None:
+        while len(self._resident) > self._max_in_memory:
+            entry = self._entries.get(self._resident.popleft())
+            if entry is None or entry.old_value is None:
+                continue  # collapsed into a newer entry meanwhile
+            try:
+                self._spill(entry)
+            except OSError as e:
+                self._log("WARNING", f"Änderungsprotokoll konnte nicht ausgelagert werden: {e}")
+                return
+
+    def _spill(self, entry: ChangeLogEntry) -> None:
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile(prefix="changelog-")
+        data = json.dumps(entry.old_value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self._spill_file.seek(0, 2)
+        offset = self._spill_file.tell()
+        self._spill_file.write(data)
+        self._spilled[entry.id] = (offset, len(data))
+        entry.old_value = None
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+    def as_dicts(self) -> List[dict]:
+        """Return all entries as dictionaries (spilled old values included)."""
+        result = []
+        for entry in self._entries.values():
+            record = asdict(entry)
+            if entry.id in self._spilled:
+                record["old_value"] = self._load(entry)
+            result.append(record)
+        return result
@@ -1,22 +1,59 @@
+import csv
+import json
+import os
 import sys
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional
-from copy import deepcopy
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urlparse
 import uuid
-from dataclasses import asdict, dataclass, fields
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime
 from PySide6.QtCore import QObject, Signal
 
 
 sys.path.insert(0, Path(__file__).parent.parent.parent.parent.__str__())  # NOQA: E402 pylint: disable=[C0413]
+from .article_index import ArticleIndex
 from .base_data import BaseData
+from .change_journal import ChangeJournal
+from .change_log import ChangeLog
+from .market_summary import MarketSummary, MarketSummarySnapshot
+from .search_index import SearchHit, SearchIndex
 from objects import (
+    CLEARED_PRICE,
     MainNumberDataClass,
     SellerDataClass,
     ArticleDataClass,
+    TableStats,
     ChangeLogEntry,
+    JSONData,
     SettingsContentDataClass)
 
+_EMPTY_USER_KEY = "<LEER>"
+_SELLER_FIELDS = ("vorname", "nachname", "telefon", "email", "passwort")
+_ARTICLE_FIELDS = ("beschreibung", "groesse", "preis")
+
+
+@dataclass
+class _Batch:
+    """State of an open :meth:`DataManager.batch` transaction."""
+    timestamp: str
+    description: str
+    # (action, target, old_value) in edit order, first edit per target only
+    changes: List[Tuple[str, str, Optional[dict]]] = field(default_factory=list)
+    targets: Set[str] = field(default_factory=set)
+    dirty: Set[str] = field(default_factory=set)
+    # (kind, target) -> changed object, emitted once at commit
+    notifications: Dict[Tuple[str, str], Any] = field(default_factory=dict)
+
+    def record(self, action: str, target: str, old_value: Optional[dict]) -> bool:
+        """Record an edit; returns ``False`` if the target already has an older state in this batch."""
+        if target in self.targets:
+            return False
+        self.targets.add(target)
+        self.changes.append((action, target, old_value))
+        return True
+
 
 class DataManager(QObject, BaseData):
     """
@@ -27,6 +64,11 @@ class DataManager(QObject, BaseData):
     """
     status_info = Signal(str, str)
     data_loaded = Signal(object)  # Signal to notify when data is loaded
+    # Fine-grained edit notification: kind ("article", "table", "seller", "settings"),
+    # target ("stnr1:5", "stnr1", seller id, setting key or "") and the changed object.
+    # A batch (see batch()) emits once with kind "batch", target "" and the list of
+    # (kind, target, object) edits.
+    data_changed = Signal(str, str, object)
 
     def __init__(self, json_file_path: str = None, error_handler=None) -> None:
         """
@@ -38,10 +80,28 @@ class DataManager(QObject, BaseData):
         """
         # BaseData loads and converts JSON data into the corresponding dataclasses.
         QObject.__init__(self)  # Initialize QObject first
-        BaseData.__init__(self, json_file_path, error_handler)
-
         self._unsaved_changes: bool = False
-        self._change_log: List[ChangeLogEntry] = []
+        self._change_log = ChangeLog()
+        # Serialized export parts by part key (see _export_parts) and parts changed since
+        self._fragment_cache: Dict[str, str] = {}
+        self._dirty_parts: Set[str] = set()
+        self._saved_files: Dict[Path, Tuple[int, int]] = {}  # file -> (mtime_ns, size) after our last save
+        self._journal: Optional[ChangeJournal] = None
+        self._article_index: Optional[ArticleIndex] = None  # built on first use
+        self._search_index: Optional[SearchIndex] = None  # built on first search
+        self._market_summary: Optional[MarketSummary] = None  # built on first use
+        # Keyed lookups, built on first use and dropped when new data is parsed
+        self._table_by_name: Optional[Dict[str, MainNumberDataClass]] = None
+        self._seller_by_id: Optional[Dict[str, SellerDataClass]] = None
+        self._aggregated_users: Optional[Dict[str, Dict]] = None  # see get_aggregated_users
+        self._user_key_by_id: Dict[str, str] = {}
+        self._seller_position: Dict[str, int] = {}
+        self._articles_by_table: Dict[str, Dict[str, ArticleDataClass]] = {}
+        self._table_versions: Dict[str, int] = {}  # see table_version
+        self._table_stats: Dict[str, TableStats] = {}  # per stnr table, dropped when the table changes
+        self._replaying: bool = False
+        self._batch: Optional[_Batch] = None  # open batch() transaction
+        BaseData.__init__(self, json_file_path, error_handler)
 
     @staticmethod
     def seller_is_empty(seller: SellerDataClass) -> bool:
@@ -107,35 +167,62 @@ class DataManager(QObject, BaseData):
         Returns:
             Dict[str, MainNumberDataClass]: Dictionary with table name as key and instance as value.
         """
-        main_number_tables: Dict[str, MainNumberDataClass] = {}
-        for main in self.main_numbers_list:
-            if main.name.startswith("stnr"):
-                main_number_tables[main.name] = main
-        return main_number_tables
+        if self._table_by_name is None:
+            main_number_tables: Dict[str, MainNumberDataClass] = {}
+            for main in self.main_numbers_list:
+                if main.name.startswith("stnr"):
+                    main_number_tables[main.name] = main
+            self._table_by_name = main_number_tables
+        return self._table_by_name
+
+    def table_version(self, table_name: str) -> int:
+        """Return a number that changes whenever the articles of ``table_name`` change (0 = unchanged since load)."""
+        return self._table_versions.get(table_name, 0)
+
+    def table_prices(self, table_name: str) -> Optional[Tuple[List[int], List[int]]]:
+        """Return cents and price status per article of ``table_name`` from the article index (see ``ArticleIndex.table_prices``)."""
+        return self.get_article_index().table_prices(table_name)
+
+    def get_seller(self, seller_id: str) -> Optional[SellerDataClass]:
+        """Return the seller with ``seller_id`` or ``None`` (O(1) after the first call)."""
+        if self._seller_by_id is None:
+            self._seller_by_id = {}
+            for seller in self.get_seller_as_list():
+                self._seller_by_id.setdefault(seller.id, seller)
+        return self._seller_by_id.get(seller_id)
+
+    def _find_article(self, table: MainNumberDataClass, artikelnummer: str) -> Optional[ArticleDataClass]:
+        """Return the article ``artikelnummer`` of ``table`` (first one on duplicates) or ``None``."""
+        by_number = self._articles_by_table.get(table.name)
+        if by_number is None:
+            by_number = {}
+            for article in table.data:
+                by_number.setdefault(article.artikelnummer, article)
+            self._articles_by_table[table.name] = by_number
+        return by_number.get(artikelnummer)
+
+    def _aggregate_key(self, seller: SellerDataClass) -> str:
+        """Group key of ``seller`` in :meth:`get_aggregated_users` (email, or ``<LEER>`` for empty sellers)."""
+        return _EMPTY_USER_KEY if self.seller_is_empty(seller) else seller.email
 
     def _aggregate_sellers(self) -> Dict[str, Dict]:
         """
         Groups sellers based on their email address.
 
+        Also fills the inverted index ``seller id -> group key`` and the
+        position of every seller id used to keep the groups in list order.
+
         Returns:
             Dict[str, Dict]: Dictionary with email as key and a dict containing "info", "ids", and "stamms" as value.
         """
         users: Dict[str, Dict] = {}
-        empty_key = "<LEER>"
-
-        def is_empty(s: SellerDataClass) -> bool:
-            return not any(
-                getattr(s, attr).strip() for attr in [
-                    "vorname",
-                    "nachname",
-                    "telefon",
-                    "email",
-                    "passwort",
-                ]
-            )
+        self._user_key_by_id = {}
+        self._seller_position = {}
 
-        for seller in self.get_seller_as_list():
-            key = seller.email if not is_empty(seller) else empty_key
+        for position, seller in enumerate(self.get_seller_as_list()):
+            key = self._aggregate_key(seller)
+            self._user_key_by_id.setdefault(seller.id, key)
+            self._seller_position.setdefault(seller.id, position)
             if key not in users:
                 users[key] = {"info": seller, "ids": [seller.id], "stamms": []}
             else:
@@ -153,26 +240,22 @@ class DataManager(QObject, BaseData):
             Dict[str, Dict]: Sellers dictionary with assigned stnr tables in "stamms".
         """
         sellers = self._aggregate_sellers()
-        empty_key = "<LEER>"
         for main in self.main_numbers_list:
             if not main.name.startswith("stnr"):
                 continue
             stnr_num = main.name[4:]  # e.g. "1" from "stnr1"
-            assigned = False
-            for user in sellers.values():
-                if stnr_num in user["ids"]:
-                    user["stamms"].append(main)
-                    assigned = True
-                    break
-            if not assigned:
-                if empty_key not in sellers:
-                    sellers[empty_key] = {
+            key = self._user_key_by_id.get(stnr_num)
+            if key is not None:
+                sellers[key]["stamms"].append(main)
+            else:
+                if _EMPTY_USER_KEY not in sellers:
+                    sellers[_EMPTY_USER_KEY] = {
                         "info": SellerDataClass(),
                         "ids": [],
                         "stamms": [],
                     }
-                sellers[empty_key]["ids"].append(stnr_num)
-                sellers[empty_key]["stamms"].append(main)
+                sellers[_EMPTY_USER_KEY]["ids"].append(stnr_num)
+                sellers[_EMPTY_USER_KEY]["stamms"].append(main)
 
         sellers = self.__move_empty_to_end(sellers)
         return sellers
@@ -181,17 +264,69 @@ class DataManager(QObject, BaseData):
         """
         Returns the aggregated user information.
 
+        The structure is built once per load and kept up to date on seller
+        edits (see :meth:`_regroup_seller`); it is shared, do not modify it.
+
         Returns:
             Dict[str, Dict]: Aggregated users grouped by email with "info", "ids", and "stamms".
         """
-        sellers = self._assign_main_numbers_to_sellers()
-        sellers = self.__move_empty_to_end(sellers)
-        return sellers
+        if self._aggregated_users is None:
+            self._aggregated_users = self._assign_main_numbers_to_sellers()
+        return self._aggregated_users
+
+    def _regroup_seller(self, seller: SellerDataClass) -> None:
+        """
+        Update the aggregated users after ``seller`` was edited.
+
+        Only the group the seller leaves and the group it joins are touched.
+        Field edits that keep the group key need no work at all, since the
+        groups reference the seller objects.
+        """
+        users = self._aggregated_users
+        if users is None:
+            return
+        old_key = self._user_key_by_id.get(seller.id)
+        new_key = self._aggregate_key(seller)
+        if old_key == new_key:
+            return
+        table = self.get_main_number_tables().get(f"stnr{seller.id}")
+
+        def position(seller_id: str) -> int:
+            # Ids of tables without seller keep their place behind the sellers
+            return self._seller_position.get(seller_id, len(self._seller_position))
+
+        old = users.get(old_key)
+        if old is not None:
+            old["ids"] = [i for i in old["ids"] if i != seller.id]
+            old["stamms"] = [t for t in old["stamms"] if t is not table]
+            if not old["ids"]:
+                del users[old_key]
+            elif old["info"] is seller:
+                old["info"] = self.get_seller(old["ids"][0]) or SellerDataClass()
+
+        new = users.get(new_key)
+        if new is None:
+            users[new_key] = {"info": seller, "ids": [seller.id], "stamms": [table] if table else []}
+            # Keep the groups in seller order (empty group last) as a full rebuild would
+            groups = sorted(users.items(), key=lambda item: (
+                item[0] == _EMPTY_USER_KEY, min((position(i) for i in item[1]["ids"]), default=0)))
+            users.clear()
+            users.update(groups)
+        else:
+            new["ids"].append(seller.id)
+            new["ids"].sort(key=position)
+            new["info"] = self.get_seller(new["ids"][0]) or new["info"]
+            if table is not None:
+                new["stamms"].append(table)
+                new["stamms"].sort(key=lambda t: position(t.name[4:]))
+        self._user_key_by_id[seller.id] = new_key
 
     def get_main_number_tables(self) -> Dict[str, MainNumberDataClass]:
         """
         Returns stnr tables as a dictionary.
 
+        The dictionary is built once per load and shared; do not modify it.
+
         Returns:
             Dict[str, MainNumberDataClass]: Dictionary with table name (e.g., "stnr1") as key.
         """
@@ -206,52 +341,121 @@ class DataManager(QObject, BaseData):
         """
         return [self.convert_seller_to_dict(seller) for seller in self.get_seller_as_list()]
 
+    def get_article_index(self) -> ArticleIndex:
+        """
+        Return the columnar index over all stnr articles.
+
+        It is built on first use after loading and kept up to date by the
+        edit methods, so market-wide statistics are vectorized reductions.
+        """
+        if self._article_index is None:
+            self._article_index = ArticleIndex(self.main_numbers_list)
+        return self._article_index
+
+    def get_search_index(self) -> SearchIndex:
+        """
+        Return the full-text index over article and seller fields.
+
+        Built on first use after loading; every edit reported through
+        :meth:`_notify_change` re-indexes only the changed article, table or seller.
+        """
+        if self._search_index is None:
+            self._search_index = SearchIndex(self.main_numbers_list, self.get_seller_as_list())
+        return self._search_index
+
+    def get_market_summary(self) -> MarketSummarySnapshot:
+        """
+        Return the market-wide figures for the statistics dashboard.
+
+        The underlying :class:`MarketSummary` is built once after loading and
+        then updated by delta from :meth:`_mark_dirty` and
+        :meth:`_notify_change`, so this is a cached read.
+        """
+        if self._market_summary is None:
+            self._market_summary = MarketSummary(self.get_article_index(), self.get_seller_as_list(),
+                                                 self._max_main_numbers())
+        return self._market_summary.snapshot()
+
+    def _max_main_numbers(self) -> int:
+        settings = self.get_settings()
+        if not getattr(settings, "data", None):
+            return 0
+        raw = str(settings.data[0].max_stammnummern)
+        return int(raw) if raw.isdigit() else 0
+
+    def search(self, query: str, limit: Optional[int] = 100) -> List[SearchHit]:
+        """
+        Find articles and sellers whose words start with every word of ``query``.
+
+        Matching is case-insensitive on article description and size and on
+        seller name, email and phone number.
+
+        Args:
+            query (str): Search text, e.g. ``"jacke 128"``.
+            limit (Optional[int]): Maximum number of hits (``None`` for all).
+
+        Returns:
+            List[SearchHit]: Sellers first, then articles in table order.
+        """
+        hits: List[SearchHit] = []
+        for key in self.get_search_index().search(query, limit):
+            name, _, number = key.partition(":")
+            if name == "verkaeufer":
+                seller = self.get_seller(number)
+                if seller is not None:
+                    label = f"{seller.vorname} {seller.nachname}".strip() or "<Leer>"
+                    hits.append(SearchHit(key, "seller", f"{label} <{seller.email}> (stnr{seller.id})", seller))
+                continue
+            table = self.get_main_number_tables().get(name)
+            article = self._find_article(table, number) if table else None
+            if article is not None:
+                label = f"{name}/{number}: {article.beschreibung} {article.groesse}".rstrip()
+                hits.append(SearchHit(key, "article", f"{label} – {article.preis}", article))
+        return hits
+
+    def get_table_stats(self, stnr_id: str) -> TableStats:
+        """
+        Return complete / partial / open counts and the price sum of a stnr table.
+
+        The record is kept per table until one of its articles changes, so
+        repeated calls (user details, statistics) cost a dict lookup.
+
+        Args:
+            stnr_id (str): Table id (``"1"``) or name (``"stnr1"``).
+
+        Returns:
+            TableStats: Figures of the table; all zero for an unknown table.
+        """
+        key = stnr_id if stnr_id.startswith("stnr") else f"stnr{stnr_id}"
+        stats = self._table_stats.get(key)
+        if stats is None:
+            index = self.get_article_index()
+            counts = index.status_counts(key)
+            stats = TableStats(counts["vollstaendig"], counts["teilweise"], counts["offen"],
+                               index.price_sum_cents(key))
+            self._table_stats[key] = stats
+        return stats
+
     def _article_status_counts(self, stnr_id: str) -> Dict[str, int]:
         """Return counts for complete, partial and open articles for ``stnr_id``."""
-        tables = self.get_main_number_tables()
-        key = stnr_id if stnr_id.startswith("stnr") else f"stnr{stnr_id}"
-        table = tables.get(key)
-        counts = {"vollstaendig": 0, "teilweise": 0, "offen": 0}
-        if not table:
-            return counts
-        for article in getattr(table, "data", []):
-            desc = bool(getattr(article, "beschreibung", "").strip())
-            preis_raw = getattr(article, "preis", None)
-            preis = preis_raw not in (None, "", "None")
-            if desc and preis:
-                counts["vollstaendig"] += 1
-            elif desc or preis:
-                counts["teilweise"] += 1
-            else:
-                counts["offen"] += 1
-        return counts
+        stats = self.get_table_stats(stnr_id)
+        return {"vollstaendig": stats.complete, "teilweise": stats.partial, "offen": stats.open}
 
     def get_article_count(self, stnr_id: str) -> int:
         """Return the number of *complete* articles for the given ``stnr`` table."""
-        return self._article_status_counts(stnr_id)["vollstaendig"]
+        return self.get_table_stats(stnr_id).complete
 
     def get_partial_article_count(self, stnr_id: str) -> int:
         """Return the number of partially filled articles for ``stnr_id``."""
-        return self._article_status_counts(stnr_id)["teilweise"]
+        return self.get_table_stats(stnr_id).partial
 
     def get_open_article_count(self, stnr_id: str) -> int:
         """Return the number of open (empty) articles for ``stnr_id``."""
-        return self._article_status_counts(stnr_id)["offen"]
+        return self.get_table_stats(stnr_id).open
 
     def get_article_sum(self, stnr_id: str) -> float:
         """Return the total price of all articles for the given ``stnr`` table."""
-        tables = self.get_main_number_tables()
-        key = stnr_id if stnr_id.startswith("stnr") else f"stnr{stnr_id}"
-        table = tables.get(key)
-        if not table:
-            return 0.0
-        total = 0.0
-        for article in getattr(table, "data", []):
-            try:
-                total += float(article.preis)
-            except (ValueError, TypeError):
-                continue
-        return round(total, 2)
+        return self.get_table_stats(stnr_id).price_sum
 
     def get_aggregated_users_data(self) -> List[dict]:
         """
@@ -264,7 +468,8 @@ class DataManager(QObject, BaseData):
         result = [self.convert_aggregated_user(email, data) for email, data in aggregated_dict.items()]
         return result
 
-    def _log_change(self, action: str, target: str, description: str, old_value: Optional[dict] = None):
+    def _log_change(self, action: str, target: str, description: str, old_value: Optional[dict] = None,
+                    redo: Optional[dict] = None):
         """
         Logs a change action for audit purposes.
 
@@ -272,17 +477,29 @@ class DataManager(QObject, BaseData):
             action (str): The type of action performed.
             target (str): The target of the action.
             description (str): A description of the change.
+            old_value (Optional[dict]): Values before the change (used by reset_change).
+            redo (Optional[dict]): New state written to the change journal (see _apply_redo).
         """
+        if self._batch is not None:
+            # Logged as one BATCH entry when the transaction is committed
+            if not self._batch.record(action, target, old_value):
+                self._change_log.release_snapshot(old_value)
+            if redo:
+                self._journal_append({"redo": redo})
+            return
         entry = ChangeLogEntry(
             id=str(uuid.uuid4()),
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            timestamp=self._timestamp(),
             action=action,
             target=target,
             description=description,
             old_value=old_value
         )
+        # Encode snapshots before append() may release them
+        record = {"entry": self._change_log.journal_entry(entry), "redo": redo}
         self._change_log.append(entry)
         self._unsaved_changes = True
+        self._journal_append(record)
 
     def update_article(self, stnr_id: str, artikelnummer: str, beschreibung: str, groesse: str, preis: str) -> Optional[ArticleDataClass]:
         """
@@ -304,29 +521,32 @@ class DataManager(QObject, BaseData):
         table = self.get_main_number_tables().get(f"stnr{stnr_id}")
         if not table:
             raise ValueError(f"Keine Artikelliste für stnr{stnr_id} gefunden.")
-        for article in table.data:
-            if article.artikelnummer == artikelnummer:
-                old_values = (article.beschreibung,
-                              article.groesse, article.preis)
-                article.beschreibung = beschreibung
-                article.groesse = groesse
-                article.preis = preis
-                article.updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                self._log_change(
-                    action="UPDATE",
-                    target=f"stnr{stnr_id}:{artikelnummer}",
-                    description=(
-                        f"Artikel geändert von {old_values} zu ({beschreibung}, {groesse}, {preis})"
-                    ),
-                    old_value={
-                        "beschreibung": old_values[0],
-                        "groesse": old_values[1],
-                        "preis": old_values[2],
-                    },
-                )
-                return article
-        raise ValueError(
-            f"Artikelnummer {artikelnummer} nicht gefunden in stnr{stnr_id}.")
+        article = self._find_article(table, artikelnummer)
+        if article is None:
+            raise ValueError(
+                f"Artikelnummer {artikelnummer} nicht gefunden in stnr{stnr_id}.")
+        old_values = (article.beschreibung,
+                      article.groesse, article.preis)
+        article.beschreibung = beschreibung
+        article.groesse = groesse
+        article.preis = preis
+        article.updated_at = self._timestamp()
+        self._mark_dirty(f"table:{table.name}")
+        self._notify_change("article", f"{table.name}:{artikelnummer}", article)
+        self._log_change(
+            action="UPDATE",
+            target=f"stnr{stnr_id}:{artikelnummer}",
+            description=(
+                f"Artikel geändert von {old_values} zu ({beschreibung}, {groesse}, {preis})"
+            ),
+            old_value={
+                "beschreibung": old_values[0],
+                "groesse": old_values[1],
+                "preis": old_values[2],
+            },
+            redo=self._articles_redo(table, [article]),
+        )
+        return article
 
     def delete_article(self, stnr_id: str, artikelnummer: str):
         """
@@ -339,7 +559,43 @@ class DataManager(QObject, BaseData):
         Returns:
             Optional[ArticleDataClass]: The article after deletion.
         """
-        return self.update_article(stnr_id, artikelnummer, "", "0", "0.00")
+        return self.update_article(stnr_id, artikelnummer, "", "0", CLEARED_PRICE)
+
+    def update_seller(self, seller_id: str, **values: str) -> SellerDataClass:
+        """
+        Updates the contact data of a seller.
+
+        Args:
+            seller_id (str): The ID of the seller.
+            **values (str): New values for ``vorname``, ``nachname``, ``telefon``, ``email`` or ``passwort``.
+
+        Returns:
+            SellerDataClass: The updated seller instance.
+
+        Raises:
+            ValueError: If no seller with the given ID is found or a field is unknown.
+        """
+        seller = self.get_seller(seller_id)
+        if seller is None:
+            raise ValueError(f"Verkäufer mit ID {seller_id} nicht gefunden.")
+        unknown = set(values) - set(_SELLER_FIELDS)
+        if unknown:
+            raise ValueError(f"Unbekannte Verkäuferfelder: {', '.join(sorted(unknown))}.")
+        old_value = {name: getattr(seller, name) for name in _SELLER_FIELDS}
+        for name, value in values.items():
+            setattr(seller, name, value)
+        seller.updated_at = self._timestamp()
+        self._mark_dirty("sellers")
+        self._regroup_seller(seller)
+        self._notify_change("seller", seller.id, seller)
+        self._log_change(
+            action="UPDATE",
+            target=f"verkaeufer:{seller_id}",
+            description=f"Verkäuferdaten geändert: {', '.join(sorted(values))}",
+            old_value=old_value,
+            redo=self._seller_redo(seller),
+        )
+        return seller
 
     def delete_seller(self, seller_id: str):
         """
@@ -354,22 +610,27 @@ class DataManager(QObject, BaseData):
         Raises:
             ValueError: If no seller with the given ID is found.
         """
-        for seller in self.get_seller_as_list():
-            if seller.id == seller_id:
-                old_data = deepcopy(seller)
-                seller.vorname = ""
-                seller.nachname = ""
-                seller.telefon = ""
-                seller.email = ""
-                seller.passwort = ""
-                seller.updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                self._log_change(
-                    action="DELETE",
-                    target=f"verkaeufer:{seller_id}",
-                    description=f"Verkäuferdaten gelöscht: {old_data}",
-                    old_value=asdict(old_data)
-                )
-                return seller
+        seller = self.get_seller(seller_id)
+        if seller is not None:
+            old_data = {name: getattr(seller, name) for name in _SELLER_FIELDS}
+            seller.vorname = ""
+            seller.nachname = ""
+            seller.telefon = ""
+            seller.email = ""
+            seller.passwort = ""
+            seller.updated_at = self._timestamp()
+            self._mark_dirty("sellers")
+            self._regroup_seller(seller)
+            self._notify_change("seller", seller.id, seller)
+            self._log_change(
+                action="DELETE",
+                target=f"verkaeufer:{seller_id}",
+                description=f"Verkäuferdaten gelöscht: {old_data['vorname']} {old_data['nachname']} "
+                            f"<{old_data['email']}>",
+                old_value=old_data,
+                redo=self._seller_redo(seller),
+            )
+            return seller
         raise ValueError(f"Verkäufer mit ID {seller_id} nicht gefunden.")
 
     def delete_article_list(self, stnr_id: str):
@@ -388,17 +649,21 @@ class DataManager(QObject, BaseData):
         table = self.get_main_number_tables().get(f"stnr{stnr_id}")
         if not table:
             raise ValueError(f"Keine Artikelliste für stnr{stnr_id} gefunden.")
-        old_articles = [asdict(article) for article in table.data]
-        for article in table.data:
-            article.beschreibung = ""
-            article.groesse = "0"
-            article.preis = "0.00"
-            article.updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # Copy on write: the current article list stays untouched as undo snapshot
+        previous = table.data
+        timestamp = self._timestamp()
+        table.data = [ArticleDataClass(artikelnummer=article.artikelnummer, groesse="0", preis=CLEARED_PRICE,
+                                       created_at=article.created_at, updated_at=timestamp)
+                      for article in previous]
+        self._articles_by_table.pop(table.name, None)
+        self._mark_dirty(f"table:{table.name}")
+        self._notify_change("table", table.name, table)
         self._log_change(
             action="DELETE",
             target=f"stnr{stnr_id}",
             description="Alle Artikelinhalte gelöscht.",
-            old_value={"articles": old_articles}
+            old_value=self._change_log.keep_snapshot(previous, self._encode_articles),
+            redo=self._articles_redo(table, table.data),
         )
         return table
 
@@ -409,35 +674,98 @@ class DataManager(QObject, BaseData):
         Args:
             seller_id (str): The ID of the seller whose dataset should be deleted.
         """
-        old_seller = next(
-            (deepcopy(s) for s in self.get_seller_as_list() if s.id == seller_id),
-            None,
-        )
-        table = self.get_main_number_tables().get(f"stnr{seller_id}")
-        old_articles = [asdict(a) for a in table.data] if table else []
-        self.delete_seller(seller_id)
-        self.delete_article_list(seller_id)
-        self._log_change(
-            action="DELETE",
-            target=f"dataset:{seller_id}",
-            description="Kompletter Datensatz (Verkäufer + Artikelliste) gelöscht.",
-            old_value={
-                "seller": asdict(old_seller) if old_seller else None,
-                "articles": old_articles,
-            }
-        )
+        # Logged as one change; each delete keeps only its own undo state
+        with self.batch(f"Kompletter Datensatz {seller_id} (Verkäufer + Artikelliste) gelöscht"):
+            self.delete_seller(seller_id)
+            self.delete_article_list(seller_id)
+
+    def apply_patch(self, rows: Iterable[Dict[str, str]], description: str = "Patch") -> int:
+        """
+        Apply a list of edits in one :meth:`batch`.
+
+        Every row has the keys ``kind``, ``target``, ``field`` and ``value``:
+
+        - ``article``: target ``"<stnr>:<artikelnummer>"``, field ``beschreibung``, ``groesse`` or ``preis``
+        - ``seller``: target is the seller id, field one of the contact fields
+        - ``settings``: target is the setting name, field is ignored
+
+        Rows for the same article or seller are merged into one edit. If a row
+        is invalid nothing is applied.
+
+        Args:
+            rows (Iterable[Dict[str, str]]): Patch rows, e.g. from :class:`csv.DictReader`.
+            description (str): Description of the logged change.
+
+        Returns:
+            int: Number of edited articles, sellers and settings.
+
+        Raises:
+            ValueError: If a row has an unknown kind or field or its target does not exist.
+        """
+        articles: Dict[Tuple[str, str], Dict[str, str]] = {}
+        sellers: Dict[str, Dict[str, str]] = {}
+        settings: Dict[str, str] = {}
+        for line, row in enumerate(rows, start=1):
+            kind = (row.get("kind") or "").strip().lower()
+            target = (row.get("target") or "").strip()
+            name = (row.get("field") or "").strip()
+            value = row.get("value") or ""
+            if kind == "article":
+                stnr_id, _, artikelnummer = target.partition(":")
+                if name not in _ARTICLE_FIELDS or not artikelnummer:
+                    raise ValueError(f"Patch Zeile {line}: ungültiger Artikel '{target}' / Feld '{name}'.")
+                articles.setdefault((stnr_id.removeprefix("stnr"), artikelnummer), {})[name] = value
+            elif kind == "seller":
+                if name not in _SELLER_FIELDS:
+                    raise ValueError(f"Patch Zeile {line}: unbekanntes Verkäuferfeld '{name}'.")
+                sellers.setdefault(target, {})[name] = value
+            elif kind == "settings":
+                settings[target] = value
+            else:
+                raise ValueError(f"Patch Zeile {line}: unbekannte Art '{kind}'.")
+
+        with self.batch(description):
+            for (stnr_id, artikelnummer), values in articles.items():
+                table = self.get_main_number_tables().get(f"stnr{stnr_id}")
+                article = self._find_article(table, artikelnummer) if table else None
+                if article is None:
+                    raise ValueError(f"Artikel stnr{stnr_id}:{artikelnummer} nicht gefunden.")
+                self.update_article(stnr_id, artikelnummer,
+                                    values.get("beschreibung", article.beschreibung),
+                                    values.get("groesse", article.groesse),
+                                    values.get("preis", article.preis))
+            for seller_id, values in sellers.items():
+                self.update_seller(seller_id, **values)
+            for key, value in settings.items():
+                if not self.update_setting(key, value):
+                    raise ValueError(f"Unbekannte Einstellung '{key}'.")
+        self._log("INFO", f"Patch angewendet: {len(articles)} Artikel, {len(sellers)} Verkäufer, "
+                          f"{len(settings)} Einstellungen.")
+        return len(articles) + len(sellers) + len(settings)
+
+    def apply_patch_file(self, path: str, delimiter: str = ";") -> int:
+        """
+        Apply a CSV patch file (header ``kind;target;field;value``), see :meth:`apply_patch`.
+
+        Args:
+            path (str): Path of the CSV file (UTF-8, optionally with BOM).
+            delimiter (str): Column separator.
+
+        Returns:
+            int: Number of edited articles, sellers and settings.
+        """
+        with open(path, newline="", encoding="utf-8-sig") as fh:
+            return self.apply_patch(csv.DictReader(fh, delimiter=delimiter), description=f"Patch {Path(path).name}")
 
     def validate_structure(self) -> bool:
         """
         Validates that the structure is consistent by comparing seller IDs with stnr table IDs.
 
         Returns:
-            bool: True if seller IDs match stnr table IDs, False otherwise.
+            bool: True if every seller has a stnr table and vice versa, False otherwise.
         """
-        seller_ids = {seller.id for seller in self.get_seller_as_list()}
-        stnr_ids = {table.name[4:] for table in self.get_main_number_as_list(
-        ) if table.name.startswith("stnr")}
-        return seller_ids == stnr_ids
+        counts = self.validate().counts()
+        return not counts.get("SELLER_WITHOUT_TABLE") and not counts.get("ORPHAN_TABLE")
 
     def has_unsaved_changes(self) -> bool:
         """
@@ -455,7 +783,7 @@ class DataManager(QObject, BaseData):
         Returns:
             List[Dict]: List containing the change log entries.
         """
-        return [asdict(entry) for entry in self._change_log]
+        return self._change_log.as_dicts()
 
     def export_to_json(self) -> List[dict]:
         """
@@ -474,78 +802,513 @@ class DataManager(QObject, BaseData):
         json_data.append(asdict(self.sellers))
         return json_data
 
-    def load(self, path_or_url: str) -> bool:
+    def load(self, path_or_url: str, streaming: bool = True) -> bool:
         """
         Load JSON data from a file or URL and parse it into data classes.
 
         Args:
             path_or_url (str): Path to the JSON file or URL.
+            streaming (bool): Decode the export table by table (see :meth:`BaseData.load`).
         """
-        ret = super().load(path_or_url)
+        ret = super().load(path_or_url, streaming)
         if ret:
             self.data_loaded.emit(self)
         return ret
 
+    def snapshot_state(self) -> JSONData:
+        """
+        Return the parsed data as a plain :class:`JSONData` (e.g. for :class:`MarketSnapshot`).
+
+        Returns:
+            JSONData: Header, base info, settings, stnr tables and sellers.
+        """
+        return JSONData(
+            export_header=self.export_header,
+            base_info=self.base_info,
+            settings=self.settings,
+            main_numbers_list=self.main_numbers_list,
+            sellers=self.sellers,
+        )
+
+    def restore_snapshot_state(self, state: JSONData, path_or_url: str) -> None:
+        """
+        Replace the current data with a previously parsed ``state``.
+
+        This is the counterpart of :meth:`load` for cached data: no JSON is
+        decoded, the change log is cleared and ``data_loaded`` is emitted.
+
+        Args:
+            state (JSONData): Parsed data, usually restored from a snapshot.
+            path_or_url (str): Export the state belongs to (becomes the storage path).
+        """
+        JSONData.__init__(
+            self,
+            export_header=state.export_header,
+            base_info=state.base_info,
+            settings=state.settings,
+            main_numbers_list=state.main_numbers_list,
+            sellers=state.sellers,
+        )
+        self._data_parsed = True
+        self._data_version += 1
+        self._on_data_parsed()
+        self.set_path_or_url(str(path_or_url))
+        self._change_log.clear()
+        self._unsaved_changes = False
+        self.data_loaded.emit(self)
+
+    def save(self, path_or_url: str = "") -> None:
+        """
+        Save the current data to ``path_or_url``.
+
+        Local files are written part by part (see :meth:`save_to_local`), so
+        only tables changed since the last save are serialized again. URLs
+        receive the complete export.
+
+        Args:
+            path_or_url (str): Target path or URL (defaults to the storage path).
+        """
+        if not path_or_url:
+            path_or_url = str(self.get_storage_full_path())
+            self._log("INFO", f"No path or URL provided. Use {path_or_url} to save.")
+        parsed = urlparse(path_or_url)
+        if not (parsed.scheme and parsed.netloc):
+            self._log("INFO", f"Attempting to save JSON data to: {path_or_url}")
+            if self.save_to_local(path_or_url):
+                self.set_path_or_url(path_or_url)
+                if self._journal is not None:
+                    # The journaled edits are part of the export now
+                    self._journal.reset()
+                    self._journal = ChangeJournal.for_export(path_or_url, self._journal.sync)
+            return
+
+        self.json_data = self.export_to_json()
+        try:
+            super().save(path_or_url)
+        finally:
+            self.json_data = None
+
+    def save_to_local(self, json_file_path: str) -> bool:
+        """
+        Stream the export to a local file, re-serializing only dirty parts.
+
+        The output is identical to ``json.dump(export_to_json(), indent=4,
+        ensure_ascii=False)``. It is written to a temporary file next to the
+        target and moved into place, so an interrupted save keeps the old file.
+        The old file is backed up first, unless it is the unchanged result of
+        our last save and no part changed since (then it would be rewritten
+        byte for byte and the backup would only cost a full read).
+
+        Args:
+            json_file_path (str): Target file.
+
+        Returns:
+            bool: True if the file was written.
+        """
+        p = Path(json_file_path)
+        tmp = p.with_name(p.name + ".tmp")
+        try:
+            if p.is_file() and self._content_changed_since_save(p):
+                self._create_backup(p)
+            p.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, 'w', encoding='utf-8') as json_file:
+                json_file.write("[")
+                separator = "\n"
+                for key, part in self._export_parts():
+                    json_file.write(separator)
+                    json_file.write(self._serialize_part(key, part))
+                    separator = ",\n"
+                json_file.write("\n]" if separator != "\n" else "]")
+            os.replace(tmp, p)
+            self._dirty_parts.clear()
+            self._saved_files[p.resolve()] = self._file_stamp(p)
+            self._log("INFO", f"JSON data successfully saved to local file: {p.resolve()}")
+            return True
+        except IOError as e:
+            self._log_error("save_to_local", f"Could not write to file: {json_file_path}", e)
+        except Exception as e:  # Catch other unexpected errors
+            self._log_error("save_to_local", f"Unexpected error saving local file: {json_file_path}", e)
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        return False
+
+    @staticmethod
+    def _file_stamp(path: Path) -> Tuple[int, int]:
+        stat = path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def _content_changed_since_save(self, path: Path) -> bool:
+        """True unless ``path`` is our last save, untouched, and saving again would write the same bytes."""
+        if self._dirty_parts or self._saved_files.get(path.resolve()) != self._file_stamp(path):
+            return True
+        # Settings are not tracked as dirty (the settings UI writes to them directly)
+        previous = self._fragment_cache.get("settings")
+        return previous is None or previous != self._serialize_part("settings", self.settings)
+
+    def _export_parts(self) -> Iterator[Tuple[str, Any]]:
+        """Yield ``(part key, data class)`` in export order."""
+        yield "header", self.export_header
+        yield "database", self.base_info
+        yield "settings", self.settings
+        for table in self.main_numbers_list:
+            yield f"table:{table.name}", table
+        yield "sellers", self.sellers
+
+    def _serialize_part(self, key: str, part: Any) -> str:
+        """
+        Return ``part`` as an indented array element, reusing the cached text of clean parts.
+
+        Settings are always serialized: they are small and the settings UI
+        writes to them directly.
+        """
+        text = self._fragment_cache.get(key)
+        if text is None or key in self._dirty_parts or key == "settings":
+            # JSON escapes newlines inside strings, so indenting per line is safe
+            text = "    " + json.dumps(asdict(part), indent=4, ensure_ascii=False).replace("\n", "\n    ")
+            self._fragment_cache[key] = text
+            self._dirty_parts.discard(key)
+        return text
+
+    def _mark_dirty(self, key: str) -> None:
+        """Mark the export part ``key`` as changed (re-serialized on save, refreshed in the article index,
+        cached validation report invalidated). Inside :meth:`batch` this happens once at commit."""
+        if self._batch is not None:
+            self._batch.dirty.add(key)
+            return
+        self._dirty_parts.add(key)
+        self._fragment_cache.pop(key, None)
+        self._data_version += 1
+        if key.startswith("table:"):
+            self._table_versions[key[6:]] = self._data_version
+            self._table_stats.pop(key[6:], None)
+            if self._article_index is not None:
+                self._article_index.update_table(key[6:])
+                if self._market_summary is not None:
+                    self._market_summary.update_table(key[6:])
+
+    def _notify_change(self, kind: str, target: str, obj: Any) -> None:
+        """Emit :attr:`data_changed` for an edit (see there for ``kind`` and ``target``)."""
+        if self._search_index is not None and kind != "batch":
+            if kind == "article":
+                self._search_index.update_article(target.partition(":")[0], obj)
+            elif kind == "table":
+                self._search_index.update_table(obj)
+            elif kind == "seller":
+                self._search_index.update_seller(obj)
+        if self._market_summary is not None:
+            if kind == "seller":
+                self._market_summary.update_seller(obj)
+            elif kind == "settings":
+                self._market_summary.set_max_main_numbers(self._max_main_numbers())
+        if self._batch is not None:
+            self._batch.notifications[(kind, target)] = obj
+            return
+        self.data_changed.emit(kind, target, obj)
+
+    def _timestamp(self) -> str:
+        """Current time for ``updated_at`` and log entries (one value per batch)."""
+        if self._batch is not None:
+            return self._batch.timestamp
+        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    @contextmanager
+    def batch(self, description: str = "Sammeländerung") -> Iterator["DataManager"]:
+        """
+        Group all edits made inside the ``with`` block into one transaction.
+
+        Edits are applied to the data classes right away, but the article
+        index, cached figures and listeners are updated once at the end:
+        the block is logged as a single ``BATCH`` change that
+        :meth:`reset_change` reverts as a unit, and :attr:`data_changed` is
+        emitted once. If the block raises, the edits made so far are
+        reverted and the exception is re-raised. Nested calls join the
+        outer transaction.
+
+        Args:
+            description (str): Description of the logged change.
+
+        Yields:
+            DataManager: This instance.
+        """
+        if self._batch is not None:
+            yield self
+            return
+        batch = self._batch = _Batch(timestamp=self._timestamp(), description=description)
+        try:
+            yield self
+        except BaseException:
+            for action, target, old_value in reversed(batch.changes):
+                self._revert(ChangeLogEntry("", batch.timestamp, action, target, "", old_value))
+            batch.changes.clear()
+            raise
+        finally:
+            self._batch = None
+            self._commit_batch(batch)
+
+    def _commit_batch(self, batch: _Batch) -> None:
+        for key in batch.dirty:
+            self._mark_dirty(key)
+        if batch.changes:
+            self._log_change(
+                action=ChangeLog.GROUP_ACTION,
+                target="batch",
+                description=f"{batch.description}: {len(batch.changes)} Änderungen",
+                old_value={"changes": [{"action": action, "target": target, "old_value": old_value}
+                                       for action, target, old_value in batch.changes]},
+            )
+        if batch.notifications:
+            self._notify_change("batch", "", [(kind, target, obj)
+                                              for (kind, target), obj in batch.notifications.items()])
+
+    def _on_data_parsed(self) -> None:
+        # The data classes are the source of truth; drop raw JSON and stale fragments
+        self.close_journal()
+        self._article_index = None
+        self._search_index = None
+        self._market_summary = None
+        self._table_stats.clear()
+        self._table_by_name = None
+        self._seller_by_id = None
+        self._aggregated_users = None
+        self._articles_by_table.clear()
+        self.json_data = None
+        self._fragment_cache.clear()
+        self._dirty_parts.clear()
+
+    # ------------------------------------------------------------------
+    # Change journal
+    # ------------------------------------------------------------------
+    def open_journal(self, export_path: str = "", sync: bool = True) -> int:
+        """
+        Attach the change journal of ``export_path`` and replay its records.
+
+        From now on every edit is appended to ``<export>.journal`` and synced
+        to disk. Saving folds the journal into the export; the journal is also
+        compacted this way once it exceeds ``ChangeJournal.COMPACT_THRESHOLD``.
+
+        Args:
+            export_path (str): Export the journal belongs to (defaults to the storage path).
+            sync (bool): Sync every journal append to disk.
+
+        Returns:
+            int: Number of replayed records.
+        """
+        export_path = export_path or str(self.get_storage_full_path())
+        parsed = urlparse(export_path)
+        if not export_path or (parsed.scheme and parsed.netloc):
+            return 0
+        self.close_journal()
+        journal = ChangeJournal.for_export(export_path, sync)
+        replayed = 0
+        self._replaying = True
+        try:
+            for record in journal.records():
+                self._apply_journal_record(record)
+                replayed += 1
+        finally:
+            self._replaying = False
+        if replayed:
+            self._log("INFO", f"{replayed} Änderungen aus {journal.path.name} wiederhergestellt.")
+        self._journal = journal
+        return replayed
+
+    def close_journal(self) -> None:
+        """Detach the change journal; the file is kept until the next save."""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def compact_journal(self) -> bool:
+        """
+        Fold the journal into the export at the storage path.
+
+        Returns:
+            bool: True if the export was written and the journal emptied.
+        """
+        if self._journal is None:
+            return False
+        path = str(self.get_storage_full_path())
+        self.save(path)
+        return self._journal.size == 0
+
+    def _journal_append(self, record: dict) -> None:
+        if self._journal is None or self._replaying:
+            return
+        try:
+            self._journal.append(record)
+        except OSError as e:
+            self._log_error("_journal_append", f"Could not write journal {self._journal.path}", e)
+            return
+        if self._journal.needs_compaction():
+            self.compact_journal()
+
+    def _apply_journal_record(self, record: dict) -> None:
+        if record.get("clear_log"):
+            self._change_log.clear()
+            self._unsaved_changes = True
+            return
+        if record.get("redo"):
+            self._apply_redo(record["redo"])
+        if record.get("entry"):
+            self._change_log.append(ChangeLogEntry(**record["entry"]))
+            self._unsaved_changes = True
+
+    @staticmethod
+    def _encode_articles(articles: List[ArticleDataClass]) -> List[dict]:
+        return [asdict(a) for a in articles]
+
+    @staticmethod
+    def _articles_redo(table: MainNumberDataClass, articles: List[ArticleDataClass]) -> dict:
+        return {"op": "articles", "table": table.name, "articles": DataManager._encode_articles(articles)}
+
+    @staticmethod
+    def _seller_redo(seller: SellerDataClass) -> dict:
+        return {"op": "seller", "seller": asdict(seller)}
+
+    def _settings_redo(self) -> dict:
+        return {"op": "settings", "settings": asdict(self.settings.data[0])}
+
+    def _apply_redo(self, redo: dict) -> None:
+        """Write the state recorded by one of the ``*_redo`` helpers back into the data classes."""
+        op = redo.get("op")
+        if op == "articles":
+            table = self.get_main_number_tables().get(redo.get("table"))
+            if table is None:
+                self._log("WARNING", f"Journal: Tabelle {redo.get('table')} nicht gefunden.")
+                return
+            for values in redo.get("articles", []):
+                article = self._find_article(table, values.get("artikelnummer"))
+                if article is not None:
+                    for key, value in values.items():
+                        setattr(article, key, value)
+            self._mark_dirty(f"table:{table.name}")
+            self._notify_change("table", table.name, table)
+        elif op == "seller":
+            values = redo.get("seller", {})
+            seller = self.get_seller(values.get("id"))
+            if seller is None:
+                self._log("WARNING", f"Journal: Verkäufer {values.get('id')} nicht gefunden.")
+                return
+            for key, value in values.items():
+                setattr(seller, key, value)
+            self._mark_dirty("sellers")
+            self._regroup_seller(seller)
+            self._notify_change("seller", seller.id, seller)
+        elif op == "settings":
+            values = redo.get("settings", {})
+            if not self.settings.data:
+                self.settings.data.append(SettingsContentDataClass(**values))
+            else:
+                for key, value in values.items():
+                    setattr(self.settings.data[0], key, value)
+            self._notify_change("settings", "", self.settings.data[0])
+
+    def get_data(self) -> List[dict]:
+        """ Returns the current data as export (built from the data classes). """
+        if self.json_data is not None:
+            return self.json_data
+        return self.export_to_json()
+
     def reset_change(self, change_id: str) -> bool:
         """Revert a change from the log identified by ``change_id``."""
-        entry = next((e for e in self._change_log if e.id == change_id), None)
-        if not entry or not entry.old_value:
+        entry = self._change_log.get(change_id)
+        return entry is not None and self._revert(entry)
+
+    def _revert(self, entry: ChangeLogEntry) -> bool:
+        """Write the ``old_value`` of ``entry`` back into the data classes."""
+        old_value = self._change_log.old_value(entry)
+        if not old_value:
             return False
 
+        if entry.action == ChangeLog.GROUP_ACTION:
+            reverted = False
+            with self.batch():
+                for change in reversed(old_value.get("changes", [])):
+                    child = ChangeLogEntry("", entry.timestamp, change["action"], change["target"], "",
+                                           change["old_value"])
+                    reverted = self._revert(child) or reverted
+            return reverted
+
         if entry.target.startswith("stnr"):
             # Artikel zurücksetzen
             parts = entry.target.split(":")
             if len(parts) == 2:
                 stnr_id, artikelnummer = parts[0][4:], parts[1]
                 table = self.get_main_number_tables().get(f"stnr{stnr_id}")
-                if table:
-                    for article in table.data:
-                        if article.artikelnummer == artikelnummer:
-                            article.beschreibung = entry.old_value.get(
-                                "beschreibung", "")
-                            article.groesse = entry.old_value.get(
-                                "groesse", "0")
-                            article.preis = entry.old_value.get(
-                                "preis", "0.00")
-                            article.updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                            return True
+                article = self._find_article(table, artikelnummer) if table else None
+                if article is not None:
+                    article.beschreibung = old_value.get(
+                        "beschreibung", "")
+                    article.groesse = old_value.get(
+                        "groesse", "0")
+                    article.preis = old_value.get(
+                        "preis", "0.00")
+                    article.updated_at = self._timestamp()
+                    self._mark_dirty(f"table:{table.name}")
+                    self._notify_change("article", f"{table.name}:{artikelnummer}", article)
+                    self._journal_append({"redo": self._articles_redo(table, [article])})
+                    return True
+            else:
+                # Table delete: swap the article list kept by delete_article_list back in,
+                # after a restart rebuild it from the rows replayed from the journal
+                table = self.get_main_number_tables().get(entry.target)
+                previous = self._change_log.take_snapshot(old_value)
+                if previous is None and old_value.get("data") is not None:
+                    previous = list(old_value["data"])
+                if table is not None and previous is not None:
+                    table.data = previous
+                    self._articles_by_table.pop(table.name, None)
+                    self._mark_dirty(f"table:{table.name}")
+                    self._notify_change("table", table.name, table)
+                    self._journal_append({"redo": self._articles_redo(table, table.data)})
+                    return True
+                self._log("DEBUG", f"Kein Zwischenstand für {entry.target} vorhanden.")
 
         elif entry.target.startswith("verkaeufer:"):
-            seller_id = entry.target.split(":")[1]
-            for seller in self.get_seller_as_list():
-                if seller.id == seller_id:
-                    seller.vorname = entry.old_value.get("vorname", "")
-                    seller.nachname = entry.old_value.get("nachname", "")
-                    seller.telefon = entry.old_value.get("telefon", "")
-                    seller.email = entry.old_value.get("email", "")
-                    seller.passwort = entry.old_value.get("passwort", "")
-                    seller.updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    return True
+            seller = self.get_seller(entry.target.split(":")[1])
+            if seller is not None:
+                seller.vorname = old_value.get("vorname", "")
+                seller.nachname = old_value.get("nachname", "")
+                seller.telefon = old_value.get("telefon", "")
+                seller.email = old_value.get("email", "")
+                seller.passwort = old_value.get("passwort", "")
+                seller.updated_at = self._timestamp()
+                self._mark_dirty("sellers")
+                self._regroup_seller(seller)
+                self._notify_change("seller", seller.id, seller)
+                self._journal_append({"redo": self._seller_redo(seller)})
+                return True
         elif entry.target.startswith("settings:"):
             key = entry.target.split(":")[1]
-            if hasattr(self.settings.data, key) and key in entry.old_value:
-                setattr(self.settings.data, key, entry.old_value[key])
+            if self.settings.data and hasattr(self.settings.data[0], key) and key in old_value:
+                setattr(self.settings.data[0], key, old_value[key])
+                self._notify_change("settings", key, self.settings.data[0])
+                self._journal_append({"redo": self._settings_redo()})
                 return True
 
         return False
 
     def __move_empty_to_end(self, data_list):
-        empty_key = "<LEER>"
-        if empty_key in data_list:
-            empty_entry = data_list.pop(empty_key)
-            data_list[empty_key] = empty_entry
+        if _EMPTY_USER_KEY in data_list:
+            empty_entry = data_list.pop(_EMPTY_USER_KEY)
+            data_list[_EMPTY_USER_KEY] = empty_entry
         return data_list
 
     def update_setting(self, key: str, new_value: str) -> bool:
         """Update a setting value and log the modification."""
-        if hasattr(self.settings.data, key):
-            old_value = getattr(self.settings.data, key)
-            setattr(self.settings.data, key, new_value)
+        if self.settings.data and hasattr(self.settings.data[0], key):
+            current = self.settings.data[0]
+            old_value = getattr(current, key)
+            setattr(current, key, new_value)
+            self._notify_change("settings", key, current)
             self._log_change(
                 action="UPDATE",
                 target=f"settings:{key}",
                 description=f"Setting '{key}' geändert von {old_value} zu {new_value}",
-                old_value={key: old_value}
+                old_value={key: old_value},
+                redo=self._settings_redo(),
             )
             return True
         return False
@@ -566,6 +1329,7 @@ class DataManager(QObject, BaseData):
                     action="CREATE",
                     target=f"settings:{field_.name}",
                     description=f"Setting '{field_.name}' auf {value} gesetzt",
+                    redo=self._settings_redo(),
                 )
         else:
             # Ansonsten alle Felder der ersten Settings-Instanz überschreiben und Änderungen loggen
@@ -579,21 +1343,26 @@ class DataManager(QObject, BaseData):
                         action="UPDATE",
                         target=f"settings:{field_.name}",
                         description=f"Setting '{field_.name}' geändert von {old_value} zu {new_value}",
-                        old_value={field_.name: old_value}
+                        old_value={field_.name: old_value},
+                        redo=self._settings_redo(),
                     )
 
+        self._notify_change("settings", "", self.settings.data[0])
         self.synchornize_data_class_change_to_json()
 
     def reset_all_changes(self) -> int:
         """Reset all logged changes and return the number of reverted entries."""
         # Wichtig: Um Konflikte zu vermeiden, rückwärts iterieren
         successful_resets = 0
-        for entry in reversed(self._change_log):
-            if self.reset_change(entry.id):
-                successful_resets += 1
+        with self.batch():  # one index refresh and one data_changed for all entries
+            for entry in reversed(self._change_log):
+                if self._revert(entry):
+                    successful_resets += 1
         self._change_log.clear()
         self._unsaved_changes = True  # weil Änderungen am Zustand erfolgt sind
+        self._journal_append({"clear_log": True})
         return successful_resets
 
     def synchornize_data_class_change_to_json(self):
-        self.json_data = self.export_to_json()
+        # The data classes are saved directly; only drop an outdated raw copy
+        self.json_data = None
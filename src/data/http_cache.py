@@ -0,0 +1,142 @@
+"""Pooled HTTP downloads with ETag / Last-Modified revalidation and an on-disk cache."""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from log import CustomLogger
+from .base import Base
+
+
+@dataclass
+class HttpCacheMetrics:
+    """Counters of an :class:`HttpCache` (latency in seconds)."""
+    requests: int = 0
+    cache_hits: int = 0
+    offline_hits: int = 0
+    bytes_transferred: int = 0
+    total_latency: float = 0.0
+    last_latency: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.cache_hits / self.requests if self.requests else 0.0
+
+
+class HttpCache(Base):
+    """
+    Download remote files into a local cache and revalidate them cheaply.
+
+    All instances share one :class:`requests.Session`, so connections are kept
+    alive and reused. Requests accept gzip; known entries are revalidated with
+    ``If-None-Match`` / ``If-Modified-Since`` and a ``304`` answer is served
+    from disk. New content is streamed into the cache file chunk by chunk and
+    only replaces the old copy once it is complete.
+
+    If the server is unreachable, an existing cache entry is returned with a
+    warning (counted as ``offline_hits``).
+    """
+
+    DEFAULT_DIR = Path(tempfile.gettempdir()) / "flohmarkt_http_cache"
+    TIMEOUT: Tuple[float, float] = (5.0, 30.0)  # connect, read
+    CHUNK_SIZE: int = 1 << 16
+    POOL_SIZE: int = 8
+
+    _session: Optional[requests.Session] = None
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None,
+                 timeout: Optional[Tuple[float, float]] = None, logger: Optional[CustomLogger] = None) -> None:
+        """
+        Args:
+            cache_dir (Optional[Union[str, Path]]): Cache directory (defaults to DEFAULT_DIR).
+            timeout (Optional[Tuple[float, float]]): Connect and read timeout.
+            logger (Optional[CustomLogger]): Optional logger.
+        """
+        Base.__init__(self, logger)
+        self._dir = Path(cache_dir) if cache_dir else self.DEFAULT_DIR
+        self._timeout = timeout or self.TIMEOUT
+        self.metrics = HttpCacheMetrics()
+
+    @classmethod
+    def session(cls) -> requests.Session:
+        """Return the shared, pooled session."""
+        if cls._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=cls.POOL_SIZE, pool_maxsize=cls.POOL_SIZE, max_retries=1)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update({"Accept-Encoding": "gzip, deflate", "Accept": "application/json, */*"})
+            cls._session = session
+        return cls._session
+
+    def _entry_paths(self, url: str) -> Tuple[Path, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+        return self._dir / f"{key}.body", self._dir / f"{key}.meta.json"
+
+    def cached_path(self, url: str) -> Optional[Path]:
+        """Return the cached file for ``url`` or ``None``."""
+        body, meta = self._entry_paths(url)
+        return body if body.is_file() and meta.is_file() else None
+
+    def fetch(self, url: str) -> Path:
+        """
+        Return a local file with the current content of ``url``.
+
+        Raises:
+            requests.exceptions.RequestException: If the download fails and nothing is cached.
+            OSError: If the cache cannot be written.
+        """
+        body, meta_file = self._entry_paths(url)
+        meta: Dict[str, str] = {}
+        if self.cached_path(url):
+            try:
+                meta = json.loads(meta_file.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                meta = {}
+
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+        start = time.perf_counter()
+        self.metrics.requests += 1
+        try:
+            with self.session().get(url, headers=headers, timeout=self._timeout, stream=True) as response:
+                if response.status_code == 304 and meta:
+                    self.metrics.cache_hits += 1
+                    self._log("DEBUG", f"HTTP-Cache: {url} unverändert (304).")
+                    return body
+                response.raise_for_status()
+                self._dir.mkdir(parents=True, exist_ok=True)
+                tmp = body.with_name(body.name + ".tmp")
+                with open(tmp, "wb") as fh:
+                    for chunk in response.iter_content(self.CHUNK_SIZE):
+                        fh.write(chunk)
+                # Bytes on the wire (compressed); the decoded size is on disk
+                self.metrics.bytes_transferred += response.raw.tell() or tmp.stat().st_size
+                os.replace(tmp, body)
+                meta_file.write_text(json.dumps({
+                    "url": url,
+                    "etag": response.headers.get("ETag", ""),
+                    "last_modified": response.headers.get("Last-Modified", ""),
+                }), encoding="utf-8")
+                return body
+        except requests.exceptions.RequestException as err:
+            if meta and body.is_file():
+                self.metrics.offline_hits += 1
+                self._log("WARNING", f"HTTP-Cache: {url} nicht erreichbar ({err}), verwende Cache.")
+                return body
+            raise
+        finally:
+            self.metrics.last_latency = time.perf_counter() - start
+            self.metrics.total_latency += self.metrics.last_latency
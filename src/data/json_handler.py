@@ -4,12 +4,13 @@ import json
 import inspect
 import copy
 import sys  # For stderr fallback
-from typing import Union, Dict, List, Optional, Any  # Added Optional, Any
+from typing import Union, Dict, List, Optional, Any, Iterator  # Added Optional, Any
 from pathlib import Path
 import os
-import shutil
 
 from log import CustomLogger, LogType  # Import LogType if used
+from .backup_store import BackupStore
+from .http_cache import HttpCache
 import requests
 from urllib.parse import urlparse, urlunparse
 
@@ -24,6 +25,13 @@ class JsonHandler():
         logger (Optional[CustomLogger]): Logger instance for logging messages and errors.
     """
 
+    STREAM_CHUNK_SIZE: int = 1 << 16  # Characters read per step by iter_local_items
+    # Backup store settings used by _create_backup
+    BACKUP_COMPRESSION: str = "gzip"
+    BACKUP_KEEP_LAST: int = 10
+    BACKUP_KEEP_DAILY: int = 7
+    HTTP_CACHE_DIR: Optional[str] = None  # None: HttpCache.DEFAULT_DIR
+
     def __init__(self, json_path_or_data: Optional[Union[str, Dict, List]] = None, logger: Optional[CustomLogger] = None) -> None:
         """
         Initialize the JsonHandler.
@@ -35,6 +43,8 @@ class JsonHandler():
         self.logger = logger
         self._storage_path: str = ''  # Initialize path as None
         self.json_data: Optional[Union[Dict, List]] = None  # Initialize as None
+        self._backup_stores: Dict[Path, BackupStore] = {}  # One store (and loaded index) per saved file
+        self._http_cache: Optional[HttpCache] = None
 
         if isinstance(json_path_or_data, str):
             # Load data if path/URL is provided
@@ -135,33 +145,60 @@ class JsonHandler():
         """
         Load JSON data from a URL.
 
+        The download goes through :meth:`download_url`, so an unchanged remote
+        file is read from the local HTTP cache.
+
         Args:
             json_url (str): The URL to the JSON file.
 
         Returns:
             Optional[Union[Dict, List]]: Loaded JSON data or None if an error occurs.
         """
+        local_file = self.download_url(json_url)
+        if local_file is None:
+            return None
+        try:
+            with open(local_file, 'r', encoding='utf-8') as json_file:
+                data = json.load(json_file)
+            self.set_path_or_url(json_url)
+            return data
+        except json.JSONDecodeError as e:
+            self._log_error("load_from_url", f"JSON decoding failed for URL: {json_url}", e)
+            return None
+        except Exception as e:  # Catch other unexpected errors
+            self._log_error("load_from_url", f"Unexpected error loading from URL: {json_url}", e)
+            return None
+
+    def get_http_cache(self) -> HttpCache:
+        """ Returns the HTTP cache used for remote loads (created on first use). """
+        if self._http_cache is None:
+            self._http_cache = HttpCache(self.HTTP_CACHE_DIR, logger=self.logger)
+        return self._http_cache
+
+    def download_url(self, json_url: str) -> Optional[Path]:
+        """
+        Download ``json_url`` into the local HTTP cache (see :class:`HttpCache`).
+
+        Args:
+            json_url (str): The URL to the JSON file.
+
+        Returns:
+            Optional[Path]: Local file with the current content or None if an error occurs.
+        """
         if requests is None:
-            self._log_error("load_from_url", "Cannot load from URL because 'requests' library is not installed.")
+            self._log_error("download_url", "Cannot load from URL because 'requests' library is not installed.")
             return None
 
         try:
-            response = requests.get(json_url, timeout=10)  # Added timeout
-            response.raise_for_status()  # Raises HTTPError for bad responses (4xx or 5xx)
-            # Use response.json() for automatic decoding and parsing
-            self.set_path_or_url(urlparse(json_url))
-            return response.json()
+            return self.get_http_cache().fetch(json_url)
         except requests.exceptions.Timeout:
-            self._log_error("load_from_url", f"Request timed out for URL: {json_url}")
+            self._log_error("download_url", f"Request timed out for URL: {json_url}")
             return None
         except requests.exceptions.RequestException as e:
-            self._log_error("load_from_url", f"HTTP request failed for URL: {json_url}", e)
-            return None
-        except json.JSONDecodeError as e:
-            self._log_error("load_from_url", f"JSON decoding failed for URL: {json_url}", e)
+            self._log_error("download_url", f"HTTP request failed for URL: {json_url}", e)
             return None
         except Exception as e:  # Catch other unexpected errors
-            self._log_error("load_from_url", f"Unexpected error loading from URL: {json_url}", e)
+            self._log_error("download_url", f"Unexpected error downloading URL: {json_url}", e)
             return None
 
     def load_from_local(self, json_file_path: str) -> Optional[Union[Dict, List]]:
@@ -196,6 +233,98 @@ class JsonHandler():
             self._log_error("load_from_local", f"Unexpected error loading local file: {json_file_path}", e)
             return None
 
+    def iter_local_items(self, json_file_path: str, chunk_size: Optional[int] = None) -> Iterator[Any]:
+        """
+        Incrementally decode a local JSON file whose top level is an array.
+
+        Only one top-level element is held in memory at a time; the file is read
+        in chunks and every element is yielded as soon as it is complete. This
+        keeps the peak memory of large phpMyAdmin exports close to the size of
+        the biggest single table instead of the whole document.
+
+        Args:
+            json_file_path (str): The path to the JSON file.
+            chunk_size (Optional[int]): Characters read per step (defaults to STREAM_CHUNK_SIZE).
+
+        Yields:
+            Any: The decoded top-level array elements in file order.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            json.JSONDecodeError: If the file is not a valid JSON array.
+        """
+        p = Path(json_file_path).resolve()
+        if not p.is_file():
+            raise FileNotFoundError(f"File not found at resolved path: {p}")
+
+        step = chunk_size or self.STREAM_CHUNK_SIZE
+        decoder = json.JSONDecoder()
+        whitespace = " \t\n\r"
+
+        with open(p, 'r', encoding='utf-8') as json_file:
+            self.set_path_or_url(json_file_path)
+            buf = json_file.read(step)
+            pos = 0
+            eof = not buf
+            # "start": expect '['; "first": value or ']'; "value": value; "next": ',' or ']'; "end": only whitespace
+            state = "start"
+
+            while True:
+                # Skip whitespace, refilling the buffer when it runs dry
+                while True:
+                    while pos < len(buf) and buf[pos] in whitespace:
+                        pos += 1
+                    if pos < len(buf) or eof:
+                        break
+                    buf = json_file.read(step)
+                    pos = 0
+                    eof = not buf
+
+                if pos >= len(buf):
+                    if state == "end":
+                        return
+                    raise json.JSONDecodeError("Unexpected end of JSON array", buf, pos)
+
+                char = buf[pos]
+                if state == "end":
+                    raise json.JSONDecodeError("Extra data", buf, pos)
+                if state == "start":
+                    if char != '[':
+                        raise json.JSONDecodeError("Expected a JSON array at top level", buf, pos)
+                    state = "first"
+                    pos += 1
+                    continue
+                if state == "next":
+                    if char not in ',]':
+                        raise json.JSONDecodeError("Expecting ',' delimiter", buf, pos)
+                    state = "value" if char == ',' else "end"
+                    pos += 1
+                    continue
+                if char == ']' and state == "first":
+                    state = "end"
+                    pos += 1
+                    continue
+
+                try:
+                    item, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    end = -1
+                # A scalar touching the buffer end may still be truncated
+                if end == -1 or (end == len(buf) and not eof and not isinstance(item, (dict, list))):
+                    # Grow geometrically so one large table is not re-decoded per chunk
+                    more = json_file.read(max(step, len(buf) - pos))
+                    buf = buf[pos:] + more
+                    pos = 0
+                    eof = not more
+                    continue
+
+                pos = end
+                state = "next"
+                yield item
+                del item
+
     def set_path_or_url(self, path_or_url: str) -> None:
         """
         Set the path or URL for the JSON data.
@@ -414,17 +543,16 @@ class JsonHandler():
             self._log_error("save_to_local", f"Unexpected error saving local file: {json_file_path}", e)
 
     def _create_backup(self, file_path: Path) -> None:
-        """Create numbered backup of ``file_path``."""
-        counter = 1
-        while True:
-            backup = file_path.with_name(f"{file_path.name}_{counter}.backup")
-            if not backup.exists():
-                try:
-                    shutil.copy2(file_path, backup)
-                except IOError as e:
-                    self._log_error("_create_backup", f"Could not create backup {backup}", e)
-                break
-            counter += 1
+        """Store a compressed, deduplicated backup of ``file_path`` (see :class:`BackupStore`)."""
+        store = self._backup_stores.get(file_path)
+        if store is None:
+            store = self._backup_stores[file_path] = BackupStore.for_file(
+                file_path, compression=self.BACKUP_COMPRESSION,
+                keep_last=self.BACKUP_KEEP_LAST, keep_daily=self.BACKUP_KEEP_DAILY)
+        try:
+            store.add(file_path)
+        except (IOError, ValueError) as e:
+            self._log_error("_create_backup", f"Could not create backup of {file_path} in {store.path}", e)
 
     def get_data(self) -> Optional[Union[Dict, List]]:
         """ Returns the loaded JSON data. """
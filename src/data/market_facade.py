@@ -7,6 +7,8 @@ from .data_manager import DataManager
 from .market_config_handler import MarketConfigHandler
 from .singleton_meta import SingletonMeta
 from .pdf_display_config import PdfDisplayConfig
+from .market_snapshot import MarketSnapshot
+from .validation import ValidationReport
 from generator.file_generator import FileGenerator
 from objects import FleatMarket, SettingsContentDataClass
 from display import BasicProgressTracker
@@ -112,8 +114,8 @@ class MarketObserver(QObject):
                 pdf_display_config = (
                     self.market_config_handler.get_full_pdf_coordinates_config_path()
                 )
-                # Initialize the DataManager with the market JSON path
-                ret = self.data_manager.load(market_json_path)
+                # Initialize the DataManager from the snapshot or the market JSON path
+                ret = self._load_market_data(market_json_path, json_path)
                 if ret:
                     self.apply_settings()
                     # Setup the FleatMarket with the loaded data
@@ -169,14 +171,87 @@ class MarketObserver(QObject):
             # self.file_generator = FileGenerator(self.data_manager)
         return ret
 
-    @Slot()
-    def setup_data_generation(self) -> None:
+    def _load_market_data(self, market_json_path: str, project_path: str) -> bool:
+        """Load the export via the project snapshot if it is still valid.
+
+        A fresh snapshot skips JSON decoding and object construction. Otherwise
+        the export is parsed normally and the snapshot is rebuilt. Afterwards
+        the change journal of the export is attached and replayed.
+
+        :param market_json_path: Path to the market export.
+        :param project_path: Path of the ``.project`` file owning the snapshot.
+        :return: ``True`` if the data was loaded.
+        """
+        snapshot = MarketSnapshot.for_project(project_path)
+        state = snapshot.load(market_json_path)
+        if state is not None:
+            self.data_manager.restore_snapshot_state(state, market_json_path)
+        else:
+            if not self.data_manager.load(market_json_path):
+                return False
+            snapshot.save(market_json_path, self.data_manager.snapshot_state())
+
+        # Edits since the last save live in the journal next to the export
+        self.data_manager.open_journal(market_json_path)
+        self._report_validation()
+        return True
+
+    def _report_validation(self) -> None:
+        """Show a short summary in the status bar if the loaded data has issues."""
+        report = self.data_manager.validate()
+        if report.issues:
+            self.status_info.emit("WARNING" if report.ok else "ERROR", report.format_lines(limit=0)[0])
 
+    def validation_report(self) -> ValidationReport:
+        """Return the (cached) validation report of the loaded data."""
+        return self.data_manager.validate()
+
+    def _build_fleat_market(self) -> FleatMarket:
+        """Create a :class:`FleatMarket` view on the DataManager's data (nothing is copied).
+
+        Edits reach it through ``DataManager.data_changed``; only the
+        affected main number drops its cached figures.
+        """
+        fm = FleatMarket()
+        fm.load_view(self.data_manager.get_seller_as_list(), self.data_manager.get_main_number_as_list(),
+                     prices_of=self.data_manager.table_prices)
+        self.data_manager.data_changed.connect(fm.apply_change)
+        return fm
+
+    @Slot()
+    def setup_data_generation(self, fm: FleatMarket | None = None) -> None:
+        """Mark the data as ready; FleatMarket and FileGenerator are built on first use."""
         self._data_ready = True
-        self.fm: FleatMarket = FleatMarket()
-        self.fm.load_sellers(self.data_manager.get_seller_as_list())
-        self.fm.load_main_numbers(self.data_manager.get_main_number_as_list())
-        self.file_generator = FileGenerator(self.fm)
+        self.fm = fm
+        self.file_generator = None
+
+    @property
+    def fm(self) -> FleatMarket | None:
+        """FleatMarket view of the loaded data (created on first access, follows later edits)."""
+        if self._fm is None and self._data_ready:
+            self._fm = self._build_fleat_market()
+        return self._fm
+
+    @fm.setter
+    def fm(self, value: FleatMarket | None) -> None:
+        old = getattr(self, "_fm", None)  # unset during __init__
+        if old is not None and old is not value:
+            try:
+                self.data_manager.data_changed.disconnect(old.apply_change)
+            except (RuntimeError, TypeError):
+                pass  # not connected (set from outside)
+        self._fm = value
+
+    @property
+    def file_generator(self) -> FileGenerator | None:
+        """Default FileGenerator for :attr:`fm` (created on first access)."""
+        if self._file_generator is None and self._data_ready:
+            self._file_generator = FileGenerator(self.fm, validate=self.data_manager.validate)
+        return self._file_generator
+
+    @file_generator.setter
+    def file_generator(self, value: FileGenerator | None) -> None:
+        self._file_generator = value
 
     @Slot(str)
     def storage_path_changed(self, path: str):
@@ -261,6 +336,7 @@ class MarketObserver(QObject):
 
         self.file_generator = FileGenerator(
             self.fm,
+            validate=self.data_manager.validate,
             output_interface=window,
             progress_tracker=tracker,
             output_path=outputpath,
@@ -291,6 +367,7 @@ class MarketObserver(QObject):
 
         self.file_generator = FileGenerator(
             self.fm,
+            validate=self.data_manager.validate,
             output_interface=window,
             progress_tracker=tracker,
             output_path=output_path,
@@ -323,6 +400,7 @@ class MarketObserver(QObject):
 
         self.file_generator = FileGenerator(
             self.fm,
+            validate=self.data_manager.validate,
             output_interface=window,
             progress_tracker=tracker,
             output_path=output_path,
@@ -404,7 +482,7 @@ class MarketObserver(QObject):
                 or "project.project"
             )
 
-            self.data_manager.json_data = self.data_manager.export_to_json()
+            # Only tables changed since the last save are serialized again
             self.data_manager.save(str(market_file))
 
             self.pdf_display_config_loader.save(str(pdf_file))
@@ -414,6 +492,8 @@ class MarketObserver(QObject):
                 str(pdf_file)
             )
             self.market_config_handler.save_to(str(project_file))
+            # The export changed; the next open rebuilds the snapshot
+            MarketSnapshot.for_project(project_file).invalidate()
 
             pdf_path = self.pdf_display_config_loader.get_full_pdf_path()
             if pdf_path and Path(pdf_path).is_file():
@@ -425,7 +505,12 @@ class MarketObserver(QObject):
             self.set_project_dir(dir_path)
             self.set_project_exists(True)
 
-            self.status_info.emit("INFO", f"Projekt gespeichert: {project_file}")
+            summary = self.data_manager.get_market_summary()
+            self.status_info.emit(
+                "INFO",
+                f"Projekt gespeichert: {project_file} "
+                f"({summary.total} Artikel, {summary.price_sum:.2f} €, {summary.active_sellers} Verkäufer)",
+            )
             return True
         except Exception as err:  # pragma: no cover - runtime errors handled
             self.status_info.emit("ERROR", f"Fehler beim Speichern: {err}")
@@ -0,0 +1,144 @@
+"""Versioned binary snapshot of a parsed market stored next to the project file."""
+
+import hashlib
+import json
+import os
+import pickle
+import struct
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from log import CustomLogger
+from .base import Base
+
+
+class MarketSnapshot(Base):
+    """
+    Cache the parsed state of a market export as a pickle beside the project.
+
+    The snapshot file starts with a small header (magic, format version and a
+    JSON key describing the export it was built from) followed by the pickled
+    payload. :meth:`load` only returns the payload when the key still matches
+    the export on disk and the format version is current; otherwise the
+    snapshot is treated as stale and the caller falls back to a regular load.
+
+    The export key consists of size, ``mtime_ns`` and SHA-256 of the export.
+    Size and mtime are checked first; the hash is only computed when the size
+    matches but the mtime differs (e.g. after copying the project).
+    """
+
+    MAGIC = b"VDPSNAP\0"
+    FORMAT_VERSION = 3  # 2: slotted article and seller records, 3: payload is the JSONData state only
+    SUFFIX = ".snapshot"
+    _HEADER = struct.Struct("<8sHI")  # magic, format version, key length
+
+    def __init__(self, snapshot_path: Union[str, Path], logger: Optional[CustomLogger] = None) -> None:
+        """
+        Args:
+            snapshot_path (Union[str, Path]): Location of the snapshot file.
+            logger (Optional[CustomLogger]): Optional logger.
+        """
+        Base.__init__(self, logger)
+        self._path = Path(snapshot_path)
+
+    @classmethod
+    def for_project(cls, project_path: Union[str, Path], logger: Optional[CustomLogger] = None) -> "MarketSnapshot":
+        """Return the snapshot that belongs to ``project_path`` (``<name>.snapshot``)."""
+        return cls(Path(project_path).with_suffix(cls.SUFFIX), logger)
+
+    @property
+    def path(self) -> Path:
+        """Path of the snapshot file."""
+        return self._path
+
+    # ------------------------------------------------------------------
+    # Key handling
+    # ------------------------------------------------------------------
+    @staticmethod
+    def content_hash(export_path: Union[str, Path]) -> str:
+        """Return the SHA-256 hex digest of ``export_path``."""
+        digest = hashlib.sha256()
+        with open(export_path, "rb") as fh:
+            for chunk in iter(lambda: fh.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @classmethod
+    def export_key(cls, export_path: Union[str, Path]) -> Dict[str, Any]:
+        """Build the key (size, mtime, hash) for ``export_path``."""
+        st = os.stat(export_path)
+        return {
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "sha256": cls.content_hash(export_path),
+        }
+
+    def _key_matches(self, key: Dict[str, Any], export_path: Path) -> bool:
+        st = os.stat(export_path)
+        if key.get("size") != st.st_size:
+            return False
+        if key.get("mtime_ns") == st.st_mtime_ns:
+            return True
+        return key.get("sha256") == self.content_hash(export_path)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def load(self, export_path: Union[str, Path]) -> Optional[Any]:
+        """
+        Return the cached payload for ``export_path`` or ``None`` if stale.
+
+        A stale or unreadable snapshot is removed so it is rebuilt on the next
+        :meth:`save`.
+        """
+        export = Path(export_path)
+        if not self._path.is_file() or not export.is_file():
+            return None
+        try:
+            with open(self._path, "rb") as fh:
+                magic, version, key_len = self._HEADER.unpack(fh.read(self._HEADER.size))
+                if magic != self.MAGIC or version != self.FORMAT_VERSION:
+                    self._log("INFO", f"Snapshot {self._path.name}: Formatversion {version} veraltet.")
+                    self.invalidate()
+                    return None
+                key = json.loads(fh.read(key_len).decode("utf-8"))
+                if key.get("export") != export.name or not self._key_matches(key, export):
+                    self._log("INFO", f"Snapshot {self._path.name}: Export geändert, wird neu erstellt.")
+                    self.invalidate()
+                    return None
+                payload = pickle.load(fh)
+        except Exception as err:
+            self._log("WARNING", f"Snapshot {self._path} nicht lesbar: {err}")
+            self.invalidate()
+            return None
+        self._log("INFO", f"Snapshot geladen: {self._path}")
+        return payload
+
+    def save(self, export_path: Union[str, Path], payload: Any) -> bool:
+        """Write ``payload`` keyed by the current state of ``export_path``."""
+        export = Path(export_path)
+        try:
+            key = self.export_key(export)
+            key["export"] = export.name
+            raw_key = json.dumps(key).encode("utf-8")
+            tmp = self._path.with_name(self._path.name + ".tmp")
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "wb") as fh:
+                fh.write(self._HEADER.pack(self.MAGIC, self.FORMAT_VERSION, len(raw_key)))
+                fh.write(raw_key)
+                pickle.dump(payload, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path)
+            self._log("DEBUG", f"Snapshot geschrieben: {self._path}")
+            return True
+        except Exception as err:
+            self._log("WARNING", f"Snapshot {self._path} konnte nicht geschrieben werden: {err}")
+            return False
+
+    def invalidate(self) -> None:
+        """Delete the snapshot file if present."""
+        try:
+            self._path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as err:
+            self._log("WARNING", f"Snapshot {self._path} konnte nicht gelöscht werden: {err}")
@@ -0,0 +1,195 @@
+"""Market-wide figures kept up to date by delta instead of rescans."""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from log import CustomLogger
+from objects import SellerDataClass
+from .article_index import ArticleIndex
+from .base import Base
+
+PRICE_BIN_EDGES_CENTS: Tuple[int, ...] = (100, 200, 500, 1000, 2000, 5000)
+PRICE_BIN_LABELS: Tuple[str, ...] = ("< 1 €", "1–2 €", "2–5 €", "5–10 €", "10–20 €", "20–50 €", "≥ 50 €")
+
+
+@dataclass(frozen=True)
+class MarketSummarySnapshot:
+    """Immutable state of a :class:`MarketSummary` (see ``DataManager.get_market_summary``)."""
+    complete: int = 0
+    partial: int = 0
+    open: int = 0
+    cents: int = 0                         # sum of all valid prices
+    buckets: Tuple[int, ...] = (0, 0, 0, 0, 0)  # tables per ArticleIndex.BUCKET_KEYS
+    seller_count: int = 0
+    active_sellers: int = 0                # first name, last name and email set
+    max_main_numbers: int = 0              # setting max_stammnummern (0 = unknown)
+    price_histogram: Tuple[int, ...] = (0,) * len(PRICE_BIN_LABELS)
+
+    @property
+    def total(self) -> int:
+        return self.complete + self.partial + self.open
+
+    @property
+    def price_sum(self) -> float:
+        return self.cents / 100
+
+    def progress_buckets(self) -> Dict[str, int]:
+        """Tables per progress bucket, keyed like :meth:`ArticleIndex.progress_buckets`."""
+        return dict(zip(ArticleIndex.BUCKET_KEYS, self.buckets))
+
+    def free_main_numbers(self, max_main_numbers: Optional[int] = None) -> int:
+        maximum = self.max_main_numbers if max_main_numbers is None else max_main_numbers
+        return max(maximum - self.active_sellers, 0)
+
+    def used_percent(self, max_main_numbers: Optional[int] = None) -> int:
+        """Share of active sellers in the available main numbers (0 – 100)."""
+        maximum = self.max_main_numbers if max_main_numbers is None else max_main_numbers
+        return min(int(self.active_sellers / maximum * 100), 100) if maximum else 0
+
+    def format_lines(self) -> List[str]:
+        """Human readable summary for logs and the CLI."""
+        buckets = ", ".join(f"{key} {count}" for key, count in self.progress_buckets().items())
+        histogram = ", ".join(f"{label}: {count}" for label, count in zip(PRICE_BIN_LABELS, self.price_histogram))
+        return [
+            f"Artikel: {self.total} (fertig {self.complete}, teilweise {self.partial}, offen {self.open}), "
+            f"Wert {self.price_sum:.2f} €",
+            f"Stammnummern: {buckets}",
+            f"Verkäufer: {self.active_sellers} aktiv von {self.seller_count}, max. {self.max_main_numbers}",
+            f"Preise: {histogram}",
+        ]
+
+
+def _bucket(complete: int, total: int) -> int:
+    # Same thresholds as ArticleIndex.progress_buckets, in integers
+    if total and complete == total:
+        return 0
+    if 4 * complete >= 3 * total and total:
+        return 1
+    if 2 * complete >= total and total:
+        return 2
+    if 4 * complete >= total and total:
+        return 3
+    return 4
+
+
+def _is_active(seller: SellerDataClass) -> bool:
+    return all((getattr(seller, attr, "") or "").strip() for attr in ("vorname", "nachname", "email"))
+
+
+class MarketSummary(Base):
+    """
+    Running totals over a whole market for the statistics dashboard.
+
+    The summary keeps one record per ``stnr`` table (status counts, price
+    sum, progress bucket, price histogram) plus the market totals. When a
+    table changes, :meth:`update_table` subtracts its old record and adds
+    the new one, computed from the table's slice of the
+    :class:`ArticleIndex`; seller and settings edits adjust their counters
+    directly. :meth:`snapshot` returns an immutable copy that is reused until
+    the next change, so readers pay O(1).
+    """
+
+    def __init__(self, index: ArticleIndex, sellers: Iterable[SellerDataClass] = (), max_main_numbers: int = 0,
+                 logger: Optional[CustomLogger] = None) -> None:
+        """
+        Args:
+            index (ArticleIndex): Article index of the market; must be kept up to date by the owner.
+            sellers (Iterable[SellerDataClass]): All sellers.
+            max_main_numbers (int): Value of the ``max_stammnummern`` setting.
+            logger (Optional[CustomLogger]): Optional logger.
+        """
+        Base.__init__(self, logger)
+        self._index = index
+        self._max_main_numbers = max_main_numbers
+        self._snapshot: Optional[MarketSummarySnapshot] = None
+        self._sellers: Set[str] = set()
+        self._active: Set[str] = set()
+        for seller in sellers:
+            self._sellers.add(seller.id)
+            if _is_active(seller):
+                self._active.add(seller.id)
+        self._rebuild_tables()
+
+    def _rebuild_tables(self) -> None:
+        index = self._index
+        counts = index.status_counts_per_table()
+        cents = index.price_cents_per_table()
+        histograms = index.price_histogram_per_table(PRICE_BIN_EDGES_CENTS)
+        # name -> (complete, partial, open, cents, bucket, histogram)
+        self._tables: Dict[str, Tuple[int, int, int, int, int, Tuple[int, ...]]] = {}
+        self._status = [0, 0, 0]
+        self._cents = 0
+        self._buckets = [0] * len(ArticleIndex.BUCKET_KEYS)
+        self._histogram = [0] * len(PRICE_BIN_LABELS)
+        for row, name in enumerate(index.table_names()):
+            complete, partial, open_cnt = (int(c) for c in counts[row])
+            self._add(name, (complete, partial, open_cnt, int(cents[row]),
+                             _bucket(complete, complete + partial + open_cnt),
+                             tuple(int(h) for h in histograms[row])))
+
+    def _add(self, name: str, record: Tuple[int, int, int, int, int, Tuple[int, ...]], sign: int = 1) -> None:
+        complete, partial, open_cnt, cents, bucket, histogram = record
+        self._status[0] += sign * complete
+        self._status[1] += sign * partial
+        self._status[2] += sign * open_cnt
+        self._cents += sign * cents
+        self._buckets[bucket] += sign
+        for i, count in enumerate(histogram):
+            self._histogram[i] += sign * count
+        if sign > 0:
+            self._tables[name] = record
+
+    # ------------------------------------------------------------------
+    # Deltas
+    # ------------------------------------------------------------------
+    def update_table(self, table_name: str) -> None:
+        """Replace the figures of ``table_name`` after its articles changed (index already updated)."""
+        index = self._index
+        old = self._tables.get(table_name)
+        if old is None and table_name not in index.table_names():
+            return
+        counts = index.status_counts(table_name)
+        complete, partial, open_cnt = counts["vollstaendig"], counts["teilweise"], counts["offen"]
+        record = (complete, partial, open_cnt, index.price_sum_cents(table_name),
+                  _bucket(complete, complete + partial + open_cnt),
+                  tuple(int(h) for h in index.price_histogram(PRICE_BIN_EDGES_CENTS, table_name)))
+        if record != old:
+            if old is not None:
+                self._add(table_name, old, -1)
+            self._add(table_name, record)
+            self._snapshot = None
+
+    def update_seller(self, seller: SellerDataClass) -> None:
+        """Re-count ``seller`` as active or inactive."""
+        self._sellers.add(seller.id)
+        was_active = seller.id in self._active
+        if _is_active(seller) != was_active:
+            if was_active:
+                self._active.discard(seller.id)
+            else:
+                self._active.add(seller.id)
+        self._snapshot = None
+
+    def set_max_main_numbers(self, value: int) -> None:
+        if value != self._max_main_numbers:
+            self._max_main_numbers = value
+            self._snapshot = None
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+    def snapshot(self) -> MarketSummarySnapshot:
+        """Return the current figures (the same object until something changes)."""
+        if self._snapshot is None:
+            self._snapshot = MarketSummarySnapshot(
+                complete=self._status[0],
+                partial=self._status[1],
+                open=self._status[2],
+                cents=self._cents,
+                buckets=tuple(self._buckets),
+                seller_count=len(self._sellers),
+                active_sellers=len(self._active),
+                max_main_numbers=self._max_main_numbers,
+                price_histogram=tuple(self._histogram),
+            )
+        return self._snapshot
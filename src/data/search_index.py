@@ -0,0 +1,196 @@
+"""Inverted full-text index over article and seller fields."""
+
+import heapq
+import re
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from log import CustomLogger
+from objects import ArticleDataClass, MainNumberDataClass, SellerDataClass
+from .base import Base
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """One result of ``DataManager.search``."""
+    key: str    # "stnr12:3" or "verkaeufer:12"
+    kind: str   # "article" or "seller"
+    label: str  # one-line text for lists
+    obj: Any    # the ArticleDataClass or SellerDataClass
+
+
+class SearchIndex(Base):
+    """
+    Map case-folded words to the articles and sellers containing them.
+
+    Indexed are ``beschreibung`` and ``groesse`` of every article in the
+    ``stnr*`` tables and the name, email and phone number of every seller.
+    Documents are keyed like change log targets: ``"stnr12:3"`` for
+    articles and ``"verkaeufer:12"`` for sellers. Rows of one table that
+    share an ``artikelnummer`` share a key holding the words of all of them.
+
+    Every query word matches as a prefix; a document is a hit if it matches
+    all words. Prefixes are resolved with a binary search over the sorted
+    vocabulary, so a query costs a few dict lookups plus the size of the
+    matching postings, independent of the number of articles.
+    """
+
+    ARTICLE_FIELDS = ("beschreibung", "groesse")
+    SELLER_FIELDS = ("vorname", "nachname", "email", "telefon")
+
+    def __init__(self, tables: Iterable[MainNumberDataClass] = (), sellers: Iterable[SellerDataClass] = (),
+                 logger: Optional[CustomLogger] = None) -> None:
+        """
+        Args:
+            tables (Iterable[MainNumberDataClass]): Tables to index; only ``stnr*`` tables are used.
+            sellers (Iterable[SellerDataClass]): Sellers to index.
+            logger (Optional[CustomLogger]): Optional logger.
+        """
+        Base.__init__(self, logger)
+        self.rebuild(tables, sellers)
+
+    @staticmethod
+    def tokens(text: str) -> Set[str]:
+        """Split ``text`` into case-folded words."""
+        return set(_WORD.findall(text.casefold()))
+
+    # ------------------------------------------------------------------
+    # Building / updating
+    # ------------------------------------------------------------------
+    def rebuild(self, tables: Iterable[MainNumberDataClass], sellers: Iterable[SellerDataClass]) -> None:
+        """(Re)build the index from ``tables`` and ``sellers``."""
+        self._postings: Dict[str, Set[str]] = {}
+        self._words_by_key: Dict[str, Set[str]] = {}
+        self._order: Dict[str, tuple] = {}  # sort key per document, see _key_order
+        self._vocabulary: List[str] = []
+        self._tables: Dict[str, MainNumberDataClass] = {}
+        self._bulk = True  # leave the vocabulary alone, build it once at the end
+        for table in tables:
+            self.update_table(table)
+        for seller in sellers:
+            self.update_seller(seller)
+        self._vocabulary = sorted(self._postings)
+        self._bulk = False
+        self._log("DEBUG", f"Suchindex: {len(self._words_by_key)} Einträge, {len(self._vocabulary)} Wörter.")
+
+    def _set(self, key: str, words: Set[str]) -> None:
+        old = self._words_by_key.get(key, set())
+        if old == words:
+            return
+        for word in old - words:
+            keys = self._postings[word]
+            keys.discard(key)
+            if not keys:
+                del self._postings[word]
+                if not self._bulk:
+                    del self._vocabulary[bisect_left(self._vocabulary, word)]
+        for word in words - old:
+            keys = self._postings.get(word)
+            if keys is None:
+                keys = self._postings[word] = set()
+                if not self._bulk:
+                    insort(self._vocabulary, word)
+            keys.add(key)
+        if words:
+            self._words_by_key[key] = words
+            if key not in self._order:
+                self._order[key] = _key_order(key)
+        else:
+            self._words_by_key.pop(key, None)
+            self._order.pop(key, None)
+
+    def _article_words(self, table_name: str, article: ArticleDataClass) -> Set[str]:
+        # Rows sharing an artikelnummer share one key: index the words of all of them
+        table = self._tables.get(table_name)
+        if table is None:
+            return self.tokens(" ".join(getattr(article, name) for name in self.ARTICLE_FIELDS))
+        raw = table.raw_rows()
+        if raw is None:
+            rows = [" ".join(getattr(a, name) for name in self.ARTICLE_FIELDS)
+                    for a in table.data if a.artikelnummer == article.artikelnummer]
+        else:
+            rows = [" ".join(str(row.get(name, "")) for name in self.ARTICLE_FIELDS)
+                    for row in raw if str(row.get("artikelnummer", "")) == article.artikelnummer]
+        return self.tokens(" ".join(rows))
+
+    def update_article(self, table_name: str, article: ArticleDataClass) -> None:
+        """Re-index one article of ``table_name`` (together with rows of the same number)."""
+        self._set(f"{table_name}:{article.artikelnummer}", self._article_words(table_name, article))
+
+    def update_table(self, table: MainNumberDataClass) -> None:
+        """Re-index all articles of ``table`` (ignored for non-``stnr`` tables)."""
+        if not table.name.startswith("stnr"):
+            return
+        self._tables[table.name] = table
+        words: Dict[str, Set[str]] = {}
+        raw = table.raw_rows()
+        if raw is None:
+            for article in table.data:
+                words.setdefault(article.artikelnummer, set()).update(
+                    self.tokens(" ".join(getattr(article, name) for name in self.ARTICLE_FIELDS)))
+        else:
+            # Not opened yet: index the export rows without decoding the table
+            for row in raw:
+                words.setdefault(str(row.get("artikelnummer", "")), set()).update(
+                    self.tokens(" ".join(str(row.get(name, "")) for name in self.ARTICLE_FIELDS)))
+        for number, number_words in words.items():
+            self._set(f"{table.name}:{number}", number_words)
+
+    def update_seller(self, seller: SellerDataClass) -> None:
+        """Re-index one seller."""
+        self._set(f"verkaeufer:{seller.id}",
+                  self.tokens(" ".join(getattr(seller, name) for name in self.SELLER_FIELDS)))
+
+    def __len__(self) -> int:
+        return len(self._words_by_key)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def _prefix_keys(self, prefix: str) -> Set[str]:
+        # The vocabulary is sorted, so all words starting with prefix are adjacent
+        vocabulary = self._vocabulary
+        position = bisect_left(vocabulary, prefix)
+        matches = []
+        while position < len(vocabulary) and vocabulary[position].startswith(prefix):
+            matches.append(self._postings[vocabulary[position]])
+            position += 1
+        if len(matches) == 1:
+            return matches[0]  # shared, callers must not modify it
+        return set().union(*matches)
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Return the keys of all documents matching every word of ``query`` as prefix.
+
+        Args:
+            query (str): Search text, e.g. ``"blau hos"``.
+            limit (Optional[int]): Maximum number of keys.
+
+        Returns:
+            List[str]: Matching keys, sellers first, then articles in table order.
+        """
+        words = sorted(self.tokens(query), key=len, reverse=True)  # longest (most selective) first
+        if not words:
+            return []
+        result: Optional[Set[str]] = None
+        for word in words:
+            keys = self._prefix_keys(word)
+            result = keys if result is None else result & keys
+            if not result:
+                return []
+        if limit is not None and limit < len(result):
+            return heapq.nsmallest(limit, result, key=self._order.__getitem__)
+        return sorted(result, key=self._order.__getitem__)
+
+
+def _key_order(key: str):
+    # Sellers before articles, numbers in numeric order ("stnr2" before "stnr10")
+    name, _, number = key.partition(":")
+    prefix = name.rstrip("0123456789")
+    table = name[len(prefix):]
+    return (prefix != "verkaeufer", int(table) if table else 0,
+            int(number) if number.isdigit() else 0, key)
@@ -0,0 +1,174 @@
+"""Rule based validation of a complete market in a single pass."""
+
+import re
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from log import CustomLogger
+from objects import MainNumberDataClass, SellerDataClass, row_is_filled
+from util.price_utils import price_state, PRICE_EMPTY, PRICE_INVALID
+from .base import Base
+
+
+@dataclass(frozen=True)
+class ValidationIssue:
+    code: str
+    severity: str  # "ERROR" or "WARNING"
+    target: str    # e.g. "stnr12:3" or "verkaeufer:12"
+    message: str
+
+
+@dataclass
+class ValidationReport:
+    """
+    Result of :meth:`ValidationEngine.validate`.
+
+    Besides the list of issues the report keeps the number of valid articles
+    per table (valid = number, price and description set, as in
+    :meth:`Article.is_valid`), so callers can ask per table in O(1).
+    """
+    issues: List[ValidationIssue] = field(default_factory=list)
+    valid_articles: Dict[str, int] = field(default_factory=dict)
+    article_count: int = 0
+    seller_count: int = 0
+
+    @property
+    def ok(self) -> bool:
+        """``True`` if the report contains no errors."""
+        return not any(issue.severity == "ERROR" for issue in self.issues)
+
+    def by_code(self, code: str) -> List[ValidationIssue]:
+        return [issue for issue in self.issues if issue.code == code]
+
+    def counts(self) -> Dict[str, int]:
+        """Number of issues per code."""
+        result: Dict[str, int] = {}
+        for issue in self.issues:
+            result[issue.code] = result.get(issue.code, 0) + 1
+        return result
+
+    def table_is_valid(self, table_name: str) -> bool:
+        """A table is valid if it has at least one valid article."""
+        return self.valid_articles.get(table_name, 0) > 0
+
+    def valid_article_count(self, table_name: str) -> int:
+        return self.valid_articles.get(table_name, 0)
+
+    def format_lines(self, limit: Optional[int] = None) -> List[str]:
+        """Human readable summary (one line per issue, optionally limited)."""
+        errors = sum(1 for issue in self.issues if issue.severity == "ERROR")
+        lines = [f"Validierung: {len(self.valid_articles)} Stammnummern, {self.article_count} Artikel, "
+                 f"{self.seller_count} Verkäufer – {errors} Fehler, {len(self.issues) - errors} Warnungen"]
+        shown = self.issues if limit is None else self.issues[:limit]
+        lines.extend(f"  [{i.severity}] {i.code} {i.target}: {i.message}" for i in shown)
+        if len(shown) < len(self.issues):
+            lines.append(f"  … {len(self.issues) - len(shown)} weitere")
+        return lines
+
+
+class ArticleRule:
+    """
+    Check on a single article row.
+
+    ``test`` receives ``(artikelnummer, beschreibung, preis)`` as strings and
+    returns ``True`` if the rule is violated. Rows without description and
+    price (unused slots) are not checked.
+    """
+
+    def __init__(self, code: str, severity: str, message: str,
+                 test: Callable[[str, str, str], bool]) -> None:
+        self.code = code
+        self.severity = severity
+        self.message = message
+        self.test = test
+
+
+_PRICE_COMMA = re.compile(r"^\s*\d+,\d+\s*$")
+
+
+def _price_set(price: str) -> bool:
+    # Same rule as Article.price_valid: whitespace, "" and "None" are no price
+    return price_state(price)[1] != PRICE_EMPTY
+
+
+DEFAULT_ARTICLE_RULES: Tuple[ArticleRule, ...] = (
+    ArticleRule("PRICE_INVALID", "ERROR", "Preis ist keine Zahl",
+                lambda number, desc, price: price_state(price)[1] == PRICE_INVALID),
+    ArticleRule("PRICE_COMMA", "WARNING", "Preis mit Dezimalkomma",
+                lambda number, desc, price: _PRICE_COMMA.match(price) is not None),
+    ArticleRule("PRICE_MISSING", "WARNING", "Beschreibung ohne Preis",
+                lambda number, desc, price: bool(desc.strip()) and not _price_set(price)),
+    ArticleRule("DESCRIPTION_MISSING", "WARNING", "Preis ohne Beschreibung",
+                lambda number, desc, price: _price_set(price) and not desc.strip()),
+    ArticleRule("NUMBER_MISSING", "ERROR", "Artikelnummer fehlt",
+                lambda number, desc, price: not number.strip()),
+)
+
+
+class ValidationEngine(Base):
+    """
+    Validate sellers and stnr tables in one pass over all articles.
+
+    Article checks are :class:`ArticleRule` objects; the engine flattens them
+    into a tuple once, so validating a row is a loop over plain callables.
+    Structural checks (duplicate article numbers, stnr tables without seller,
+    sellers without table) are collected during the same pass. Tables that
+    were not decoded yet are checked on their raw rows.
+    """
+
+    def __init__(self, article_rules: Sequence[ArticleRule] = DEFAULT_ARTICLE_RULES,
+                 logger: Optional[CustomLogger] = None) -> None:
+        Base.__init__(self, logger)
+        self._rules = tuple((r.code, r.severity, r.message, r.test) for r in article_rules)
+
+    @staticmethod
+    def _rows(table: MainNumberDataClass) -> Iterable[Tuple[str, str, str]]:
+        raw = table.raw_rows()
+        if raw is None:
+            return ((a.artikelnummer, a.beschreibung, a.preis) for a in table.data)
+        return ((str(r.get("artikelnummer", "")), str(r.get("beschreibung", "")), str(r.get("preis", "")))
+                for r in raw)
+
+    def validate(self, tables: Iterable[MainNumberDataClass],
+                 sellers: Iterable[SellerDataClass]) -> ValidationReport:
+        """Check all ``stnr`` tables and ``sellers`` and return the report."""
+        report = ValidationReport()
+        issues = report.issues
+        rules = self._rules
+        table_ids = set()
+
+        for table in tables:
+            name = table.name
+            if not name.startswith("stnr"):
+                continue
+            table_ids.add(name[4:])
+            seen = set()
+            valid = 0
+            for number, desc, price in self._rows(table):
+                report.article_count += 1
+                if number in seen and number.strip():
+                    issues.append(ValidationIssue("DUPLICATE_ARTICLE_NUMBER", "ERROR", f"{name}:{number}",
+                                                  "Artikelnummer mehrfach vergeben"))
+                seen.add(number)
+                if not row_is_filled(desc, price):
+                    continue  # unused or cleared slot
+                for code, severity, message, test in rules:
+                    if test(number, desc, price):
+                        issues.append(ValidationIssue(code, severity, f"{name}:{number}", message))
+                if number.strip() and desc.strip() and _price_set(price):
+                    valid += 1
+            report.valid_articles[name] = valid
+
+        seller_ids = set()
+        for seller in sellers:
+            report.seller_count += 1
+            seller_ids.add(seller.id)
+            if seller.id not in table_ids:
+                issues.append(ValidationIssue("SELLER_WITHOUT_TABLE", "WARNING", f"verkaeufer:{seller.id}",
+                                              "Verkäufer ohne Artikelliste"))
+        for table_id in sorted(table_ids - seller_ids, key=lambda t: (len(t), t)):
+            issues.append(ValidationIssue("ORPHAN_TABLE", "WARNING", f"stnr{table_id}",
+                                          "Artikelliste ohne Verkäufer"))
+
+        self._log("DEBUG", report.format_lines(limit=0)[0])
+        return report
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 import time
-from typing import List, Optional, Sequence, Tuple
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence, Tuple
 from log import CustomLogger  # type: ignore
 from display import (
     OutputInterfaceAbstraction,                      # type: ignore
     ProgressTrackerAbstraction as _TrackerBase,      # type: ignore
+    BasicProgressTracker as _TaskTracker,            # type: ignore
 )
 try:
     from display import ProgressBarAbstraction as _BarBase
@@ -21,8 +23,12 @@ from .price_list_generator import PriceListGenerator
 from .seller_data_generator import SellerDataGenerator
 from .statistic_data_generator import StatisticDataGenerator
 from .receive_info_pdf_generator import ReceiveInfoPdfGenerator
+from .generation_snapshot import GenerationSnapshot
 from objects import CoordinatesConfig
 
+if TYPE_CHECKING:  # data imports the generators
+    from data import ValidationReport
+
 __all__ = ["FileGenerator"]
 
 
@@ -49,6 +55,9 @@ class FileGenerator(Base):  # noqa: D101 – detailed docs above
         output_interface: Optional[OutputInterfaceAbstraction] = None,
         progress_tracker: Optional[_TrackerBase] = None,
         progress_bar: Optional[_BarBase] = None,
+        max_workers: int = 1,
+        pdf_process_pool: bool = True,
+        validate: Optional[Callable[[], ValidationReport]] = None,
     ) -> None:
 
         # Housekeeping -------------------------------------------------
@@ -69,6 +78,11 @@ class FileGenerator(Base):  # noqa: D101 – detailed docs above
         self._pickup_date = pickup_date
         self._placeholder_font_family = placeholder_font_family
         self._placeholder_font_size = placeholder_font_size
+        # max_workers > 1: run the sub-generators concurrently (output_interface must be thread safe)
+        self._max_workers = max(1, int(max_workers))
+        self._pdf_process_pool = pdf_process_pool
+        # Returns the current validation report (e.g. DataManager.validate); decides which tables are valid
+        self._validate = validate
 
         self._tasks: List[Tuple[str, object]] = []
 
@@ -77,9 +91,22 @@ class FileGenerator(Base):  # noqa: D101 – detailed docs above
         self._path.mkdir(parents=True, exist_ok=True)
         self._log("debug", f"Output path: {self._path.resolve()}")
 
+    def _build_snapshot(self) -> Optional[GenerationSnapshot]:
+        """Walk the market once for all sub-generators (validation, totals, seller names)."""
+        start = time.time()
+        try:
+            report = self._validate() if self._validate is not None else None
+            snapshot = GenerationSnapshot.from_market(self._fm, report)
+        except Exception as err:  # sub-generators report the problem themselves
+            self._log("warning", f"Marktdaten konnten nicht erfasst werden: {err}")
+            return None
+        self._log("debug", f"Marktdaten erfasst: {len(snapshot.entries)} Stammnummern "
+                           f"({len(snapshot.valid_entries)} gültig) in {time.time() - start:.3f}s.")
+        return snapshot
+
     def _build_tasks(self) -> List[Tuple[str, object]]:
-        """Erzeuge die Liste aller Sub‑Generatoren."""
-        common = dict(fleat_market_data=self._fm, path=str(self._path))
+        """Erzeuge die Liste aller Sub‑Generatoren (gemeinsamer Markt-Snapshot)."""
+        common = dict(fleat_market_data=self._fm, path=str(self._path), snapshot=self._build_snapshot())
         return [
             ("Verkäuferdaten", SellerDataGenerator(**common, file_name=self._seller_file_name)),
             ("Preisliste", PriceListGenerator(**common, file_name=self._price_list_file_name)),
@@ -132,21 +159,24 @@ class FileGenerator(Base):  # noqa: D101 – detailed docs above
         start = time.time()
         success = True
 
-        for name, task in tasks: 
-            self._output("INFO", f"→ {name} …")
-            step_ok = True
-            try:
-                task.generate(overall_tracker=self._tracker)
-            except Exception as err:  # pragma: no cover
-                self._output("ERROR", f"Fehler in Schritt '{name}': {err}")
-                step_ok = success = False
-                if self._tracker and hasattr(self._tracker, "set_error"):
-                    self._tracker.set_error(err)  # type: ignore[misc]
-            finally:
-                if self._tracker and hasattr(self._tracker, "increment"):
-                    self._tracker.increment()  # type: ignore[misc]
-                self._update_bar()
-            self._output("INFO" if step_ok else "ERROR", f"← {name} {'ok' if step_ok else 'fehlgeschlagen'}")
+        if self._max_workers > 1 and len(tasks) > 1:
+            success = self._run_tasks_concurrently(tasks)
+        else:
+            for name, task in tasks:
+                self._output("INFO", f"→ {name} …")
+                step_ok = True
+                try:
+                    task.generate(overall_tracker=self._tracker)
+                except Exception as err:  # pragma: no cover
+                    self._output("ERROR", f"Fehler in Schritt '{name}': {err}")
+                    step_ok = success = False
+                    if self._tracker and hasattr(self._tracker, "set_error"):
+                        self._tracker.set_error(err)  # type: ignore[misc]
+                finally:
+                    if self._tracker and hasattr(self._tracker, "increment"):
+                        self._tracker.increment()  # type: ignore[misc]
+                    self._update_bar()
+                self._output("INFO" if step_ok else "ERROR", f"← {name} {'ok' if step_ok else 'fehlgeschlagen'}")
 
         duration = time.time() - start
         if success:
@@ -158,6 +188,62 @@ class FileGenerator(Base):  # noqa: D101 – detailed docs above
             if self._bar:
                 self._bar.complete(success=False)  # type: ignore[misc]
 
+    def _run_tasks_concurrently(self, tasks: List[Tuple[str, DataGenerator]]) -> bool:
+        """
+        Run ``tasks`` in a thread pool of ``max_workers`` threads.
+
+        The writers only read the shared, frozen generation snapshot and
+        write to different files, so the output equals the sequential run.
+        Each task reports into its own tracker, which is merged into the
+        overall tracker on this thread as soon as the task finishes, so the
+        progress bar moves with every completed file. With
+        ``pdf_process_pool`` the PDF pages are rendered in one separate
+        process.
+
+        Returns:
+            bool: ``True`` if all tasks succeeded.
+        """
+        pdf_pool = None
+        if self._pdf_process_pool and any(isinstance(task, ReceiveInfoPdfGenerator) for _, task in tasks):
+            try:
+                pdf_pool = ProcessPoolExecutor(max_workers=1)
+            except (OSError, NotImplementedError) as err:  # pragma: no cover - e.g. no multiprocessing support
+                self._log("warning", f"Kein Prozess-Pool für die PDF verfügbar: {err}")
+
+        success = True
+        try:
+            with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="generator") as pool:
+                running = {}
+                for name, task in tasks:
+                    if isinstance(task, ReceiveInfoPdfGenerator):
+                        task.render_executor = pdf_pool
+                    task_tracker = _TaskTracker(total=1)
+                    self._output("INFO", f"→ {name} …")
+                    running[pool.submit(task.generate, overall_tracker=task_tracker)] = (name, task_tracker)
+
+                for future in as_completed(running):
+                    name, task_tracker = running[future]
+                    step_ok = True
+                    try:
+                        future.result()
+                    except Exception as err:  # pragma: no cover
+                        task_tracker.set_error(err)
+                        self._output("ERROR", f"Fehler in Schritt '{name}': {err}")
+                    if task_tracker.has_error:
+                        step_ok = success = False
+                        if self._tracker and hasattr(self._tracker, "set_error"):
+                            self._tracker.set_error(task_tracker.error)  # type: ignore[misc]
+                    if self._tracker and hasattr(self._tracker, "increment"):
+                        # the task's own step plus the step the sequential loop adds
+                        self._tracker.increment(task_tracker.current + 1)  # type: ignore[misc]
+                    self._update_bar()
+                    self._output("INFO" if step_ok else "ERROR",
+                                 f"← {name} {'ok' if step_ok else 'fehlgeschlagen'}")
+        finally:
+            if pdf_pool is not None:
+                pdf_pool.shutdown()
+        return success
+
     # ------------------------------------------------------------------
     # Public entry point
     # ------------------------------------------------------------------
@@ -0,0 +1,97 @@
+"""Frozen view of a market as consumed by the file generators."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from util.price_utils import PRICE_OK
+
+__all__ = ["GenerationEntry", "GenerationSnapshot"]
+
+_UNKNOWN = "Unbekannt"
+
+
+@dataclass(frozen=True)
+class GenerationEntry:
+    """One main number as seen by the generators."""
+    name: str                       # table name, e.g. "stnr12"
+    number: Optional[int]           # 12, None if the name is not "stnr<int>"
+    valid: bool                     # at least one valid article
+    article_quantity: int           # number of valid articles
+    total_cents: int                # sum of the valid articles' prices
+    prices: Tuple[Tuple[str, str], ...] = ()  # (artikelnummer, preis) of valid articles with a parsable price
+    invalid_prices: Tuple[str, ...] = ()      # artikelnummer of valid articles whose price is not a number
+    first_name: str = _UNKNOWN
+    last_name: str = _UNKNOWN
+    has_seller: bool = False
+
+
+@dataclass(frozen=True)
+class GenerationSnapshot:
+    """
+    Result of a single pass over a :class:`FleatMarket` for all file generators.
+
+    :meth:`from_market` validates every main number once (or reads it from
+    the cached validation report), resolves its
+    seller by stnr id and collects the figures the writers need (article
+    count, cents total, price list rows). ``FileGenerator`` builds one
+    snapshot per run and hands it to every sub-generator, so the seller
+    list, price list, statistic file and PDF no longer walk the market and
+    join sellers on their own.
+    """
+    entries: Tuple[GenerationEntry, ...] = ()
+    skipped: int = 0  # objects in main_numbers() that are not main numbers
+
+    @property
+    def valid_entries(self) -> Tuple[GenerationEntry, ...]:
+        return tuple(entry for entry in self.entries if entry.valid)
+
+    @classmethod
+    def from_market(cls, fleat_market, report=None) -> "GenerationSnapshot":
+        """
+        Walk ``fleat_market`` once and freeze what the generators need.
+
+        Args:
+            fleat_market (FleatMarket): Market with loaded sellers and main numbers.
+            report (Optional[ValidationReport]): Cached validation report of the same data
+                (``DataManager.validate``); decides which main numbers are valid. Without it
+                every main number is checked with ``is_valid()``.
+
+        Returns:
+            GenerationSnapshot: Entries in the order of ``fleat_market.main_numbers()``.
+        """
+        entries = []
+        skipped = 0
+        for main_number in fleat_market.main_numbers():
+            if not all(hasattr(main_number, attr) for attr in ("is_valid", "number", "valid_article_prices",
+                                                                "article_total_cents")):
+                skipped += 1
+                continue
+            if report is not None:
+                valid = report.table_is_valid(str(main_number.name))
+            else:
+                valid = bool(main_number.is_valid())
+            # Prices were parsed by the main number (or the owner's article index)
+            articles = main_number.valid_article_prices() if valid else []
+            prices = []
+            invalid_prices = []
+            for article, _, status in articles:
+                if status == PRICE_OK:
+                    prices.append((str(article.artikelnummer), str(article.preis)))
+                else:
+                    invalid_prices.append(str(article.artikelnummer))
+            seller = fleat_market.seller_for(main_number)
+            entries.append(GenerationEntry(
+                name=str(main_number.name),
+                number=main_number.number(),
+                valid=valid,
+                article_quantity=len(articles),
+                total_cents=main_number.article_total_cents() if valid else 0,
+                prices=tuple(prices),
+                invalid_prices=tuple(invalid_prices),
+                first_name=getattr(seller, "vorname", _UNKNOWN),
+                last_name=getattr(seller, "nachname", _UNKNOWN),
+                has_seller=seller is not None,
+            ))
+        return cls(tuple(entries), skipped)
@@ -18,8 +18,8 @@ except Exception:  # pragma: no cover - optional dependency
 from display import BasicProgressTracker as ProgressTracker
 
 from .data_generator import DataGenerator
+from .generation_snapshot import GenerationSnapshot
 from objects import FleatMarket  # type: ignore
-from objects import MainNumber  # type: ignore
 
 
 
@@ -28,10 +28,17 @@ class PriceListGenerator(DataGenerator):  # noqa: D101 – detailed docs above
 
     # ------------------------------------------------------------------
     def __init__(self, fleat_market_data: FleatMarket, *,path: str | Path = "", file_name: str = "preisliste",
-                 logger: Optional[CustomLogger] = None, output_interface: Optional[OutputInterfaceAbstraction] = None) -> None:
+                 logger: Optional[CustomLogger] = None, output_interface: Optional[OutputInterfaceAbstraction] = None,
+                 snapshot: Optional[GenerationSnapshot] = None) -> None:
 
         super().__init__(path, file_name, logger, output_interface)
         self._fleat_market = fleat_market_data
+        self._snapshot = snapshot  # shared market pass of FileGenerator, built on demand otherwise
+
+    def _generation_snapshot(self) -> GenerationSnapshot:
+        if self._snapshot is None:
+            self._snapshot = GenerationSnapshot.from_market(self._fleat_market)
+        return self._snapshot
 
     # ------------------------------------------------------------------
     # Helpers
@@ -49,20 +56,21 @@ class PriceListGenerator(DataGenerator):  # noqa: D101 – detailed docs above
     def _collect_lines(self, tracker: Optional[_TrackerBase] = None) -> List[str]:
         """Collect formatted price list lines."""
         lines: list[str] = []
-        skipped = 0
-        for main_number in self._fleat_market.main_numbers():
-            if not (getattr(main_number, "is_valid", lambda: False)() and hasattr(main_number, "valid_articles")):
+        snapshot = self._generation_snapshot()
+        skipped = snapshot.skipped
+        for entry in snapshot.entries:
+            if not entry.valid or entry.number is None:
                 skipped += 1
                 continue
-            main_number_int = str(main_number.number())
-            #for art in getattr(mn, "valid_articles", []):
-            for article in main_number.valid_articles():
-                if not getattr(article, "is_valid", lambda: False)():
-                    skipped += 1
-                    continue
+            main_number_int = str(entry.number)
+            # Valid articles with a parsable price, collected once in the snapshot
+            for article_number in entry.invalid_prices:
+                self._output_and_log("WARNING", f"Stammnummer {main_number_int}, Artikel {article_number}: "
+                                                f"Preis ist keine Zahl. Übersprungen.")
+            skipped += len(entry.invalid_prices)
+            for article_number, price in entry.prices:
                 try:
-                    line = self._format_entry(main_number_int, str(article.number()), str(article.price()))
-                    lines.append(line)
+                    lines.append(self._format_entry(main_number_int, article_number, price))
                 except Exception:  # pragma: no cover – lenient parsing
                     skipped += 1
             if tracker is not None:
@@ -96,7 +104,7 @@ class PriceListGenerator(DataGenerator):  # noqa: D101 – detailed docs above
         """Generate the price list file."""
 
         self._output_and_log("INFO", "Starte Preislisten‑Generierung …")
-        total = len(self._fleat_market.main_numbers()) + 1
+        total = len(self._generation_snapshot().entries) + 1
         tracker = ProgressTracker()
         if hasattr(tracker, "reset"):
             tracker.reset(total=total)  # type: ignore[misc]
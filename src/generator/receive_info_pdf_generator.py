@@ -2,9 +2,12 @@ from __future__ import annotations
 
 """PDF generator for receive confirmations."""
 
+from concurrent.futures import Executor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import List, Optional, Sequence, Tuple
 import io
+import pickle
 
 from log import CustomLogger
 
@@ -30,6 +33,7 @@ from util.font_utils import register_font
 from reportlab.lib.units import mm
 from reportlab.lib import colors
 from .data_generator import DataGenerator
+from .generation_snapshot import GenerationSnapshot
 from objects import CoordinatesConfig
 from display import BasicProgressTracker as ProgressTracker
 
@@ -104,13 +108,16 @@ class ReceiveInfoPdfGenerator(DataGenerator):  # noqa: D101 – see module docst
         font_size: int = 12,
         logger: Optional[CustomLogger] = None,
         output_interface: Optional[OutputInterfaceAbstraction] = None,
+        snapshot: Optional[GenerationSnapshot] = None,
     ):
-        """Initialize the PDF generator."""
+        """Initialize the PDF generator (``snapshot``: shared market pass of ``FileGenerator``)."""
 
         opath = Path(output_name)
         super().__init__(path, opath.stem, logger, output_interface)
 
         self._fleat_market_data = fleat_market_data
+        self._snapshot = snapshot
+        self._render_executor: Optional[Executor] = None
         self._template_path = Path(pdf_template) if pdf_template else None
         self._coords: List[CoordinatesConfig] = coordinates or self.DEFAULT_COORDS
         self._display_dpi = display_dpi
@@ -177,6 +184,15 @@ class ReceiveInfoPdfGenerator(DataGenerator):  # noqa: D101 – see module docst
     def output_pdf(self, value: str | Path) -> None:
         self._output_pdf = Path(value)
 
+    @property
+    def render_executor(self) -> Optional[Executor]:
+        """Process pool that renders the pages (``None``: render in the calling thread)."""
+        return self._render_executor
+
+    @render_executor.setter
+    def render_executor(self, value: Optional[Executor]) -> None:
+        self._render_executor = value
+
     @property
     def pickup_date(self) -> str:
         """Date string inserted into the PDF."""
@@ -210,20 +226,12 @@ class ReceiveInfoPdfGenerator(DataGenerator):  # noqa: D101 – see module docst
     # ------------------------------------------------------------------
     def _seller_rows(self) -> List[Tuple[str, str, str]]:  # noqa: D401
         rows: list[Tuple[str, str, str]] = []
-        for idx, main_number in enumerate(self._fleat_market_data.main_numbers()):
-            if not getattr(main_number, "is_valid", lambda: False)():
-                continue
-            try:
-                number = str(int(main_number.number()))
-            except Exception:
+        snapshot = self._snapshot or GenerationSnapshot.from_market(self._fleat_market_data)
+        date = self._pickup_date or "TEST DATUM"
+        for entry in snapshot.entries:
+            if not entry.valid or entry.number is None:
                 continue  # silently skip invalid numbers
-            try:
-                seller = self._fleat_market_data.seller_at(idx)
-                name = f"{getattr(seller, 'nachname', 'Unbekannt')}, {getattr(seller, 'vorname', 'Unbekannt')}"
-            except Exception:
-                name = "Unbekannt, Unbekannt"
-            date = self._pickup_date or "TEST DATUM"
-            rows.append((name, number, date))
+            rows.append((f"{entry.last_name}, {entry.first_name}", str(entry.number), date))
         return rows
 
     # ------------------------------------------------------------------
@@ -272,11 +280,14 @@ class ReceiveInfoPdfGenerator(DataGenerator):  # noqa: D101 – see module docst
     # ------------------------------------------------------------------
     # Persistence
     # ------------------------------------------------------------------
-    def _write_pdf(self, writer: "PdfWriter") -> bool:  # noqa: D401
+    def _write_pdf(self, writer: "PdfWriter | bytes") -> bool:  # noqa: D401
         try:
             self._output_pdf.parent.mkdir(parents=True, exist_ok=True)
             with self._output_pdf.open("wb") as fh:
-                writer.write(fh)
+                if isinstance(writer, bytes):
+                    fh.write(writer)  # rendered by the process pool
+                else:
+                    writer.write(fh)
             self._output_and_log(
                 "INFO", f"PDF geschrieben: {self._output_pdf.relative_to(Path.cwd())}"
             )
@@ -317,10 +328,46 @@ class ReceiveInfoPdfGenerator(DataGenerator):  # noqa: D101 – see module docst
     ) -> None:
         """Generate pages and write them to disk."""
 
+        if self._render_executor is not None:
+            rendered = self._render_in_pool(rows, template, tracker)
+            if rendered is not None:
+                if not tracker.has_error:
+                    self._write_pdf(rendered)
+                return
         writer = self._create_writer(rows, template, tracker)
         if not tracker.has_error:
             self._write_pdf(writer)
 
+    def _render_settings(self) -> dict:
+        """Constructor arguments that reproduce the page layout in another process."""
+        return dict(
+            pdf_template=str(self._template_path or ""),
+            coordinates=list(self._coords),
+            display_dpi=self._display_dpi,
+            font_name=self._font_name,
+            font_size=self._font_size,
+        )
+
+    def _render_in_pool(
+        self,
+        rows: Sequence[Tuple[str, str, str]],
+        template: bytes,
+        tracker: ProgressTrackerAbstraction,
+    ) -> Optional[bytes]:
+        """Render the PDF in :attr:`render_executor`; ``None`` if the pool is unusable."""
+        try:
+            future = self._render_executor.submit(_render_pdf_bytes, list(rows), template, self._render_settings())
+            data = future.result()
+        except (BrokenProcessPool, OSError, pickle.PicklingError) as err:
+            self._output_and_log("WARNING", f"PDF-Prozess nicht verfügbar ({err}) – rendere im aktuellen Prozess.")
+            return None
+        except Exception as err:
+            tracker.set_error(err)
+            return b""
+        # One step per page, as in _create_writer
+        tracker.increment((len(rows) + self._entries_per_page - 1) // self._entries_per_page)
+        return data
+
     # ------------------------------------------------------------------
     # Public orchestration
     # ------------------------------------------------------------------
@@ -392,3 +439,15 @@ class ReceiveInfoPdfGenerator(DataGenerator):  # noqa: D101 – see module docst
 
         if overall_tracker:
             overall_tracker.increment()  # type: ignore[attr-defined]
+
+
+def _render_pdf_bytes(rows: List[Tuple[str, str, str]], template: bytes, settings: dict) -> bytes:
+    """Render all pages into PDF bytes (runs in a worker process, see ``render_executor``)."""
+    generator = ReceiveInfoPdfGenerator(None, **settings)
+    tracker = ProgressTracker()
+    writer = generator._create_writer(rows, template, tracker)
+    if tracker.has_error:
+        raise RuntimeError(f"PDF konnte nicht erstellt werden: {tracker.error}")
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
@@ -4,7 +4,7 @@ from typing import List, Optional
 import time
 
 from log import CustomLogger
-from objects import FleatMarket, Seller
+from objects import FleatMarket
 from display import ProgressTrackerAbstraction
 from display import OutputInterfaceAbstraction
 try:
@@ -17,6 +17,8 @@ except Exception:  # pragma: no cover - optional dependency
     _ConsoleBar = None  # type: ignore
 from display import BasicProgressTracker as ProgressTracker
 from .data_generator import DataGenerator
+from .generation_snapshot import GenerationSnapshot
+from util.price_utils import format_cents
 
 
 class SellerDataGenerator(DataGenerator):
@@ -25,16 +27,19 @@ class SellerDataGenerator(DataGenerator):
     FILE_SUFFIX = 'dat'
 
     def __init__(self, fleat_market_data: FleatMarket, path: str = '', file_name: str = 'kundendaten',
-                 logger: Optional[CustomLogger] = None, output_interface: Optional[OutputInterfaceAbstraction] = None):
+                 logger: Optional[CustomLogger] = None, output_interface: Optional[OutputInterfaceAbstraction] = None,
+                 snapshot: Optional[GenerationSnapshot] = None):
         
-        """ Initializes the SellerDataGenerator with data, path, name, logger, and output interface. """
+        """ Initializes the SellerDataGenerator with data, path, name, logger, and output interface.
+        ``snapshot`` is the shared market pass of ``FileGenerator`` (built from the market if omitted). """
         super().__init__(path, file_name, logger, output_interface)  # Pass both
         self.__fleat_market_data = fleat_market_data
+        self.__snapshot = snapshot
         # self.logger, self.output_interface inherited
 
-    def __create_entry(self, main_number: int, article_quantity: int, article_total_value: float) -> str:
-        """ Creates a formatted entry: "main_number","B",quantity,total_value """
-        return f'"{main_number}","B",{article_quantity},{article_total_value:.2f}\n'.replace('.', ',')
+    def __create_entry(self, main_number: int, article_quantity: int, article_total_cents: int) -> str:
+        """ Creates a formatted entry: "main_number","B",quantity,total_value (decimal comma) """
+        return f'"{main_number}","B",{article_quantity},{format_cents(article_total_cents, ",")}\n'
 
     def write(
         self,
@@ -83,8 +88,8 @@ class SellerDataGenerator(DataGenerator):
         processed_count = 0
 
         try:
-            all_main_numbers_data = self.__fleat_market_data.main_numbers()
-            total_items = len(all_main_numbers_data)
+            snapshot = self.__snapshot or GenerationSnapshot.from_market(self.__fleat_market_data)
+            total_items = len(snapshot.entries)
             tracker = ProgressTracker()
             tracker.reset(total=total_items + 1)
             if hasattr(self.output_interface, "set_secondary_tracker"):
@@ -94,7 +99,7 @@ class SellerDataGenerator(DataGenerator):
                     pass
         except AttributeError:
             # Critical error
-            err_msg = "FleatMarket Objekt hat keine Methode 'number_list'. Breche ab."
+            err_msg = "FleatMarket Objekt hat keine Methode 'main_numbers'. Breche ab."
             self._output_and_log("ERROR", err_msg)
             if overall_tracker and isinstance(overall_tracker, ProgressTrackerAbstraction):
                 overall_tracker.set_error(AttributeError("Fehlende Methode in FleatMarket"))
@@ -109,83 +114,48 @@ class SellerDataGenerator(DataGenerator):
                 overall_tracker.increment()
             return
 
-        for index, main_number_data in enumerate(all_main_numbers_data):
+        if snapshot.skipped:
+            self._output_and_log("WARNING", f"{snapshot.skipped} unerwartete Datenobjekte übersprungen.")
+            invalid_cnt += snapshot.skipped
+
+        # Validity, totals and seller names come from the shared snapshot (one pass for all generators)
+        for entry in snapshot.entries:
             processed_count += 1
             # Progress update - use _log for frequent messages
             self._log("DEBUG", f"Verarbeite Verkäufer-Eintrag {processed_count}/{total_items}...")
 
-            # Data structure checks - use _output_and_log for warnings about unexpected structure
-            if not all([hasattr(main_number_data, 'is_valid'),
-                        hasattr(main_number_data, 'number'),
-                        hasattr(main_number_data, 'article_quantity'),
-                        hasattr(main_number_data, 'article_total')]):  # Corrected check
-                self._output_and_log("WARNING", f"Unerwartetes Datenobjekt bei Index {index}. Übersprungen.")
-                invalid_cnt += 1
-                continue
-
-            main_number_val = main_number_data.number()
-            first_name, second_name = "Unbekannt", "Unbekannt"
-            try:
-                seller: Seller = self.__fleat_market_data.seller_at(index)
-                if hasattr(seller, 'vorname') and hasattr(seller, 'nachname'):
-                    first_name = seller.vorname
-                    second_name = seller.nachname
-            except IndexError:
+            if not entry.has_seller:
                 # Error: Missing seller for a potentially valid entry
                 self._output_and_log(
-                    "ERROR", f"Kein Verkäufer für Index {index} (Hauptnummer {main_number_val}) gefunden. Übersprungen.")
-                invalid_cnt += 1
-                continue
-            except AttributeError:
-                # Critical error: Missing method on main data object
-                err_msg = "FleatMarket Objekt hat keine Methode 'get_seller_list'. Breche Schleife ab."
-                self._output_and_log("ERROR", err_msg)
-                invalid_cnt += total_items - processed_count + 1
-                if overall_tracker:
-                    overall_tracker.set_error(AttributeError("Missing get_seller_list"))
-                break
-            except Exception as e:
-                # Unexpected error fetching seller
-                self._output_and_log(
-                    "ERROR", f"Unerwarteter Fehler beim Holen von Verkäuferdaten für Index {index}: {e}. Übersprungen.")
+                    "ERROR", f"Kein Verkäufer für Hauptnummer {entry.number} ({entry.name}) gefunden. Übersprungen.")
                 invalid_cnt += 1
+                if tracker is not None:
+                    tracker.increment()
                 continue
 
-            # Internal check logging
-            # self._log("DEBUG", f">> Prüfe Eintrag: {second_name}, {first_name} ({main_number_val})")
-
-            if main_number_data.is_valid():
-                try:
-                    m_n = int(main_number_val)
-                    a_q = int(main_number_data.article_quantity())
-                    a_t_val = main_number_data.article_total()
-                    a_t = float(a_t_val) if a_t_val is not None else 0.0
+            first_name, second_name = entry.first_name, entry.last_name
+            if entry.valid:
+                if entry.number is None:
+                    # Data conversion errors are important warnings/errors
+                    self._output_and_log("ERROR", f"Datenkonvertierungsfehler für Hauptnummer {entry.name}: keine Zahl")
+                    invalid_cnt += 1
+                else:
+                    m_n = entry.number
+                    a_q = entry.article_quantity
+                    a_t_cents = entry.total_cents
+                    a_t = a_t_cents / 100
 
-                    entry = self.__create_entry(m_n, a_q, a_t)
-                    output_data.append(entry)
+                    output_data.append(self.__create_entry(m_n, a_q, a_t_cents))
                     valid_cnt += 1
                     # Log successful processing at DEBUG level
                     self._output_and_log(
                         "INFO", f">> Verkäufer-Eintrag (OK): {first_name} {second_name}, MNr: {m_n}, Artikel: {a_q}, Wert: {a_t:.2f} EUR")
-                except (ValueError, TypeError) as e:
-                    # Data conversion errors are important warnings/errors
-                    self._output_and_log("ERROR", f"Datenkonvertierungsfehler für Hauptnummer {main_number_val}: {e}")
-                    invalid_cnt += 1
-                except Exception as e:
-                    # Unexpected errors during processing
-                    self._output_and_log("ERROR", f"Unerwarteter Fehler bei gültigem Eintrag {main_number_val}: {e}")
-                    invalid_cnt += 1
             else:
                 invalid_cnt += 1
-                m_n_str = str(main_number_val)
-                a_q_val = main_number_data.article_quantity()
-                a_t_val = main_number_data.article_total()
-                a_q_str = str(a_q_val) if a_q_val is not None else "N/A"
-                a_t_str = f"{float(a_t_val):.2f} EUR" if a_t_val is not None and isinstance(
-                    a_t_val, (int, float)) else "N/A"  # Added type check
                 # Log skipped invalid entries at WARNING level, maybe also output if user needs to know why counts differ
                 self._output_and_log(
-                    "WARNING", f">> Verkäufer-Eintrag (UNGÜLTIG): {first_name} {second_name}, MNr: {m_n_str}, Artikel: {a_q_str}, Wert: {a_t_str}. Übersprungen.")
+                    "WARNING", f">> Verkäufer-Eintrag (UNGÜLTIG): {first_name} {second_name}, MNr: {entry.number}, "
+                               f"Artikel: {entry.article_quantity}, Wert: {entry.total_cents / 100:.2f} EUR. Übersprungen.")
 
             if tracker is not None:
                 tracker.increment()
@@ -17,6 +17,7 @@ except Exception:  # pragma: no cover - optional dependency
     _ConsoleBar = None  # type: ignore
 from display import BasicProgressTracker as ProgressTracker
 from .data_generator import DataGenerator
+from .generation_snapshot import GenerationSnapshot
 
 
 class StatisticDataGenerator(DataGenerator):
@@ -25,11 +26,14 @@ class StatisticDataGenerator(DataGenerator):
     FILE_SUFFIX = 'dat'
 
     def __init__(self, fleat_market_data: FleatMarket, path: str = '', file_name: str = 'statistic_data',
-                 logger: Optional[CustomLogger] = None, output_interface: Optional[OutputInterfaceAbstraction] = None):
+                 logger: Optional[CustomLogger] = None, output_interface: Optional[OutputInterfaceAbstraction] = None,
+                 snapshot: Optional[GenerationSnapshot] = None):
         
-        """ Initializes the StatisticDataGenerator with data, path, name, logger, and output interface. """
+        """ Initializes the StatisticDataGenerator with data, path, name, logger, and output interface.
+        ``snapshot`` is the shared market pass of ``FileGenerator`` (built from the market if omitted). """
         super().__init__(path, file_name, logger, output_interface)  # Pass both
         self.__fleat_market_data = fleat_market_data
+        self.__snapshot = snapshot
        
 
     def __create_entry(self, main_number: int) -> str:
@@ -82,9 +86,9 @@ class StatisticDataGenerator(DataGenerator):
         invalid_cnt = 0
 
         try:
-            all_main_numbers_data = self.__fleat_market_data.main_numbers()
+            snapshot = self.__snapshot or GenerationSnapshot.from_market(self.__fleat_market_data)
             tracker = ProgressTracker()
-            tracker.reset(total=len(all_main_numbers_data) + 1)
+            tracker.reset(total=len(snapshot.entries) + 1)
             if hasattr(self.output_interface, "set_secondary_tracker"):
                 try:
                     self.output_interface.set_secondary_tracker(tracker)  # type: ignore[attr-defined]
@@ -92,7 +96,7 @@ class StatisticDataGenerator(DataGenerator):
                     pass
         except AttributeError:
             # Critical error
-            err_msg = "FleatMarket Objekt hat keine Methode 'get_main_number_list'. Breche ab."
+            err_msg = "FleatMarket Objekt hat keine Methode 'main_numbers'. Breche ab."
             self._output_and_log("ERROR", err_msg)
             if overall_tracker and isinstance(overall_tracker, ProgressTrackerAbstraction):
                 overall_tracker.set_error(AttributeError("Fehlende Methode in FleatMarket"))
@@ -107,32 +111,22 @@ class StatisticDataGenerator(DataGenerator):
                 overall_tracker.increment()
             return
 
-        for main_number_data in all_main_numbers_data:
+        if snapshot.skipped:
             # Data structure check - potentially relevant warning
-            if not all([hasattr(main_number_data, 'is_valid'),
-                        hasattr(main_number_data, 'number')]):
-                self._output_and_log("WARNING", "Unerwartetes Datenobjekt in Hauptnummernliste gefunden. Übersprungen.")
-                invalid_cnt += 1
-                continue
+            self._output_and_log("WARNING", f"{snapshot.skipped} unerwartete Datenobjekte in Hauptnummernliste übersprungen.")
+            invalid_cnt += snapshot.skipped
 
-            if main_number_data.is_valid():
-                try:
-                    main_number = int(main_number_data.number())
-                    entry = self.__create_entry(main_number)
-                    output_data.append(entry)
-                    valid_cnt += 1
-                except (ValueError, TypeError) as e:
-                    # Data conversion error
-                    self._output_and_log(
-                        "ERROR", f"Hauptnummer nicht als Zahl interpretierbar: {main_number_data.number()}. Fehler: {e}. Übersprungen.")
-                    invalid_cnt += 1
-                except Exception as e:
-                    # Unexpected processing error
-                    self._output_and_log(
-                        "ERROR", f"Unerwarteter Fehler bei gültiger Hauptnummer {main_number_data.number()}: {e}. Übersprungen.")
-                    invalid_cnt += 1
-            else:
+        for entry in snapshot.entries:
+            if not entry.valid:
                 invalid_cnt += 1
+            elif entry.number is None:
+                # Data conversion error
+                self._output_and_log(
+                    "ERROR", f"Hauptnummer nicht als Zahl interpretierbar: {entry.name}. Übersprungen.")
+                invalid_cnt += 1
+            else:
+                output_data.append(self.__create_entry(entry.number))
+                valid_cnt += 1
 
             if tracker is not None:
                 tracker.increment()
@@ -11,6 +11,8 @@ from version import get_version
 from data import Base
 from data import BaseData
 from data import MarketFacade
+from data import ArticleIndex
+from data import MarketSummary
 from objects import SellerDataClass
 from objects import MainNumberDataClass
 from objects import FleatMarket
@@ -140,9 +142,19 @@ def _run_cli(parsed: Arguments):  # noqa: D401
     try:
         Base(logger=logger, output_interface=out)  # type: ignore[call‑arg]
         base_data = BaseData(data_file, logger=logger)  # type: ignore[arg‑type]
-        base_data.verify_data()
+        report = base_data.verify_data()
+        if parsed.validate:
+            lines = report.format_lines() if report else ["Validierung fehlgeschlagen"]
+            print("\n".join(lines))
+            sys.exit(0 if report and report.ok else 1)
         sellers: List[SellerDataClass] = base_data.get_seller_as_list()  # type: ignore[assignment]
         main_numbers: List[MainNumberDataClass] = base_data.get_main_number_as_list()  # type: ignore[assignment]
+        settings = base_data.get_settings()
+        max_raw = str(settings.data[0].max_stammnummern) if settings.data else ""
+        index = ArticleIndex(main_numbers)
+        summary = MarketSummary(index, sellers, int(max_raw) if max_raw.isdigit() else 0)
+        for line in summary.snapshot().format_lines():
+            logger.info(line)
     except FileNotFoundError:
         (out or logger).error("Datendatei nicht gefunden: %s", data_file)  # type: ignore[attr‑defined]
         sys.exit(1)
@@ -151,8 +163,7 @@ def _run_cli(parsed: Arguments):  # noqa: D401
         sys.exit(1)
 
     fm = FleatMarket()  # type: ignore[call‑arg]
-    fm.load_sellers(sellers)
-    fm.load_main_numbers(main_numbers)
+    fm.load_view(sellers, main_numbers, prices_of=index.table_prices)
 
     gen = FileGenerator(  # type: ignore[call‑arg]
         fleat_market_data=fm,
@@ -164,6 +175,8 @@ def _run_cli(parsed: Arguments):  # noqa: D401
         pdf_output_file_name=parsed.pdf_output,
         progress_tracker=tracker,
         progress_bar=bar,
+        max_workers=parsed.workers,
+        validate=base_data.validate,
     )
 
     try:
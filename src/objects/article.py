@@ -7,11 +7,29 @@ from data import Base
 from log import CustomLogger  # type: ignore
 from display import OutputInterfaceAbstraction  # type: ignore
 from .data_class_definition import ArticleDataClass
+from util.price_utils import price_state, PRICE_EMPTY
 
-__all__ = ["Article"]
+__all__ = ["Article", "article_is_valid"]
+
+_DATA_FIELDS = frozenset(f.name for f in dataclasses.fields(ArticleDataClass))
+
+
+def article_is_valid(article: ArticleDataClass, price_status: Optional[int] = None) -> bool:
+    """Validity rule of :meth:`Article.is_valid` for any ArticleDataClass (number, price and description set).
+
+    ``price_status`` is the already parsed status of ``article.preis``; it is parsed here if omitted.
+    """
+    if price_status is None:
+        price_status = price_state(article.preis)[1]
+    return bool(str(article.artikelnummer).strip() and str(article.beschreibung).strip()
+                and price_status != PRICE_EMPTY)
 
 
 class Article(ArticleDataClass, Base):  # noqa: D101 – Detailed docs above
+    # Slotted like ArticleDataClass: one record per article, no per-instance __dict__.
+    # preis_cents / preis_status are derived from ``preis`` whenever it is assigned.
+    __slots__ = ("_owner", "preis_cents", "preis_status")
+
     # ------------------------------------------------------------------
     # Construction helpers
     # ------------------------------------------------------------------
@@ -26,6 +44,30 @@ class Article(ArticleDataClass, Base):  # noqa: D101 – Detailed docs above
         if info is not None:
             self.set_article_info(info)
 
+    @classmethod
+    def from_values(cls, *values: str) -> "Article":
+        """Create an article directly from its field values (in dataclass field order)."""
+        article = cls.__new__(cls)
+        ArticleDataClass.__init__(article, *values)
+        return article
+
+    def __setattr__(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+        if name == "preis":
+            # Parse once here; totals and formatting use the integer cents
+            cents, status = price_state(value)
+            object.__setattr__(self, "preis_cents", cents)
+            object.__setattr__(self, "preis_status", status)
+        # Changing a data field invalidates the cached figures of the owning MainNumber
+        if name in _DATA_FIELDS:
+            owner = getattr(self, "_owner", None)
+            if owner is not None:
+                owner.invalidate()
+
+    def set_owner(self, owner) -> None:
+        """Register the object (a :class:`MainNumber`) to notify when a data field changes."""
+        object.__setattr__(self, "_owner", owner)
+
     # ------------------------------------------------------------------
     # Data loading
     # ------------------------------------------------------------------
@@ -58,8 +100,7 @@ class Article(ArticleDataClass, Base):  # noqa: D101 – Detailed docs above
         return bool(self.number() and str(self.number()).strip())
 
     def price_valid(self) -> bool:  # noqa: D401
-        p = self.price()
-        return bool(p and str(p).strip() and str(p) != "None")
+        return self.preis_status != PRICE_EMPTY
 
     def description_valid(self) -> bool:  # noqa: D401
         d = self.description()
@@ -1,5 +1,7 @@
+import sys
 from dataclasses import dataclass,field, fields
-from typing import List, Optional
+from operator import itemgetter
+from typing import Any, Callable, Iterable, List, Optional, Tuple
 
 
 @dataclass
@@ -75,7 +77,7 @@ class SettingDataClass:
        #elif not isinstance(self.data, SettingsContentDataClass):
        #    raise TypeError("data must be a SettingsDataClassList or a dict")
 
-@dataclass
+@dataclass(slots=True)
 class ArticleDataClass:
     artikelnummer: str = ""
     beschreibung: str = ""
@@ -84,31 +86,183 @@ class ArticleDataClass:
     created_at: str = ""
     updated_at: str = ""
 
+class RowDecoder:
+    """
+    Bulk converter for the ``data`` array of a phpMyAdmin table.
+
+    For every row type a specialised loop is compiled once (similar to how
+    :mod:`dataclasses` generates ``__init__``): the fields are pulled with a
+    single ``operator.itemgetter`` call, and rows whose values are all ``str``
+    go straight into the constructor. Rows with missing keys or non-string
+    values fall back to ``dict.get(name, '')`` + ``str()``, so the result is
+    identical to converting each row on its own.
+
+    Fields listed in ``intern`` are passed through :func:`sys.intern`; values
+    like sizes or timestamps repeat across thousands of rows and then share
+    one string object. ``factory`` replaces ``cls`` as constructor (called
+    with the field values in order).
+    """
+
+    def __init__(self, cls: type, intern: Iterable[str] = (),
+                 factory: Optional[Callable[..., Any]] = None) -> None:
+        self.cls = cls
+        self.names: Tuple[str, ...] = tuple(f.name for f in fields(cls))
+        self.intern = frozenset(intern)
+        self.factory = factory or cls
+        self._decode = self._compile()
+
+    def _compile(self) -> Callable[[Iterable[Any]], list]:
+        args = [f"f{i}" for i in range(len(self.names))]
+        target = args[0] if len(args) == 1 else ", ".join(args)
+        same_type = " is ".join(["_str"] + [f"type({a})" for a in args])
+        interned = [name in self.intern for name in self.names]
+
+        def wrap(expr: str, use_intern: bool) -> str:
+            return f"_intern({expr})" if use_intern else expr
+
+        direct = ", ".join(wrap(a, i) for a, i in zip(args, interned))
+        converted = ", ".join(wrap(f"_str({a})", i) for a, i in zip(args, interned))
+        fallback = ", ".join(wrap(f"_str(row.get({name!r}, ''))", i) for name, i in zip(self.names, interned))
+        source = (
+            "def decode(rows):\n"
+            "    out = []\n"
+            "    append = out.append\n"
+            "    for row in rows:\n"
+            "        if not isinstance(row, dict):\n"
+            "            append(row)\n"
+            "            continue\n"
+            "        try:\n"
+            f"            {target} = extract(row)\n"
+            "        except KeyError:\n"
+            f"            append(cls({fallback}))\n"
+            "            continue\n"
+            f"        if {same_type}:\n"
+            f"            append(cls({direct}))\n"
+            "        else:\n"
+            f"            append(cls({converted}))\n"
+            "    return out\n"
+        )
+        namespace = {
+            "cls": self.factory,
+            "extract": itemgetter(*self.names),
+            "_str": str,
+            "_intern": sys.intern,
+        }
+        exec(source, namespace)
+        return namespace["decode"]
+
+    def decode(self, rows: Iterable[Any]) -> list:
+        """Convert every ``dict`` in ``rows``; other entries are kept unchanged."""
+        return self._decode(rows)
+
+# Sizes, prices and timestamps repeat across the rows of a market
+ARTICLE_INTERNED_FIELDS = ("groesse", "preis", "created_at", "updated_at")
+_ARTICLE_DECODER = RowDecoder(ArticleDataClass, intern=ARTICLE_INTERNED_FIELDS)
+
+
+def decode_article_rows(rows: Iterable[Any]) -> List[ArticleDataClass]:
+    """Convert a stnr table's ``data`` array into :class:`ArticleDataClass` instances."""
+    return _ARTICLE_DECODER.decode(rows)
+
+
+class LazyRows:
+    """
+    Data descriptor for a table's ``data`` field that decodes on first access.
+
+    Assigning a list of raw ``dict`` rows (as read from the export) only
+    stores it; the rows are converted with ``decode`` when ``data`` is read
+    for the first time. Any other value is stored unchanged. Used as a
+    dataclass field default, the class-level access returns ``None`` and the
+    generated ``__init__`` assigns an empty list.
+    """
+
+    def __init__(self, decode: Callable[[Iterable[Any]], list]) -> None:
+        self._decode = decode
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._value_key = f"_{name}"
+        self._raw_key = f"_{name}_raw"
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return None
+        state = obj.__dict__
+        raw = state.pop(self._raw_key, None)
+        if raw is not None:
+            state[self._value_key] = self._decode(raw)
+        return state[self._value_key]
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        state = obj.__dict__
+        if value is None:
+            value = []
+        if isinstance(value, list) and value and isinstance(value[0], dict):
+            state.pop(self._value_key, None)
+            state[self._raw_key] = value
+        else:
+            state.pop(self._raw_key, None)
+            state[self._value_key] = value
+
+    def raw(self, obj: Any) -> Optional[list]:
+        """Return the undecoded rows of ``obj`` or ``None`` if already decoded."""
+        return obj.__dict__.get(self._raw_key)
+
+
+CLEARED_PRICE = "0.00"  # preis of rows emptied by DataManager.delete_article / delete_article_list
+
+
+def row_is_filled(beschreibung: Any, preis: Any) -> bool:
+    """True if a row has a description or a price; cleared rows (no description, :data:`CLEARED_PRICE`) are empty."""
+    if str(beschreibung or "").strip():
+        return True
+    return preis not in (None, "", "None", CLEARED_PRICE)
+
+
+@dataclass
+class TableSummary:
+    """Row counts of one table (see ``MainNumberDataClass.summary``)."""
+    rows: int = 0
+    filled: int = 0  # rows with description or price (see row_is_filled)
+
+
+@dataclass(frozen=True)
+class TableStats:
+    """Article figures of one stnr table (see ``DataManager.get_table_stats``)."""
+    complete: int = 0  # description and price
+    partial: int = 0   # description or price
+    open: int = 0      # neither
+    cents: int = 0     # sum of all valid prices
+
+    @property
+    def total(self) -> int:
+        return self.complete + self.partial + self.open
+
+    @property
+    def price_sum(self) -> float:
+        return self.cents / 100
+
+
 @dataclass
 class MainNumberDataClass:
     type: str = "table"
     name: str = ""
     database: str = ""
-    data: List[ArticleDataClass] = field(default_factory=list)
+    data: List[ArticleDataClass] = LazyRows(decode_article_rows)
 
-    def __post_init__(self):
-        converted_articles = []
-        for article in self.data:
-            if isinstance(article, dict):
-                converted_article = ArticleDataClass(
-                    artikelnummer=str(article.get('artikelnummer', '')),
-                    beschreibung=str(article.get('beschreibung', '')),
-                    groesse=str(article.get('groesse', '')),
-                    preis=str(article.get('preis', '')),
-                    created_at=str(article.get('created_at', '')),
-                    updated_at=str(article.get('updated_at', ''))
-                )
-                converted_articles.append(converted_article)
-            else:
-                converted_articles.append(article)
-        self.data = converted_articles
+    def raw_rows(self) -> Optional[List[dict]]:
+        """Return the rows as read from the export if ``data`` was not accessed yet, else ``None``."""
+        return type(self).__dict__["data"].raw(self)
 
-@dataclass
+    def summary(self) -> TableSummary:
+        """Row count and number of filled rows, computed without decoding the rows."""
+        raw = self.raw_rows()
+        if raw is None:
+            filled = sum(1 for a in self.data if row_is_filled(a.beschreibung, a.preis))
+            return TableSummary(len(self.data), filled)
+        filled = sum(1 for row in raw if row_is_filled(row.get("beschreibung", ""), row.get("preis", "")))
+        return TableSummary(len(raw), filled)
+
+@dataclass(slots=True)
 class SellerDataClass:
     id: str = ""
     vorname: str = ""
@@ -127,23 +281,7 @@ class SellerListDataClass:
     data: List[SellerDataClass] = field(default_factory=list)
 
     def __post_init__(self):
-        converted_sellers = []
-        for seller in self.data:
-            if isinstance(seller, dict):
-                converted_seller = SellerDataClass(
-                    id=str(seller.get('id', '')),
-                    vorname=str(seller.get('vorname', '')),
-                    nachname=str(seller.get('nachname', '')),
-                    telefon=str(seller.get('telefon', '')),
-                    email=str(seller.get('email', '')),
-                    passwort=str(seller.get('passwort', '')),
-                    created_at=str(seller.get('created_at', '')),
-                    updated_at=str(seller.get('updated_at', ''))
-                )
-                converted_sellers.append(converted_seller)
-            else:
-                converted_sellers.append(seller)
-        self.data = converted_sellers
+        self.data = decode_seller_rows(self.data)
 
 @dataclass
 class JSONData:
@@ -152,3 +290,11 @@ class JSONData:
     settings: SettingDataClass
     main_numbers_list: List[MainNumberDataClass]
     sellers: SellerListDataClass
+
+
+_SELLER_DECODER = RowDecoder(SellerDataClass, intern=("created_at", "updated_at"))
+
+
+def decode_seller_rows(rows: Iterable[Any]) -> List[SellerDataClass]:
+    """Convert the ``verkaeufer`` table's ``data`` array into :class:`SellerDataClass` instances."""
+    return _SELLER_DECODER.decode(rows)
@@ -1,16 +1,26 @@
 from __future__ import annotations
-from typing import List, Optional, Sequence
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Union
 from log import CustomLogger  # type: ignore
 from display import OutputInterfaceAbstraction  # type: ignore
 from data import Base
-from .data_class_definition import SellerDataClass, MainNumberDataClass
+from .data_class_definition import SellerDataClass, MainNumberDataClass, ArticleDataClass
 from .seller import Seller
-from .main_number import MainNumber
+from .main_number import MainNumber, MainNumberView
+from .article import Article
 
 
 
 class FleatMarket(Base):  # noqa: D101 – Docstring below
-    """Container object managing :class:`Seller` and :class:`MainNumber` sets."""
+    """Container object managing :class:`Seller` and :class:`MainNumber` sets.
+
+    Sellers and main numbers are indexed by id when they are loaded, so
+    :meth:`seller_by_id`, :meth:`main_number_by_stnr`, :meth:`seller_for` and
+    :meth:`article` join them by key in O(1) instead of by list position.
+
+    :meth:`load_sellers` / :meth:`load_main_numbers` copy the data into
+    business objects; :meth:`load_view` wraps existing data classes instead
+    (no copy, always the current state).
+    """
 
     # ------------------------------------------------------------------
     # Construction helpers
@@ -21,6 +31,8 @@ class FleatMarket(Base):  # noqa: D101 – Docstring below
 
         self._sellers: List[Seller] = []
         self._main_numbers: List[MainNumber] = []
+        self._seller_index: Dict[str, Seller] = {}
+        self._main_number_index: Dict[str, MainNumber] = {}
 
         self._log("info", "FleatMarket initialised.")
    
@@ -29,6 +41,7 @@ class FleatMarket(Base):  # noqa: D101 – Docstring below
         self._log("debug", f"Loading {len(data)} seller entries …")
         try:
             self._sellers = [ Seller(s) for s in data ]
+            self._index_sellers()
 
             self._log("info", f"{len(self._sellers)} sellers loaded.")
         except Exception as err:  # pragma: no cover – defensive
@@ -40,11 +53,43 @@ class FleatMarket(Base):  # noqa: D101 – Docstring below
         self._log("debug", f"Loading {len(data)} main‑number entries …")
         try:
             self._main_numbers = [ MainNumber(m) for m in data]
+            self._index_main_numbers()
             self._log("info", f"{len(self._main_numbers)} main numbers loaded.")
         except Exception as err:  # pragma: no cover
             self._log("error", "Failed to load main numbers", exc=err)
             self._echo("USER_ERROR:", "Fehler beim Laden der Hauptnummern – siehe Log.")
 
+    def load_view(self, sellers: Sequence[SellerDataClass], main_numbers: Sequence[MainNumberDataClass],
+                  version_of: Optional[Callable[[str], Hashable]] = None,
+                  prices_of: Optional[Callable[[str], Optional[Tuple[List[int], List[int]]]]] = None
+                  ) -> None:  # noqa: D401
+        """Use *sellers* and *main_numbers* directly instead of copies.
+
+        The seller data classes are used as they are; every table is wrapped
+        in a :class:`MainNumberView` whose cached figures are keyed by
+        ``version_of(table name)`` (see ``DataManager.table_version``) and
+        whose prices are read from ``prices_of(table name)`` (see
+        ``DataManager.table_prices``). Edits of the wrapped objects are
+        visible without reloading. Adding or removing sellers or tables needs
+        a new :meth:`load_view`.
+        """
+        self._sellers = list(sellers)
+        self._main_numbers = [MainNumberView(m, version_of, prices_of) for m in main_numbers]
+        self._index_sellers()
+        self._index_main_numbers()
+        self._log("info", f"View: {len(self._sellers)} sellers, {len(self._main_numbers)} main numbers.")
+
+    def _index_sellers(self) -> None:
+        self._seller_index = {}
+        for seller in self._sellers:
+            self._seller_index.setdefault(str(seller.id), seller)  # first seller wins on duplicate ids
+
+    def _index_main_numbers(self) -> None:
+        self._main_number_index = {}
+        for main_number in self._main_numbers:
+            if isinstance(main_number.name, str) and main_number.name.startswith("stnr"):
+                self._main_number_index.setdefault(main_number.name[4:], main_number)
+
     def sellers(self) ->  List[Seller]:
         """Immutable view of loaded sellers."""
         return self._sellers
@@ -66,4 +111,69 @@ class FleatMarket(Base):  # noqa: D101 – Docstring below
             return self._sellers[index]
         except IndexError:
             self._log("warning",f"Seller index {index} out of range (max {len(self._sellers) - 1}).")
-            return None
\ No newline at end of file
+            return None
+
+    # Keyed lookups -------------------------------------------------------
+    @staticmethod
+    def _stnr_key(stnr: Union[int, str]) -> str:
+        key = str(stnr)
+        return key[4:] if key.startswith("stnr") else key
+
+    def seller_by_id(self, seller_id: Union[int, str]) -> Optional[Seller]:
+        """Return the seller with id *seller_id* or ``None``."""
+        return self._seller_index.get(str(seller_id))
+
+    def main_number_by_stnr(self, stnr: Union[int, str]) -> Optional[MainNumber]:
+        """Return the main number ``stnr<stnr>`` (``12``, ``"12"`` or ``"stnr12"``) or ``None``."""
+        return self._main_number_index.get(self._stnr_key(stnr))
+
+    def seller_for(self, main_number: MainNumber) -> Optional[Seller]:
+        """Return the seller owning *main_number* (same id as the stnr number) or ``None``."""
+        name = getattr(main_number, "name", "")
+        if not isinstance(name, str) or not name.startswith("stnr"):
+            return None
+        seller = self._seller_index.get(name[4:])
+        if seller is None:
+            self._log("warning", f"Kein Verkäufer für {name} gefunden.")
+        return seller
+
+    def article(self, stnr: Union[int, str], artikelnummer: Union[int, str]) -> Optional[Article]:
+        """Return article *artikelnummer* of main number *stnr* or ``None``."""
+        main_number = self.main_number_by_stnr(stnr)
+        return main_number.article_by_number(artikelnummer) if main_number is not None else None
+
+    # Incremental updates -------------------------------------------------
+    def apply_change(self, kind: str, target: str, obj: Any = None) -> None:
+        """Apply one edit reported by ``DataManager.data_changed`` in place.
+
+        Only the affected main number (and article) is touched: views drop
+        their cached figures, copied objects take over the new values from
+        *obj*. Sellers or tables that are not loaded are ignored; settings
+        are not part of the FleatMarket.
+
+        Args:
+            kind (str): ``"article"``, ``"table"``, ``"seller"``, ``"settings"`` or
+                ``"batch"`` (*obj* is then the list of ``(kind, target, obj)`` edits).
+            target (str): ``"stnr1:5"``, ``"stnr1"`` or the seller id.
+            obj (Any): The changed data class.
+        """
+        if kind == "batch":
+            for change in obj or ():
+                self.apply_change(*change)
+        elif kind in ("article", "table"):
+            stnr, _, artikelnummer = target.partition(":")
+            main_number = self.main_number_by_stnr(stnr)
+            if main_number is None:
+                self._log("debug", f"Änderung an {target} ignoriert (nicht geladen).")
+            elif isinstance(main_number, MainNumberView):
+                main_number.invalidate()
+            elif kind == "article" and isinstance(obj, ArticleDataClass):
+                article = main_number.article_by_number(artikelnummer)
+                if article is not None and article is not obj:
+                    article.set_article_info(obj)  # the article invalidates its main number
+            elif isinstance(obj, MainNumberDataClass):
+                main_number.set_main_number_info(obj)
+        elif kind == "seller":
+            seller = self.seller_by_id(target)
+            if seller is not None and obj is not None and seller is not obj:
+                seller.set_seller_info(obj)
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Callable, Dict, Hashable, List, Optional, Tuple, Union
 import dataclasses
 from data import Base
 from log import CustomLogger  # type: ignore
 from display import OutputInterfaceAbstraction  # type: ignore
-from .data_class_definition import MainNumberDataClass, ArticleDataClass
+from .data_class_definition import MainNumberDataClass, ArticleDataClass, RowDecoder, ARTICLE_INTERNED_FIELDS
 from objects import Article
+from .article import article_is_valid
+from util.price_utils import price_state
 
-__all__ = ["MainNumber"]
+__all__ = ["MainNumber", "MainNumberView"]
+
+# Builds Article records straight from export rows (no intermediate ArticleDataClass)
+_ARTICLE_RECORD_DECODER = RowDecoder(ArticleDataClass, intern=ARTICLE_INTERNED_FIELDS, factory=Article.from_values)
 
 
 class MainNumber(MainNumberDataClass, Base):
@@ -32,6 +37,10 @@ class MainNumber(MainNumberDataClass, Base):
 
         # 3. Runtime‑only state ------------------------------------------------------
         self._articles: List[Article] = []
+        # Valid articles and their total in cents, valid while _version is unchanged
+        self._version: int = 0
+        self._cache: Optional[Tuple[int, List[Article], int, List[Tuple[int, int]]]] = None
+        self._by_number: Optional[Dict[str, Article]] = None  # built on first article lookup
 
         # 4. Load initial data (if provided) -----------------------------------------
         if main_number_info is not None:
@@ -50,14 +59,23 @@ class MainNumber(MainNumberDataClass, Base):
 
         # Copy dataclass fields efficiently (works even if *info* is a plain obj).
         for fld in dataclasses.fields(info):
-            setattr(self, fld.name, getattr(info, fld.name))
-
-        # Convert raw *ArticleDataClass* entries into rich *Article* objects.
-        raw_articles = getattr(info, "data", []) or []
-        self._articles = [
-            Article(a)
-            for a in raw_articles
-        ]
+            if fld.name != "data":
+                setattr(self, fld.name, getattr(info, fld.name))
+
+        # Convert the rows into rich *Article* objects. Undecoded export rows are
+        # converted directly, so *info* stays undecoded and no ArticleDataClass
+        # copies are created.
+        raw_rows = info.raw_rows()
+        if raw_rows is not None:
+            self._articles = _ARTICLE_RECORD_DECODER.decode(raw_rows)
+        else:
+            self._articles = [Article(a) for a in (info.data or [])]
+        # ``data`` and ``_articles`` share one list of records
+        self.data = self._articles
+        self._by_number = None
+        for article in self._articles:
+            article.set_owner(self)
+        self.invalidate()
         self._log("DEBUG", f"Loaded {len(self._articles)} article(s) for '{self.name}'.")
 
     # ------------------------------------------------------------------
@@ -72,30 +90,75 @@ class MainNumber(MainNumberDataClass, Base):
                 pass  # fallthrough → None
         return None
 
-    def valid_articles(self) -> List[Article]:
-        """List of *valid* :class:`Article` instances."""
-        err_cnt = 0
-        lst = []
-        for a in self._articles:
-            if a.is_valid():
-                lst.append(a)
-            else:
-                err_cnt += 1
+    def article_by_number(self, artikelnummer: Union[int, str]) -> Optional[Article]:
+        """Return the article with *artikelnummer* or ``None`` (first one on duplicates)."""
+        if self._by_number is None:
+            self._by_number = {}
+            for article in self._articles:
+                self._by_number.setdefault(str(article.artikelnummer), article)
+        return self._by_number.get(str(artikelnummer))
+
+    def invalidate(self) -> None:
+        """Drop the cached valid articles and totals (called when an article changes)."""
+        self._version += 1
+        self._cache = None
+
+    # Hooks for _valid_state (overridden by MainNumberView) -------------
+    def _cache_key(self) -> Hashable:
+        return self._version
+
+    def _article_prices(self, articles: List[Article]) -> List[Tuple[int, int]]:
+        # Prices were parsed into integer cents when the articles were built
+        return [(a.preis_cents, a.preis_status) for a in articles]
+
+    @staticmethod
+    def _article_valid(article: Article, price_status: int) -> bool:
+        return article.is_valid()
+
+    def _valid_state(self) -> Tuple[List[Article], int, List[Tuple[int, int]]]:
+        """Validate every article once per :meth:`_cache_key`; return valid articles, cents total and prices."""
+        cache = self._cache
+        key = self._cache_key()
+        if cache is not None and cache[0] == key:
+            return cache[1], cache[2], cache[3]
+        articles = self._articles
+        is_valid = self._article_valid
+        lst: List[Article] = []
+        prices: List[Tuple[int, int]] = []
+        for article, price in zip(articles, self._article_prices(articles)):
+            if is_valid(article, price[1]):
+                lst.append(article)
+                prices.append(price)
+        err_cnt = len(articles) - len(lst)
         if err_cnt > 0:
             self._log("DEBUG", f" {err_cnt} ungültige Artikel gefunden.")
             #self._echo("DEBUG", f" {err_cnt} ungültige Artikel gefunden.")
-        
-        return lst
+        cents = sum(c for c, _ in prices)
+        self._cache = (key, lst, cents, prices)
+        return lst, cents, prices
+
+    def valid_articles(self) -> List[Article]:
+        """List of *valid* :class:`Article` instances."""
+        return list(self._valid_state()[0])
+
+    def valid_article_prices(self) -> List[Tuple[Article, int, int]]:
+        """Valid articles with their price in cents and its status (``PRICE_OK`` or ``PRICE_INVALID``)."""
+        lst, _, prices = self._valid_state()
+        return [(article, cents, status) for article, (cents, status) in zip(lst, prices)]
 
     def article_quantity(self) -> int:
         """Number of valid articles."""
-        qty = len(self.valid_articles())
+        qty = len(self._valid_state()[0])
         self._log("DEBUG", f"'{self.name}': {qty} gültige Artikel gezählt (gesamt {len(self._articles)}).")
         return qty
 
+    def article_total_cents(self) -> int:
+        """Total price of valid articles in cents."""
+        return self._valid_state()[1]
+
     def article_total(self) -> float:
         """Total price of valid articles (rounded to 2 decimals)."""
-        total = round(sum(float(a.price()) for a in self.valid_articles()), 2)
+        total = self._valid_state()[1] / 100
         self._log("DEBUG", f"'{self.name}': Gesamtwert der Artikel = {total:.2f} €.")
         return total
 
@@ -109,4 +172,79 @@ class MainNumber(MainNumberDataClass, Base):
             self._echo("NOTICE:", f"Stammnummer:{self.number()}: Keine gültigen Artikel gefunden – bitte prüfen.")
         return flag
 
-    
\ No newline at end of file
+
+class MainNumberView(MainNumber):
+    """:class:`MainNumber` over an existing :class:`MainNumberDataClass` without copying it.
+
+    ``name``, ``data`` … are read from the wrapped table and the articles are
+    the table's own :class:`ArticleDataClass` instances, so the view always
+    shows the current (edited) state. Results are cached per
+    ``version_of(table name)``; the owner of the data (``DataManager.table_version``)
+    must return a new value after the table changed. Without ``version_of``
+    the cache is only dropped by :meth:`invalidate`.
+
+    ``prices_of(table name)`` returns the already parsed cents and price
+    status per row (``DataManager.table_prices``, ``ArticleIndex.table_prices``);
+    without it, or if it does not match the row count, the prices are parsed
+    on every recompute.
+    """
+
+    def __init__(self, table: MainNumberDataClass, version_of: Optional[Callable[[str], Hashable]] = None,
+                 prices_of: Optional[Callable[[str], Optional[Tuple[List[int], List[int]]]]] = None, *,
+                 logger: Optional[CustomLogger] = None,
+                 output_interface: Optional[OutputInterfaceAbstraction] = None):
+        # No MainNumber.__init__: nothing is copied from *table*
+        Base.__init__(logger, output_interface)
+        self._table = table
+        self._version_of = version_of
+        self._prices_of = prices_of
+        self._version: int = 0
+        self._cache: Optional[Tuple[Hashable, List[ArticleDataClass], int, List[Tuple[int, int]]]] = None
+        self._by_number: Optional[Dict[str, ArticleDataClass]] = None
+        self._by_number_source: Optional[List[ArticleDataClass]] = None
+
+    type = property(lambda self: self._table.type)
+    name = property(lambda self: self._table.name)
+    database = property(lambda self: self._table.database)
+
+    @property
+    def data(self) -> List[ArticleDataClass]:
+        return self._table.data
+
+    @property
+    def _articles(self) -> List[ArticleDataClass]:
+        return self._table.data
+
+    def raw_rows(self) -> Optional[List[dict]]:
+        return self._table.raw_rows()
+
+    def summary(self):
+        return self._table.summary()
+
+    def article_by_number(self, artikelnummer: Union[int, str]) -> Optional[ArticleDataClass]:
+        # The owner may replace the table's article list (copy-on-write undo)
+        if self._by_number_source is not self._table.data:
+            self._by_number = None
+            self._by_number_source = self._table.data
+        return MainNumber.article_by_number(self, artikelnummer)
+
+    def set_main_number_info(self, info: MainNumberDataClass) -> None:  # noqa: D401
+        """Wrap *info* instead of the current table."""
+        self._table = info
+        self.invalidate()
+        self._by_number = None
+
+    def _cache_key(self) -> Hashable:
+        if self._version_of is None:
+            return self._version
+        return self._version, self._version_of(self._table.name)
+
+    def _article_prices(self, articles: List[ArticleDataClass]) -> List[Tuple[int, int]]:
+        prices = self._prices_of(self._table.name) if self._prices_of is not None else None
+        if prices is not None and len(prices[0]) == len(articles):
+            return list(zip(*prices))
+        return [price_state(a.preis) for a in articles]
+
+    @staticmethod
+    def _article_valid(article: ArticleDataClass, price_status: int) -> bool:
+        return article_is_valid(article, price_status)
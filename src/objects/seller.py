@@ -1,14 +1,20 @@
+from dataclasses import fields
+
 from .data_class_definition import SellerDataClass
 
 
 class Seller(SellerDataClass): 
+    __slots__ = ()
 
     def __init__(self, seller_info: SellerDataClass = None):
         if seller_info:
             self.set_seller_info(seller_info)
+        else:
+            # Slotted: the fields have no class-level defaults to fall back on
+            SellerDataClass.__init__(self)
 
     def set_seller_info(self, seller_info: SellerDataClass):
-        SellerDataClass.__init__(self, **seller_info.__dict__)
+        SellerDataClass.__init__(self, *(getattr(seller_info, f.name) for f in fields(SellerDataClass)))
         
     
         
@@ -7,7 +7,7 @@ from pathlib import Path
 from PySide6.QtCore import Qt, Signal, Slot
 from PySide6.QtWidgets import (
     QApplication, QTreeWidgetItem, QTableWidgetItem, QListWidget, QListWidgetItem,
-    QMenu
+    QMenu, QLineEdit
 )
 from .generated import DataViewUi  # Annahme: In __init__.py wurde der UI-Code als DataViewUi bereitgestellt.
 from .base_ui import BaseUi
@@ -49,16 +49,25 @@ class DataView(BaseUi):
         """
         self.market = market_widget
         self.listUsers = QListWidget()
+        self.searchEdit = QLineEdit()
+        self.searchEdit.setPlaceholderText("Suchen (Artikel, Verkäufer) …")
+        self.searchEdit.setClearButtonEnabled(True)
+        self.listSearch = QListWidget()
         self.setup_connections()
         self.populate_user_tree()
+        self.ui.verticalLayoutLeft.insertWidget(0, self.searchEdit)
         self.ui.verticalLayoutLeft.addWidget(self.listUsers)
+        self.ui.verticalLayoutLeft.addWidget(self.listSearch)
         self.listUsers.hide()
+        self.listSearch.hide()
 
     def setup_connections(self):
         """Connect UI widgets to their event handlers."""
         self.ui.btnToggleView.clicked.connect(self.toggle_view)
         self.ui.treeUsers.itemClicked.connect(self.user_item_clicked)
         self.listUsers.itemClicked.connect(self.user_list_item_clicked)
+        self.searchEdit.textChanged.connect(self.search)
+        self.listSearch.itemClicked.connect(self.search_item_clicked)
 
     def populate_user_tree(self):
         """Fill the tree view with aggregated sellers and their tables."""
@@ -74,6 +83,7 @@ class DataView(BaseUi):
                 name = "<Leer>"
             user_text = name
             user_item = QTreeWidgetItem([user_text])
+            user_item.setData(0, Qt.UserRole, email)  # key for user_item_clicked
             # Füge als untergeordnete Elemente die zugehörigen MainNumber-Tabellen hinzu.
             for main_number in user["stamms"]:
                 child = QTreeWidgetItem([main_number.name])
@@ -133,32 +143,46 @@ class DataView(BaseUi):
 
         if item.parent() is not None:
             # Kindelement (stnr‑Tabelle) wurde angeklickt.
-            stnr_name = item.text(0)
-            entries = None
-            users_list = self.market_widget().get_aggregated_user()
-            for user in users_list.values():
-                for main_number in user["stamms"]:
-                    if main_number.name == stnr_name:
-                        entries = main_number.data
-                        break
-                if entries is not None:
-                    break
+            main_number = self.market_widget().get_main_numbers().get(item.text(0))
+            entries = main_number.data if main_number else None
         else:
             # Verkäuferknoten wurde angeklickt: Alle zugehörigen Artikel zusammenfassen.
             entries = []
-            user_text = item.text(0)
-            users_list = self.market_widget().get_aggregated_user()
-            for user in users_list.values():
-                info = user["info"]
-                info_text = f"{info.vorname} {info.nachname}".strip()
-                if DataManager.seller_is_empty(info):
-                    info_text = "<Leer>"
-                if info_text == user_text:
-                    for main_number in user["stamms"]:
-                        entries.extend(main_number.data)
-                    break
+            user = self.market_widget().get_aggregated_user().get(item.data(0, Qt.UserRole))
+            if user is not None:
+                for main_number in user["stamms"]:
+                    entries.extend(main_number.data)
         self.populate_entry_table(entries)
 
+    @Slot(str)
+    def search(self, text):
+        """Show the articles and sellers matching *text* while typing.
+
+        Parameters
+        ----------
+        text:
+            Current content of the search field; empty hides the results.
+        """
+        self.listSearch.clear()
+        dm = self.market_widget().get_data_manager() if self.market_widget() else None
+        if not text.strip() or not dm:
+            self.listSearch.hide()
+            return
+        for hit in dm.search(text, limit=200):
+            item = QListWidgetItem(hit.label)
+            item.setData(Qt.UserRole, hit)
+            self.listSearch.addItem(item)
+        self.listSearch.show()
+
+    def search_item_clicked(self, item):
+        """Show the article or the article list of the seller of a search hit."""
+        hit = item.data(Qt.UserRole)
+        if hit.kind == "article":
+            self.populate_entry_table([hit.obj])
+            return
+        main_number = self.market_widget().get_main_numbers().get(f"stnr{hit.obj.id}")
+        self.populate_entry_table(main_number.data if main_number else [])
+
     def user_list_item_clicked(self, item):
         """Handle clicks in the plain list view.
 
@@ -137,7 +137,7 @@ class MarketSetting(PersistentBaseUi):
     @Slot()
     def _config_changed(self) -> bool:
 
-        if self._config is not None and self._config.get_data() is not None:
+        if self._config is not None and self._config.settings.data:
             ret = (self._state_to_dataclass() != self._config.settings.data[0])
             self.data_changed.emit(ret)
             return ret
@@ -31,9 +31,9 @@ class MarketStatistics(BaseUi):
         if not self.market_widget() or not self.market_widget().data_manager_ref:
             return
         dm = self.market_widget().data_manager_ref
-        tables = dm.get_main_number_tables()
-        settings = dm.get_settings()
-        max_num = 0
+        # running totals kept by the data manager; no pass over articles or sellers
+        summary = dm.get_market_summary()
+        max_num = summary.max_main_numbers
         if self.market_widget() and hasattr(self.market_widget(), "market_setting"):
             try:
                 max_num = int(
@@ -41,53 +41,16 @@ class MarketStatistics(BaseUi):
                 )
             except (TypeError, ValueError):
                 max_num = 0
-        elif settings and getattr(settings, "data", None):
-            raw = settings.data[0].max_stammnummern
-            try:
-                max_num = int(str(raw))
-            except (TypeError, ValueError):
-                max_num = 0
 
-        # collect article counts and progress for each stammnummer
-        complete = partial = open_cnt = 0
-        progress_buckets = {
-            "voll": 0,
-            "fast": 0,
-            "halb": 0,
-            "arbeit": 0,
-            "start": 0,
-        }
-        for key in tables:
-            counts = dm._article_status_counts(key)
-            comp = counts["vollstaendig"]
-            part = counts["teilweise"]
-            open_a = counts["offen"]
-            complete += comp
-            partial += part
-            open_cnt += open_a
-            tot = comp + part + open_a
-            ratio = (comp / tot) if tot else 0
-            if ratio == 1:
-                progress_buckets["voll"] += 1
-            elif ratio >= 0.75:
-                progress_buckets["fast"] += 1
-            elif ratio >= 0.50:
-                progress_buckets["halb"] += 1
-            elif ratio >= 0.25:
-                progress_buckets["arbeit"] += 1
-            else:
-                progress_buckets["start"] += 1
-        total_articles = complete + partial + open_cnt
-        sellers = dm.get_seller_as_list()
-        user_count = sum(
-            1
-            for s in sellers
-            if all(getattr(s, attr, "").strip() for attr in ("vorname", "nachname", "email"))
-        )
+        complete = summary.complete
+        partial = summary.partial
+        open_cnt = summary.open
+        progress_buckets = summary.progress_buckets()
+        total_articles = summary.total
+        user_count = summary.active_sellers
 
-        free_count = max(max_num - user_count, 0)
-        used_percent = int(user_count / max_num * 100) if max_num else 0
-        used_percent = min(used_percent, 100)
+        free_count = summary.free_main_numbers(max_num)
+        used_percent = summary.used_percent(max_num)
 
         self.ui.valueCompleteNums.setText(str(progress_buckets["voll"]))
         self.ui.valueAlmostNums.setText(str(progress_buckets["fast"]))
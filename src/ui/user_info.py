@@ -1,4 +1,5 @@
 from PySide6.QtWidgets import QTableWidgetItem
+from objects import TableStats
 from .base_ui import BaseUi
 from .generated import UserInfoUi
 
@@ -93,10 +94,8 @@ class UserInfo(BaseUi):
         dm = self.market_widget().data_manager_ref
         self.ui.tableIDs.setRowCount(len(ids))
         for row, id_ in enumerate(ids):
-            voll = dm.get_article_count(id_) if dm else 0
-            teil = dm.get_partial_article_count(id_) if dm else 0
-            offen = dm.get_open_article_count(id_) if dm else 0
-            total = dm.get_article_sum(id_) if dm else 0.0
+            stats = dm.get_table_stats(id_) if dm else TableStats()
+            voll, teil, offen, total = stats.complete, stats.partial, stats.open, stats.price_sum
             self.ui.tableIDs.setItem(row, 0, QTableWidgetItem(str(id_)))
             self.ui.tableIDs.setItem(row, 1, QTableWidgetItem(str(voll)))
             self.ui.tableIDs.setItem(row, 2, QTableWidgetItem(str(teil)))
@@ -0,0 +1,70 @@
+"""Helpers for parsing article prices."""
+
+from __future__ import annotations
+
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from functools import lru_cache
+from typing import Optional, Tuple
+
+__all__ = ["parse_price_cents", "price_state", "format_cents", "PRICE_EMPTY", "PRICE_OK", "PRICE_INVALID"]
+
+# Parse status of a price string (see price_state)
+PRICE_EMPTY = 0    # "", whitespace, None or "None"
+PRICE_OK = 1
+PRICE_INVALID = 2  # set, but not a number
+
+
+@lru_cache(maxsize=4096)
+def parse_price_cents(raw: Optional[str]) -> Optional[int]:
+    """Convert a price string into integer cents.
+
+    Accepts ``"12.5"``, ``"12,50"`` and surrounding whitespace. Fractions of a
+    cent are rounded half up. Prices repeat a lot within a market, so results
+    are memoized.
+
+    Args:
+        raw (Optional[str]): Price as stored in the export.
+
+    Returns:
+        Optional[int]: The price in cents or ``None`` if ``raw`` is empty or
+        not a number.
+    """
+    if raw is None:
+        return None
+    text = str(raw).strip().replace(",", ".")
+    if not text or text == "None":
+        return None
+    try:
+        value = Decimal(text)
+    except InvalidOperation:
+        return None
+    if not value.is_finite():
+        return None
+    return int((value * 100).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+@lru_cache(maxsize=4096)
+def price_state(raw: Optional[str]) -> Tuple[int, int]:
+    """Return ``(cents, status)`` for a price string.
+
+    ``cents`` is ``0`` unless ``status`` is :data:`PRICE_OK`.
+
+    Args:
+        raw (Optional[str]): Price as stored in the export.
+
+    Returns:
+        Tuple[int, int]: Price in cents and one of PRICE_EMPTY, PRICE_OK, PRICE_INVALID.
+    """
+    cents = parse_price_cents(raw)
+    if cents is not None:
+        return cents, PRICE_OK
+    if raw is None or str(raw).strip() in ("", "None"):
+        return 0, PRICE_EMPTY
+    return 0, PRICE_INVALID
+
+
+def format_cents(cents: int, decimal_sep: str = ".") -> str:
+    """Format integer cents as ``"12.50"`` (exact, no float rounding)."""
+    sign = "-" if cents < 0 else ""
+    whole, frac = divmod(abs(cents), 100)
+    return f"{sign}{whole}{decimal_sep}{frac:02d}"
@@ -0,0 +1,89 @@
+import json
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import pytest
+pytest.importorskip('PySide6')
+pytest.importorskip('numpy')
+
+from data.data_manager import DataManager
+from util.price_utils import parse_price_cents
+
+DATASET = Path(__file__).parent / 'test_dataset.json'
+
+
+def _legacy_counts(table):
+    counts = {"vollstaendig": 0, "teilweise": 0, "offen": 0}
+    for article in table.data:
+        desc = bool(article.beschreibung.strip())
+        preis = article.preis not in (None, "", "None")
+        if desc and preis:
+            counts["vollstaendig"] += 1
+        elif desc or preis:
+            counts["teilweise"] += 1
+        else:
+            counts["offen"] += 1
+    return counts
+
+
+@pytest.mark.parametrize('raw, cents', [
+    ('12.5', 1250), ('12,50', 1250), (' 3 ', 300), ('0.005', 1), ('', None), ('None', None), ('abc', None),
+    (None, None), ('nan', None),
+])
+def test_parse_price_cents(raw, cents):
+    assert parse_price_cents(raw) == cents
+
+
+def test_index_matches_per_table_loop():
+    dm = DataManager(json.loads(DATASET.read_text()))
+    index = dm.get_article_index()
+    tables = dm.get_main_number_tables()
+    assert index.table_names() == list(tables)
+    assert len(index) == sum(len(t.data) for t in tables.values())
+    per_table = index.status_counts_per_table()
+    for row, (name, table) in enumerate(tables.items()):
+        expected = _legacy_counts(table)
+        assert index.status_counts(name) == expected
+        assert list(per_table[row]) == list(expected.values())
+    totals = index.status_counts()
+    assert sum(totals.values()) == len(index)
+    assert list(index.price_cents_per_table()) == [index.price_sum_cents(n) for n in tables]
+    assert sum(index.progress_buckets().values()) == len(tables)
+
+
+def test_index_updated_in_place_on_edit():
+    dm = DataManager(json.loads(DATASET.read_text()))
+    index = dm.get_article_index()
+    table = dm.get_main_number_tables()['stnr1']
+    article = table.data[-1]
+    before = index.status_counts('stnr1')
+    sum_before = dm.get_article_sum('1')
+    old_cents = parse_price_cents(article.preis) or 0
+
+    dm.update_article('1', article.artikelnummer, 'Pullover', '140', '12,50')
+    assert dm.get_article_index() is index
+    assert index.status_counts('stnr1') == _legacy_counts(table)
+    assert index.status_counts('stnr1') != before
+    assert dm.get_article_sum('1') == pytest.approx(sum_before + 12.5 - old_cents / 100)
+
+    dm.delete_article_list('1')
+    assert index.status_counts('stnr1')['vollstaendig'] == 0
+    assert dm.get_article_sum('1') == 0.0
+
+
+def test_cleared_rows_count_as_open():
+    dm = DataManager(json.loads(DATASET.read_text()))
+    index = dm.get_article_index()
+    table = dm.get_main_number_tables()['stnr1']
+
+    dm.delete_article('1', '1')
+    assert index.status_counts('stnr1') == {'vollstaendig': 0, 'teilweise': 2, 'offen': 2}
+
+    dm.delete_article_list('1')
+    assert index.status_counts('stnr1') == {'vollstaendig': 0, 'teilweise': 0, 'offen': 4}
+    stats = dm.get_table_stats('1')
+    assert (stats.complete, stats.partial, stats.open) == (0, 0, 4)
+    assert dm.get_market_summary().open == 4
+    assert table.summary().filled == 0  # same rule as MainNumberDataClass.summary
@@ -6,6 +6,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
 import pytest
 pytest.importorskip('PySide6')
 
+from data.backup_store import BackupStore
 from data.data_manager import DataManager
 
 DATASET = Path(__file__).parent / 'test_dataset.json'
@@ -16,9 +17,63 @@ def test_backup_creation(tmp_path):
     target = tmp_path / 'market.json'
     dm.save(str(target))
     assert target.is_file()
+    assert BackupStore.for_file(target).latest() is None
+
+    # Saving unchanged data rewrites the same bytes: no backup, no full read
+    dm.save(str(target))
+    assert BackupStore.for_file(target).latest() is None
+
+    stnr_id = dm.main_numbers_list[0].name[4:]
+    dm.update_article(stnr_id, dm.main_numbers_list[0].data[0].artikelnummer, 'Neu', '1', '1.00')
     dm.save(str(target))
-    backup1 = tmp_path / 'market.json_1.backup'
-    assert backup1.is_file()
+    first = BackupStore.for_file(target).latest()
+    assert first is not None and first['seq'] == 1
     dm.save(str(target))
-    backup2 = tmp_path / 'market.json_2.backup'
-    assert backup2.is_file()
+    assert BackupStore.for_file(target).entries() == [first]
+
+    # A file changed by someone else is backed up before it is overwritten
+    target.write_text(target.read_text() + ' ')
+    dm.save(str(target))
+    assert [e['seq'] for e in BackupStore.for_file(target).entries()] == [1, 2]
+    assert not list(tmp_path.glob('*.backup'))
+
+
+def test_restore_returns_original_content(tmp_path):
+    source = tmp_path / 'data.json'
+    source.write_text('{"a": 1}')
+    store = BackupStore.for_file(source, compression='lzma')
+    entry = store.add(source)
+    source.write_text('{"a": 2}')
+
+    restored = tmp_path / 'restored.json'
+    assert store.restore(restored, entry['seq'])
+    assert restored.read_text() == '{"a": 1}'
+    assert entry['file'].endswith('.xz')
+
+
+def test_retention_keeps_last_and_dedups_objects(tmp_path):
+    source = tmp_path / 'data.json'
+    store = BackupStore.for_file(source, keep_last=2, keep_daily=0)
+    for value in ('1', '2', '1', '3'):
+        source.write_text(value)
+        store.add(source)
+
+    assert [e['seq'] for e in store.entries()] == [3, 4]
+    objects = sorted(p.name for p in (store.path / 'objects').iterdir())
+    assert objects == sorted(e['file'] for e in store.entries())
+
+
+def test_known_content_is_not_compressed_again(tmp_path, monkeypatch):
+    source = tmp_path / 'data.json'
+    store = BackupStore.for_file(source)
+    source.write_text('1')
+    store.add(source)
+    source.write_text('2')
+    store.add(source)
+
+    opened = []
+    monkeypatch.setitem(BackupStore._COMPRESSORS, 'gzip', ('.gz', lambda *a: opened.append(a)))
+    store.add(source)  # same as latest
+    source.write_text('1')
+    assert store.add(source)['seq'] == 3  # object of seq 1 reused
+    assert opened == []
@@ -0,0 +1,82 @@
+import json
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import pytest
+pytest.importorskip('PySide6')
+
+from data.data_manager import DataManager
+from objects import SettingsContentDataClass
+
+DATASET = Path(__file__).parent / 'test_dataset.json'
+
+
+def _manager():
+    dm = DataManager(json.loads(DATASET.read_text()))
+    dm.set_new_settings(SettingsContentDataClass(max_artikel='20'))
+    dm.reset_all_changes()
+    return dm
+
+
+def _articles(dm):
+    return [(a.beschreibung, a.groesse, a.preis) for a in dm.get_main_number_tables()['stnr1'].data]
+
+
+def test_batch_logs_one_change_and_emits_once():
+    dm = _manager()
+    before = _articles(dm)
+    stats = dm.get_table_stats('1')
+    emitted = []
+    dm.data_changed.connect(lambda kind, target, obj: emitted.append((kind, target, obj)))
+
+    with dm.batch('Preise'):
+        for number in ('1', '2', '3'):
+            dm.update_article('1', number, 'Hose', '', '2.00')
+        dm.update_article('1', '1', 'Jacke', '', '4.00')
+        dm.update_seller('1', email='neu@b.c')
+        dm.update_setting('max_artikel', '30')
+        assert emitted == []
+        assert dm.get_table_stats('1') is stats  # refreshed at commit
+
+    assert len(emitted) == 1
+    kind, target, changes = emitted[0]
+    assert kind == 'batch' and len(changes) == 5
+    assert dm.get_table_stats('1') != stats
+    log = dm.get_change_log()
+    assert [e['action'] for e in log] == ['BATCH']
+    assert len(log[0]['old_value']['changes']) == 5  # first edit per target
+
+    assert dm.reset_change(log[0]['id'])
+    assert _articles(dm) == before
+    assert dm.get_seller('1').email == 'a@b.c'
+    assert dm.settings.data[0].max_artikel == '20'
+    assert dm.get_table_stats('1') == stats
+
+
+def test_batch_rolls_back_on_error():
+    dm = _manager()
+    before = _articles(dm)
+    with pytest.raises(ValueError):
+        dm.apply_patch([
+            {'kind': 'article', 'target': '1:1', 'field': 'preis', 'value': '9.00'},
+            {'kind': 'article', 'target': '1:99', 'field': 'preis', 'value': '1.00'},
+        ])
+    assert _articles(dm) == before
+    assert dm.get_change_log() == []
+
+
+def test_apply_patch_file(tmp_path):
+    dm = _manager()
+    patch = tmp_path / 'patch.csv'
+    patch.write_text('kind;target;field;value\n'
+                     'article;stnr1:2;beschreibung;Schal\n'
+                     'article;1:2;preis;3,50\n'
+                     'seller;1;telefon;0123\n'
+                     'settings;max_artikel;;40\n', encoding='utf-8')
+    assert dm.apply_patch_file(str(patch)) == 3
+    assert _articles(dm)[1] == ('Schal', '', '3,50')
+    assert dm.get_seller('1').telefon == '0123'
+    assert dm.settings.data[0].max_artikel == '40'
+    assert len(dm.get_change_log()) == 1
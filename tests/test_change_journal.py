@@ -0,0 +1,111 @@
+import shutil
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import pytest
+pytest.importorskip('PySide6')
+
+from data.change_journal import ChangeJournal
+from data.data_manager import DataManager
+
+DATASET = Path(__file__).parent / 'test_dataset.json'
+
+
+def _copy_dataset(tmp_path):
+    target = tmp_path / 'market.json'
+    shutil.copy(DATASET, target)
+    return target
+
+
+def _first_article(dm):
+    table = dm.main_numbers_list[0]
+    return table.name[4:], table.data[0]
+
+
+def test_journal_replayed_on_open(tmp_path):
+    export = _copy_dataset(tmp_path)
+    dm = DataManager(str(export))
+    assert dm.open_journal(sync=False) == 0
+    stnr_id, article = _first_article(dm)
+    dm.update_article(stnr_id, article.artikelnummer, 'Jacke', '128', '7.50')
+    seller_id = dm.get_seller_as_list()[0].id
+    dm.delete_seller(seller_id)
+    assert ChangeJournal.for_export(export).path.is_file()
+
+    restored = DataManager(str(export))
+    assert restored.open_journal() == 2
+    _, replayed = _first_article(restored)
+    assert (replayed.beschreibung, replayed.groesse, replayed.preis) == ('Jacke', '128', '7.50')
+    assert restored.get_seller_as_list()[0].email == ''
+    assert [e['target'] for e in restored.get_change_log()] == [
+        f'stnr{stnr_id}:{article.artikelnummer}', f'verkaeufer:{seller_id}']
+    assert restored.has_unsaved_changes()
+
+
+def test_save_folds_journal_into_export(tmp_path):
+    export = _copy_dataset(tmp_path)
+    dm = DataManager(str(export))
+    dm.open_journal(sync=False)
+    stnr_id, article = _first_article(dm)
+    dm.update_article(stnr_id, article.artikelnummer, 'Hose', '110', '3.00')
+    dm.save()
+    assert not ChangeJournal.for_export(export).path.exists()
+
+    reloaded = DataManager(str(export))
+    assert reloaded.open_journal() == 0
+    assert _first_article(reloaded)[1].beschreibung == 'Hose'
+
+
+def test_truncated_journal_tail_is_dropped(tmp_path):
+    export = _copy_dataset(tmp_path)
+    dm = DataManager(str(export))
+    dm.open_journal(sync=False)
+    stnr_id, article = _first_article(dm)
+    dm.update_article(stnr_id, article.artikelnummer, 'Schuhe', '30', '4.00')
+    dm.close_journal()
+    journal = ChangeJournal.for_export(export).path
+    with open(journal, 'ab') as fh:
+        fh.write(b'{"entry": {"id"')
+    good_size = journal.stat().st_size - len(b'{"entry": {"id"')
+
+    restored = DataManager(str(export))
+    assert restored.open_journal(sync=False) == 1
+    assert journal.stat().st_size == good_size
+    assert _first_article(restored)[1].beschreibung == 'Schuhe'
+
+
+def test_journal_compacted_beyond_threshold(tmp_path, monkeypatch):
+    export = _copy_dataset(tmp_path)
+    monkeypatch.setattr(ChangeJournal, 'COMPACT_THRESHOLD', 1)
+    dm = DataManager(str(export))
+    dm.open_journal(sync=False)
+    stnr_id, article = _first_article(dm)
+    dm.update_article(stnr_id, article.artikelnummer, 'Mütze', '0', '1.00')
+    assert not ChangeJournal.for_export(export).path.exists()
+    assert _first_article(DataManager(str(export)))[1].beschreibung == 'Mütze'
+
+
+@pytest.mark.parametrize('delete', [
+    lambda dm: dm.delete_article_list('1'),
+    lambda dm: dm.delete_dataset('1'),  # snapshot inside a BATCH entry
+])
+def test_table_delete_can_be_undone_after_restart(tmp_path, delete):
+    export = _copy_dataset(tmp_path)
+    dm = DataManager(str(export))
+    dm.open_journal(sync=False)
+    values = [(a.artikelnummer, a.beschreibung, a.preis) for a in dm.get_main_number_tables()['stnr1'].data]
+    counts = dm.get_article_index().status_counts('stnr1')
+    delete(dm)
+    dm.close_journal()
+
+    restored = DataManager(str(export))
+    restored.open_journal()
+    assert len(restored.get_change_log()) == 1
+    table = restored.get_main_number_tables()['stnr1']
+    assert all(a.beschreibung == '' for a in table.data)
+
+    assert restored.reset_all_changes() == 1
+    assert [(a.artikelnummer, a.beschreibung, a.preis) for a in table.data] == values
+    assert restored.get_article_index().status_counts('stnr1') == counts
@@ -0,0 +1,60 @@
+import json
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import pytest
+pytest.importorskip('PySide6')
+
+from data.change_log import ChangeLog
+from data.data_manager import DataManager
+from objects import ChangeLogEntry
+
+DATASET = Path(__file__).parent / 'test_dataset.json'
+
+
+def _entry(id_, target, old):
+    return ChangeLogEntry(id=id_, timestamp='', action='UPDATE', target=target, description='', old_value=old)
+
+
+def test_repeated_edits_collapse_per_target():
+    log = ChangeLog()
+    log.append(_entry('a', 'stnr1:1', {'preis': '1'}))
+    log.append(_entry('b', 'stnr1:1', {'preis': '2'}))
+    log.append(_entry('c', 'stnr1:2', {'preis': '5'}))
+    assert [e.id for e in log] == ['b', 'c']
+    assert log.get('a') is None
+    assert log.old_value(log.get('b')) == {'preis': '1'}
+
+    # A later edit in the same table keeps older entries from collapsing
+    log.append(_entry('d', 'stnr1:1', {'preis': '3'}))
+    assert [e.id for e in log] == ['b', 'c', 'd']
+
+
+def test_old_values_spilled_beyond_cap():
+    log = ChangeLog(max_in_memory=2)
+    for n in range(5):
+        log.append(_entry(str(n), f'verkaeufer:{n}', {'vorname': f'V{n}'}))
+    assert log.spilled_count == 3
+    assert log.get('0').old_value is None
+    assert log.old_value(log.get('0')) == {'vorname': 'V0'}
+    assert [d['old_value']['vorname'] for d in log.as_dicts()] == ['V0', 'V1', 'V2', 'V3', 'V4']
+    log.clear()
+    assert len(log) == 0 and log.spilled_count == 0
+
+
+def test_reset_all_restores_original_state():
+    dm = DataManager(json.loads(DATASET.read_text()))
+    dm._change_log = ChangeLog(max_in_memory=1)
+    article = dm.get_main_number_tables()['stnr1'].data[0]
+    original = (article.beschreibung, article.preis)
+    for price in ('1', '2', '3'):
+        dm.update_article('1', article.artikelnummer, 'Hose', '', price)
+    dm.delete_seller('1')
+    assert len(dm.get_change_log()) == 2
+
+    assert dm.reset_all_changes() == 2
+    assert (article.beschreibung, article.preis) == original
+    assert dm.get_seller('1').vorname == 'A'
+    assert dm.get_change_log() == []
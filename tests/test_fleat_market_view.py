@@ -0,0 +1,96 @@
+import json
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import pytest
+pytest.importorskip('PySide6')
+
+from data.data_manager import DataManager
+from objects import FleatMarket
+from generator.seller_data_generator import SellerDataGenerator
+
+DATASET = Path(__file__).parent / 'test_dataset.json'
+
+
+def _view(dm):
+    fm = FleatMarket()
+    fm.load_view(dm.get_seller_as_list(), dm.get_main_number_as_list(), dm.table_version)
+    return fm
+
+
+def test_view_wraps_data_manager_objects():
+    dm = DataManager(json.loads(DATASET.read_text()))
+    table = dm.get_main_number_tables()['stnr1']
+    fm = _view(dm)
+    main_number = fm.main_number_by_stnr(1)
+    assert table.raw_rows() is not None  # building the view decodes nothing
+    assert fm.seller_by_id('1') is dm.get_seller_as_list()[0]
+    assert main_number.name == 'stnr1' and main_number.number() == 1
+    assert main_number.article_quantity() == 1
+    assert main_number.data is table.data
+    assert fm.article(1, '1') is table.data[0]
+
+
+def test_view_follows_edits_without_rebuild(tmp_path, monkeypatch):
+    dm = DataManager(json.loads(DATASET.read_text()))
+    fm = _view(dm)
+    main_number = fm.main_numbers()[0]
+    assert main_number.article_total_cents() == 1000
+    assert main_number.article_total_cents() == 1000  # cached
+
+    dm.update_article('1', '2', 'Jacke', '', '2,50')
+    assert main_number.article_quantity() == 2
+    assert main_number.article_total() == 12.5
+
+    monkeypatch.chdir(tmp_path)
+    SellerDataGenerator(fm, str(tmp_path)).generate()
+    assert (tmp_path / 'kundendaten.dat').read_text() == '"1","B",2,12,50\n'
+
+
+def test_change_events_update_only_affected_objects():
+    dm = DataManager(json.loads(DATASET.read_text()))
+    events = []
+    dm.data_changed.connect(lambda *args: events.append(args[:2]))
+
+    copy = FleatMarket()
+    copy.load_sellers(dm.get_seller_as_list())
+    copy.load_main_numbers(dm.get_main_number_tables().values())
+    dm.data_changed.connect(copy.apply_change)
+    view = FleatMarket()
+    view.load_view(dm.get_seller_as_list(), dm.get_main_number_as_list())  # no version source: events only
+    dm.data_changed.connect(view.apply_change)
+    for fm in (copy, view):
+        assert fm.main_numbers()[0].article_quantity() == 1
+
+    copied_article = copy.article(1, '2')
+    dm.update_article('1', '2', 'Jacke', '', '2,50')
+    dm.delete_seller('1')
+    assert events == [('article', 'stnr1:2'), ('seller', '1')]
+    for fm in (copy, view):
+        assert fm.main_numbers()[0].article_total_cents() == 1250
+        assert fm.seller_by_id('1').vorname == ''
+    assert copy.article(1, '2') is copied_article  # updated in place
+
+    dm.delete_article_list('1')
+    assert events[-1] == ('table', 'stnr1')
+    for fm in (copy, view):
+        assert fm.main_numbers()[0].article_quantity() == 0
+
+
+def test_observer_view_follows_edits(tmp_path):
+    from data.market_facade import MarketObserver
+    observer = MarketObserver()
+    export = tmp_path / 'market.json'
+    export.write_text(DATASET.read_text())
+    assert observer.data_manager.load(str(export))
+    observer.setup_data_generation()
+    fm = observer.fm
+    assert fm.main_numbers()[0].article_total_cents() == 1000
+    observer.data_manager.update_article('1', '2', 'Jacke', '', '1')
+    assert observer.fm is fm
+    assert fm.main_numbers()[0].article_total_cents() == 1100
+    observer.setup_data_generation()
+    observer.data_manager.update_article('1', '2', 'Jacke', '', '2')  # old view disconnected
+    assert observer.fm.main_numbers()[0].article_total_cents() == 1200
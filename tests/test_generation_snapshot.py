@@ -0,0 +1,83 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import pytest
+pytest.importorskip('PySide6')
+
+import data  # noqa: F401  (import order: data before objects.main_number)
+from data import ValidationEngine
+from objects import FleatMarket, MainNumber, MainNumberDataClass, SellerDataClass
+from generator.generation_snapshot import GenerationSnapshot
+from generator.price_list_generator import PriceListGenerator
+from generator.seller_data_generator import SellerDataGenerator
+from generator.statistic_data_generator import StatisticDataGenerator
+
+
+def _market():
+    fm = FleatMarket()
+    fm.load_sellers([SellerDataClass(id='2', vorname='Bea', nachname='Berg')])
+    fm.load_main_numbers([
+        MainNumberDataClass(name='stnr1', data=[{'artikelnummer': '1', 'beschreibung': '', 'preis': '3'}]),
+        MainNumberDataClass(name='stnr2', data=[
+            {'artikelnummer': '1', 'beschreibung': 'Hose', 'preis': '2,50'},
+            {'artikelnummer': '2', 'beschreibung': 'Buch', 'preis': 'abc'}]),
+    ])
+    return fm
+
+
+def test_snapshot_collects_generator_figures():
+    snapshot = GenerationSnapshot.from_market(_market())
+    invalid, valid = snapshot.entries
+    assert (invalid.number, invalid.valid, invalid.first_name, invalid.has_seller) == (1, False, 'Unbekannt', False)
+    assert snapshot.valid_entries == (valid,)
+    assert (valid.article_quantity, valid.total_cents, valid.invalid_prices) == (2, 250, ('2',))
+    assert valid.prices == (('1', '2,50'),)
+    assert (valid.first_name, valid.last_name) == ('Bea', 'Berg')
+
+
+def test_generators_share_one_market_pass(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    fm = _market()
+    snapshot = GenerationSnapshot.from_market(fm)
+    calls = []
+    monkeypatch.setattr(FleatMarket, 'main_numbers', lambda self: calls.append(self) or [])
+    monkeypatch.setattr(FleatMarket, 'seller_for', lambda self, m: calls.append(m))
+
+    SellerDataGenerator(fm, str(tmp_path), snapshot=snapshot).generate()
+    PriceListGenerator(fm, path=tmp_path, snapshot=snapshot).generate()
+    StatisticDataGenerator(fm, str(tmp_path), snapshot=snapshot).generate()
+    assert calls == []
+    assert (tmp_path / 'kundendaten.dat').read_text() == '"2","B",2,2,50\n'
+    assert (tmp_path / 'preisliste.dat').read_text() == '201,2.50\n'
+    assert (tmp_path / 'statistic_data.dat').read_text() == '2,"-"\n'
+
+
+def test_seller_list_skips_main_numbers_without_seller(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    fm = FleatMarket()
+    fm.load_sellers([SellerDataClass(id='2', vorname='Bea', nachname='Berg')])
+    fm.load_main_numbers([
+        MainNumberDataClass(name='stnr2', data=[{'artikelnummer': '1', 'beschreibung': 'Hose', 'preis': '2,50'}]),
+        MainNumberDataClass(name='stnr3', data=[{'artikelnummer': '1', 'beschreibung': 'Ball', 'preis': '1'}]),
+    ])
+    messages = []
+    monkeypatch.setattr(SellerDataGenerator, '_output_and_log', lambda self, level, msg: messages.append((level, msg)))
+
+    SellerDataGenerator(fm, str(tmp_path)).generate()
+    assert (tmp_path / 'kundendaten.dat').read_text() == '"2","B",1,2,50\n'
+    assert ('ERROR', 'Kein Verkäufer für Hauptnummer 3 (stnr3) gefunden. Übersprungen.') in messages
+
+
+def test_snapshot_reads_validity_from_validation_report(monkeypatch):
+    fm = _market()
+    tables = [MainNumberDataClass(name=m.name, data=[
+        {'artikelnummer': a.artikelnummer, 'beschreibung': a.beschreibung, 'preis': a.preis} for a in m.data])
+        for m in fm.main_numbers()]
+    report = ValidationEngine().validate(tables, [])
+    monkeypatch.setattr(MainNumber, 'is_valid', lambda self: pytest.fail('is_valid called'))
+
+    snapshot = GenerationSnapshot.from_market(fm, report)
+    assert [entry.valid for entry in snapshot.entries] == [False, True]
+    assert snapshot.entries[1].article_quantity == report.valid_article_count('stnr2') == 2
@@ -0,0 +1,92 @@
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import pytest
+pytest.importorskip('PySide6')
+
+from data.base_data import BaseData
+from data.http_cache import HttpCache
+
+DATASET = Path(__file__).parent / 'test_dataset.json'
+
+
+class _ExportHandler(BaseHTTPRequestHandler):
+    body = b''
+    etag = '"v1"'
+    gzip_requests = 0
+
+    def do_GET(self):
+        if self.headers.get('If-None-Match') == self.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        payload = self.body
+        self.send_response(200)
+        self.send_header('ETag', self.etag)
+        self.send_header('Content-Type', 'application/json')
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            type(self).gzip_requests += 1
+            payload = gzip.compress(payload)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _ExportHandler.body = DATASET.read_bytes()
+    _ExportHandler.etag = '"v1"'
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _ExportHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_address[1]}/market.json'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_conditional_get_served_from_cache(server, tmp_path):
+    cache = HttpCache(tmp_path)
+    first = cache.fetch(server)
+    assert first.read_bytes() == DATASET.read_bytes()
+    assert cache.metrics.cache_hits == 0
+    assert 0 < cache.metrics.bytes_transferred < DATASET.stat().st_size
+    assert _ExportHandler.gzip_requests >= 1
+
+    transferred = cache.metrics.bytes_transferred
+    assert cache.fetch(server) == first
+    assert cache.metrics.cache_hits == 1
+    assert cache.metrics.bytes_transferred == transferred
+    assert cache.metrics.requests == 2
+
+    _ExportHandler.body = b'[]'
+    _ExportHandler.etag = '"v2"'
+    assert cache.fetch(server).read_bytes() == b'[]'
+    assert cache.metrics.cache_hits == 1
+
+
+def test_offline_falls_back_to_cache(server, tmp_path):
+    cache = HttpCache(tmp_path)
+    cache.fetch(server)
+    unreachable = HttpCache(tmp_path, timeout=(0.5, 0.5))
+    unreachable._entry_paths = lambda url: cache._entry_paths(server)
+    assert unreachable.fetch('http://127.0.0.1:9/market.json').read_bytes() == DATASET.read_bytes()
+    assert unreachable.metrics.offline_hits == 1
+
+
+def test_base_data_loads_url_via_cache(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(BaseData, 'HTTP_CACHE_DIR', str(tmp_path))
+    remote = BaseData(server)
+    local = BaseData(json.loads(DATASET.read_text()))
+    assert remote.get_main_number_as_list() == local.get_main_number_as_list()
+    assert remote.get_storage_full_path() == server
+    assert remote.get_http_cache().metrics.requests == 1
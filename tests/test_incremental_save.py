@@ -0,0 +1,53 @@
+import json
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import pytest
+pytest.importorskip('PySide6')
+
+from data import data_manager
+from data.data_manager import DataManager
+
+DATASET = Path(__file__).parent / 'test_dataset.json'
+
+
+def _expected_text(dm: DataManager) -> str:
+    return json.dumps(dm.export_to_json(), indent=4, ensure_ascii=False)
+
+
+def test_save_matches_full_dump(tmp_path):
+    dm = DataManager(str(DATASET))
+    target = tmp_path / 'market.json'
+    dm.save(str(target))
+    assert target.read_text(encoding='utf-8') == _expected_text(dm)
+    assert not (tmp_path / 'market.json.tmp').exists()
+
+
+def test_save_reserializes_only_dirty_tables(tmp_path, monkeypatch):
+    dm = DataManager(str(DATASET))
+    target = tmp_path / 'market.json'
+    dm.save(str(target))
+
+    table = dm.main_numbers_list[0]
+    stnr_id = table.name[4:]
+    article = table.data[0]
+    dm.update_article(stnr_id, article.artikelnummer, 'Neu', '42', '9.99')
+
+    serialized = []
+    original = json.dumps
+
+    def counting_dumps(obj, *args, **kwargs):
+        if isinstance(obj, dict) and 'type' in obj:
+            serialized.append(obj.get('name', obj['type']))
+        return original(obj, *args, **kwargs)
+
+    monkeypatch.setattr(data_manager.json, 'dumps', counting_dumps)
+    dm.save(str(target))
+    monkeypatch.undo()
+
+    assert sorted(serialized) == sorted(['einstellungen', table.name])
+    assert target.read_text(encoding='utf-8') == _expected_text(dm)
+    reloaded = DataManager(str(target))
+    assert reloaded.main_numbers_list[0].data[0].beschreibung == 'Neu'
@@ -0,0 +1,57 @@
+import json
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import pytest
+pytest.importorskip('PySide6')
+
+from data.data_manager import DataManager
+from objects import FleatMarket, MainNumberDataClass, SellerDataClass
+
+DATASET = Path(__file__).parent / 'test_dataset.json'
+
+
+def _market():
+    fm = FleatMarket()
+    # Sellers deliberately in a different order than the tables
+    fm.load_sellers([SellerDataClass(id='2', vorname='Bea'), SellerDataClass(id='1', vorname='Anna')])
+    fm.load_main_numbers([
+        MainNumberDataClass(name=f'stnr{n}', data=[
+            {'artikelnummer': str(a), 'beschreibung': 'Hose', 'groesse': '', 'preis': str(a)} for a in (1, 2)])
+        for n in (1, 2, 3)])
+    return fm
+
+
+def test_fleat_market_joins_by_key():
+    fm = _market()
+    assert fm.seller_by_id(1).vorname == 'Anna'
+    assert fm.main_number_by_stnr('stnr2') is fm.main_number_by_stnr(2)
+    assert [getattr(fm.seller_for(m), 'vorname', None) for m in fm.main_numbers()] == ['Anna', 'Bea', None]
+    assert fm.article(2, '2').preis == '2'
+    assert fm.article(2, '9') is None
+    assert fm.article(9, '1') is None
+
+
+def test_receive_info_rows_use_owner_seller():
+    pytest.importorskip('reportlab')
+    from generator.receive_info_pdf_generator import ReceiveInfoPdfGenerator
+    rows = ReceiveInfoPdfGenerator(_market(), pickup_date='1.1.')._seller_rows()
+    assert [name for name, _, _ in rows] == [', Anna', ', Bea', 'Unbekannt, Unbekannt']
+
+
+def test_data_manager_lookups_cached_until_reload():
+    dm = DataManager(json.loads(DATASET.read_text()))
+    tables = dm.get_main_number_tables()
+    assert dm.get_main_number_tables() is tables
+    assert dm.get_seller('1') is dm.get_seller_as_list()[0]
+    assert dm.get_seller('99') is None
+
+    article = dm.update_article('1', '2', 'Jacke', '', '3')
+    assert tables['stnr1'].data[1] is article
+    with pytest.raises(ValueError):
+        dm.update_article('1', '99', 'Jacke', '', '3')
+
+    dm.restore_snapshot_state(dm.snapshot_state(), '')
+    assert dm.get_main_number_tables() is not tables
@@ -0,0 +1,59 @@
+import json
+from dataclasses import asdict
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import pytest
+pytest.importorskip('PySide6')
+
+from data.article_index import ArticleIndex
+from data.base_data import BaseData
+from objects import ArticleDataClass, MainNumberDataClass
+
+DATASET = Path(__file__).parent / 'test_dataset.json'
+
+
+def test_tables_decoded_on_first_access():
+    data = BaseData(str(DATASET))
+    tables = data.get_main_number_as_list()
+    assert tables and all(t.raw_rows() is not None for t in tables)
+    assert data.get_seller_as_list()  # sellers are decoded eagerly
+
+    first = tables[0]
+    rows = first.raw_rows()
+    assert all(isinstance(a, ArticleDataClass) for a in first.data)
+    assert first.raw_rows() is None
+    assert len(first.data) == len(rows)
+
+
+def test_summary_without_decoding():
+    lazy = BaseData(str(DATASET)).get_main_number_as_list()
+    decoded = BaseData(json.loads(DATASET.read_text())).get_main_number_as_list()
+    for table in decoded:
+        table.data  # decode
+    assert [t.summary() for t in lazy] == [t.summary() for t in decoded]
+    assert all(t.raw_rows() is not None for t in lazy)
+
+
+def test_summary_counts_cleared_rows_as_empty():
+    rows = [{'artikelnummer': '1', 'beschreibung': '', 'preis': '0.00'},
+            {'artikelnummer': '2', 'beschreibung': 'Hose', 'preis': '0.00'},
+            {'artikelnummer': '3', 'beschreibung': '', 'preis': '4'}]
+    lazy = MainNumberDataClass(name='stnr1', data=rows)
+    assert lazy.summary().filled == 2
+    lazy.data  # decode
+    assert lazy.raw_rows() is None
+    assert lazy.summary().filled == 2
+
+
+def test_lazy_table_behaves_like_decoded():
+    row = {'artikelnummer': 1, 'beschreibung': 'Hose', 'preis': None}
+    lazy = MainNumberDataClass(name='stnr1', data=[row])
+    index = ArticleIndex([lazy])
+    assert lazy.raw_rows() is not None
+    assert asdict(lazy)['data'][0]['preis'] == 'None'
+    assert index.status_counts() == ArticleIndex([lazy]).status_counts()
+    assert lazy == MainNumberDataClass(name='stnr1', data=[ArticleDataClass('1', 'Hose', '', 'None')])
+    assert MainNumberDataClass().data == []
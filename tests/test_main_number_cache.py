@@ -0,0 +1,79 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import pytest
+pytest.importorskip('PySide6')
+
+from data import ArticleIndex
+from objects import Article, FleatMarket, MainNumberDataClass
+from objects import article as article_module, main_number as main_number_module
+from generator.price_list_generator import PriceListGenerator
+from generator.seller_data_generator import SellerDataGenerator
+from generator.statistic_data_generator import StatisticDataGenerator
+from util.price_utils import PRICE_INVALID, PRICE_OK
+
+
+def _main_number(rows):
+    return MainNumberDataClass(type='table', name='stnr3', data=[
+        {'artikelnummer': n, 'beschreibung': d, 'groesse': '', 'preis': p} for n, d, p in rows])
+
+
+@pytest.fixture
+def validity_calls(monkeypatch):
+    calls = []
+    original = Article.is_valid
+
+    def counting(self):
+        calls.append(self)
+        return original(self)
+
+    monkeypatch.setattr(Article, 'is_valid', counting)
+    return calls
+
+
+def test_figures_cached_until_article_changes(validity_calls):
+    fm = FleatMarket()
+    fm.load_main_numbers([_main_number([('1', 'Hose', '10'), ('2', 'Jacke', '2,50'), ('3', '', '4')])])
+    main_number = fm.main_numbers()[0]
+
+    for _ in range(3):
+        assert main_number.is_valid()
+        assert main_number.article_quantity() == 2
+        assert main_number.article_total() == 12.5
+        assert len(main_number.valid_articles()) == 2
+    assert len(validity_calls) == 3
+
+    main_number._articles[2].beschreibung = 'Schal'
+    assert main_number.article_quantity() == 3
+    assert main_number.article_total_cents() == 1650
+    assert len(validity_calls) == 6
+
+
+def test_generation_validates_each_article_once(tmp_path, monkeypatch, validity_calls):
+    monkeypatch.chdir(tmp_path)
+    fm = FleatMarket()
+    fm.load_main_numbers([_main_number([('1', 'Hose', '10'), ('2', '', '')])])
+
+    SellerDataGenerator(fm, str(tmp_path)).generate()
+    PriceListGenerator(fm, path=tmp_path).generate()
+    StatisticDataGenerator(fm, str(tmp_path)).generate()
+    assert len(validity_calls) == 2
+
+
+def test_view_reads_parsed_prices_from_article_index(monkeypatch):
+    table = _main_number([('1', 'Hose', '10'), ('2', 'Jacke', 'zehn'), ('3', '', '4')])
+    index = ArticleIndex([table])
+    fm = FleatMarket()
+    fm.load_view([], [table], prices_of=index.table_prices)
+
+    def no_parsing(raw):
+        raise AssertionError(f'price {raw!r} parsed again')
+
+    monkeypatch.setattr(main_number_module, 'price_state', no_parsing)
+    monkeypatch.setattr(article_module, 'price_state', no_parsing)
+    main_number = fm.main_numbers()[0]
+    assert main_number.article_total_cents() == 1000
+    assert [(a.artikelnummer, cents, status) for a, cents, status in main_number.valid_article_prices()] == [
+        ('1', 1000, PRICE_OK), ('2', 0, PRICE_INVALID)]
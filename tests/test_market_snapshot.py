@@ -0,0 +1,70 @@
+import os
+import shutil
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import pytest
+pytest.importorskip('PySide6')
+
+from data.data_manager import DataManager
+from data.market_facade import MarketObserver
+from data.market_snapshot import MarketSnapshot
+
+DATASET = Path(__file__).parent / 'test_dataset.json'
+
+
+def _project(tmp_path):
+    export = tmp_path / 'market.json'
+    shutil.copy(DATASET, export)
+    return export, tmp_path / 'market.project'
+
+
+def test_snapshot_roundtrip_and_invalidation(tmp_path):
+    export, project = _project(tmp_path)
+    snapshot = MarketSnapshot.for_project(project)
+    assert snapshot.path == tmp_path / 'market.snapshot'
+    assert snapshot.load(export) is None
+
+    assert snapshot.save(export, {'answer': 42})
+    assert snapshot.load(export) == {'answer': 42}
+
+    # same content, new mtime -> still valid via content hash
+    st = export.stat()
+    os.utime(export, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+    assert snapshot.load(export) == {'answer': 42}
+
+    export.write_text(export.read_text().replace('Item 1', 'Item X'))
+    assert snapshot.load(export) is None
+    assert not snapshot.path.exists()
+
+
+def test_snapshot_format_version_bump(tmp_path, monkeypatch):
+    export, project = _project(tmp_path)
+    snapshot = MarketSnapshot.for_project(project)
+    snapshot.save(export, 'payload')
+    monkeypatch.setattr(MarketSnapshot, 'FORMAT_VERSION', MarketSnapshot.FORMAT_VERSION + 1)
+    assert snapshot.load(export) is None
+
+
+def test_observer_reopen_skips_json_decoding(tmp_path, monkeypatch):
+    export, project = _project(tmp_path)
+
+    first = MarketObserver()
+    assert first._load_market_data(str(export), str(project))
+    first.setup_data_generation()
+    assert first.fm.main_number_count() == 1
+    assert MarketSnapshot.for_project(project).path.is_file()
+
+    def _fail(*args, **kwargs):
+        raise AssertionError('JSON must not be decoded on a fresh snapshot')
+
+    monkeypatch.setattr(DataManager, 'load', _fail)
+    second = MarketObserver()
+    assert second._load_market_data(str(export), str(project))
+    assert second.data_manager.get_main_number_as_list() == first.data_manager.get_main_number_as_list()
+    assert second.data_manager.get_seller_as_list() == first.data_manager.get_seller_as_list()
+    second.setup_data_generation()
+    assert [m.name for m in second.fm.main_numbers()] == ['stnr1']
+    assert second.data_manager.get_storage_full_path() == str(export)
@@ -0,0 +1,55 @@
+import json
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import pytest
+pytest.importorskip('PySide6')
+
+from data import ArticleIndex, MarketSummary
+from data.data_manager import DataManager
+from objects import SettingsContentDataClass
+
+DATASET = Path(__file__).parent / 'test_dataset.json'
+
+
+def _fresh(dm):
+    return MarketSummary(ArticleIndex(dm.main_numbers_list), dm.get_seller_as_list(),
+                         dm.get_market_summary().max_main_numbers).snapshot()
+
+
+def test_summary_matches_rebuild_after_edits():
+    dm = DataManager(json.loads(DATASET.read_text()))
+    summary = dm.get_market_summary()
+    assert dm.get_market_summary() is summary
+    assert summary == _fresh(dm)
+    assert summary.progress_buckets() == dm.get_article_index().progress_buckets()
+    assert summary.active_sellers == 1
+
+    dm.update_article('1', '2', 'Mantel', '', '75')
+    dm.update_article('1', '3', 'Schal', '', '2,50')
+    updated = dm.get_market_summary()
+    assert updated is not summary
+    assert updated == _fresh(dm)
+    assert updated.cents == summary.cents + 7500 - 500 + 250
+    assert updated.price_histogram == (0, 0, 1, 0, 1, 0, 1)  # 2,50 / 10 / 75
+
+    dm.update_seller('1', email='')
+    assert dm.get_market_summary().active_sellers == 0
+    dm.delete_article_list('1')
+    assert dm.get_market_summary() == _fresh(dm)
+
+    dm.reset_all_changes()
+    assert dm.get_market_summary() == summary
+
+
+def test_summary_follows_settings():
+    dm = DataManager(json.loads(DATASET.read_text()))
+    assert dm.get_market_summary().max_main_numbers == 0
+    dm.set_new_settings(SettingsContentDataClass(max_stammnummern='4'))
+    summary = dm.get_market_summary()
+    assert summary.max_main_numbers == 4
+    assert summary.free_main_numbers() == 3
+    assert summary.used_percent() == 25
+    assert summary.used_percent(0) == 0
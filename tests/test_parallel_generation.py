@@ -0,0 +1,93 @@
+from pathlib import Path
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import pytest
+pytest.importorskip('PySide6')
+pytest.importorskip('reportlab')
+
+import data  # noqa: F401  (import order: data before objects.main_number)
+from objects import FleatMarket, MainNumberDataClass, SellerDataClass
+from display import BasicProgressTracker
+from generator.file_generator import FileGenerator
+
+
+def _market():
+    fm = FleatMarket()
+    fm.load_sellers([SellerDataClass(id=str(n), vorname=f'V{n}', nachname=f'N{n}') for n in range(1, 8)])
+    fm.load_main_numbers([MainNumberDataClass(name=f'stnr{n}', data=[
+        {'artikelnummer': str(a), 'beschreibung': 'Hose' if (a + n) % 3 else '', 'preis': f'{a},50'}
+        for a in range(1, 6)]) for n in range(1, 8)])
+    return fm
+
+
+def _template(path):
+    from reportlab.pdfgen import canvas
+    can = canvas.Canvas(str(path), pagesize=(842, 595))
+    can.drawString(10, 10, 'Vorlage')
+    can.save()
+    return path
+
+
+def _generate(root, template, workers, pdf_process_pool=True):
+    tracker = BasicProgressTracker()
+    FileGenerator(_market(), output_path=root, pdf_template_path_input=template, progress_tracker=tracker,
+                  max_workers=workers, pdf_process_pool=pdf_process_pool).create_all()
+    return tracker
+
+
+@pytest.mark.parametrize('pdf_process_pool', [True, False])
+def test_parallel_output_matches_sequential(tmp_path, monkeypatch, pdf_process_pool):
+    from pypdf import PdfReader
+    monkeypatch.chdir(tmp_path)
+    template = _template(tmp_path / 'vorlage.pdf')
+    sequential = _generate(tmp_path / 'seq', template, 1)
+    parallel = _generate(tmp_path / 'par', template, 4, pdf_process_pool)
+
+    for name in ('kundendaten.dat', 'preisliste.dat', 'statistik.dat'):
+        assert (tmp_path / 'par' / name).read_bytes() == (tmp_path / 'seq' / name).read_bytes()
+    pages = [[page.extract_text() for page in PdfReader(tmp_path / run / 'Abholbestaetigungen.pdf').pages]
+             for run in ('seq', 'par')]
+    assert pages[0] == pages[1] and len(pages[0]) == 2
+    assert parallel.get_state() == sequential.get_state()
+    assert parallel.percentage == 100 and not parallel.has_error
+
+
+def test_parallel_reports_task_errors(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    tracker = _generate(tmp_path / 'out', tmp_path / 'fehlt.pdf', 4)
+    assert tracker.has_error  # missing template fails the PDF task only
+    assert (tmp_path / 'out' / 'kundendaten.dat').is_file()
+    assert tracker.percentage == 100
+
+
+class _FakeTask:
+    def __init__(self, wait_for=None):
+        self.wait_for = wait_for
+        self.waited = None
+
+    def generate(self, overall_tracker=None):
+        if self.wait_for is not None:
+            self.waited = self.wait_for()
+        overall_tracker.increment()
+
+
+def test_progress_follows_completed_tasks(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    tracker = BasicProgressTracker()
+
+    def fast_task_merged():
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if tracker.current >= 2:
+                return True
+            time.sleep(0.01)
+        return False
+
+    slow, fast = _FakeTask(fast_task_merged), _FakeTask()
+    generator = FileGenerator(_market(), output_path=tmp_path / 'out', progress_tracker=tracker, max_workers=2)
+    generator._run_tasks([('Langsam', slow), ('Schnell', fast)], 'Test')
+    assert slow.waited  # the second task's progress arrived while the first one was still running
+    assert tracker.percentage == 100 and not tracker.has_error
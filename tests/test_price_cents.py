@@ -0,0 +1,55 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import pytest
+pytest.importorskip('PySide6')
+
+import data  # noqa: F401  (import order: data before objects.main_number)
+from objects import Article, ArticleDataClass, FleatMarket, MainNumberDataClass, SellerDataClass
+from generator.price_list_generator import PriceListGenerator
+from generator.seller_data_generator import SellerDataGenerator
+from util.price_utils import PRICE_EMPTY, PRICE_INVALID, PRICE_OK, format_cents, price_state
+
+
+@pytest.mark.parametrize('raw, state', [
+    ('12,50', (1250, PRICE_OK)), (' 3 ', (300, PRICE_OK)), ('', (0, PRICE_EMPTY)), ('None', (0, PRICE_EMPTY)),
+    (None, (0, PRICE_EMPTY)), ('  ', (0, PRICE_EMPTY)), ('abc', (0, PRICE_INVALID)),
+])
+def test_price_state(raw, state):
+    assert price_state(raw) == state
+
+
+def test_format_cents():
+    assert format_cents(1250) == '12.50'
+    assert format_cents(5, ',') == '0,05'
+    assert format_cents(-150) == '-1.50'
+
+
+def test_article_parses_price_on_assignment():
+    article = Article(ArticleDataClass('1', 'Hose', preis='2,5'))
+    assert (article.preis_cents, article.preis_status) == (250, PRICE_OK)
+    article.preis = 'x'
+    assert (article.preis_cents, article.preis_status) == (0, PRICE_INVALID)
+    assert article.price_valid()  # set, but not a number
+    article.preis = 'None'
+    assert not article.price_valid()
+
+
+def test_generators_use_exact_cents(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    rows = [('1', 'Hose', '0,10'), ('2', 'Jacke', '0.20'), ('3', 'Buch', 'abc'), ('4', 'Schal', '1')]
+    fm = FleatMarket()
+    fm.load_sellers([SellerDataClass(id='5', vorname='Eva', nachname='Ernst')])
+    fm.load_main_numbers([MainNumberDataClass(name='stnr5', data=[
+        {'artikelnummer': n, 'beschreibung': d, 'groesse': '', 'preis': p} for n, d, p in rows])])
+    assert fm.main_numbers()[0].article_total_cents() == 130
+
+    messages = []
+    monkeypatch.setattr(PriceListGenerator, '_output_and_log', lambda self, level, msg: messages.append((level, msg)))
+    PriceListGenerator(fm, path=tmp_path).generate()
+    assert (tmp_path / 'preisliste.dat').read_text() == '501,0.10\n502,0.20\n504,1\n'  # prices as entered
+    assert ('WARNING', 'Stammnummer 5, Artikel 3: Preis ist keine Zahl. Übersprungen.') in messages
+    SellerDataGenerator(fm, str(tmp_path)).generate()
+    assert (tmp_path / 'kundendaten.dat').read_text() == '"5","B",4,1,30\n'
@@ -0,0 +1,54 @@
+from pathlib import Path
+import pickle
+from dataclasses import asdict
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import pytest
+pytest.importorskip('PySide6')
+
+import data  # noqa: F401  (import order: data before objects.main_number)
+from objects import (Article, ArticleDataClass, MainNumber, MainNumberDataClass, Seller, SellerDataClass,
+                     decode_article_rows)
+
+
+def _rows():
+    # Built from separate string objects, as json.loads does
+    return [{'artikelnummer': str(n), 'beschreibung': 'Hose', 'groesse': ''.join(['1', '16']),
+             'preis': ''.join(['2', '.50']), 'created_at': ''.join(['2024', '-03-01']), 'updated_at': ''}
+            for n in range(1, 4)]
+
+
+def test_records_have_no_instance_dict():
+    for record in (ArticleDataClass(), Article(), SellerDataClass(), Seller(SellerDataClass(id='1'))):
+        assert not hasattr(record, '__dict__')
+    seller = Seller(SellerDataClass(id='7', email='a@b.c'))
+    assert (seller.id, seller.email) == ('7', 'a@b.c')
+    article = ArticleDataClass('1', 'Hose', preis='3')
+    assert pickle.loads(pickle.dumps(article)) == article
+
+
+def test_seller_without_info_has_defaults():
+    seller = Seller()
+    assert (seller.id, seller.vorname, seller.email) == ('', '', '')
+    assert asdict(seller) == asdict(SellerDataClass())
+
+
+def test_repeated_values_are_interned():
+    first, second, _ = decode_article_rows(_rows())
+    assert first.groesse is second.groesse
+    assert first.preis is second.preis
+    assert first.created_at is second.created_at
+
+
+def test_main_number_builds_records_from_raw_rows():
+    info = MainNumberDataClass(name='stnr4', data=_rows())
+    main_number = MainNumber(info)
+    assert info.raw_rows() is not None  # source table not decoded
+    assert all(type(a) is Article for a in main_number.data)
+    assert main_number.data is main_number._articles
+    assert main_number.data[0].groesse is main_number.data[1].groesse
+    assert main_number.article_quantity() == 3
+    main_number.data[0].beschreibung = ''
+    assert main_number.article_quantity() == 2
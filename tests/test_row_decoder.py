@@ -0,0 +1,44 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from objects.data_class_definition import (
+    ArticleDataClass,
+    MainNumberDataClass,
+    SellerDataClass,
+    SellerListDataClass,
+    decode_article_rows,
+    decode_seller_rows,
+)
+
+
+def _per_row(cls, row):
+    return cls(**{name: str(row.get(name, '')) for name in cls.__dataclass_fields__})
+
+
+def test_article_rows_match_per_row_conversion():
+    existing = ArticleDataClass(artikelnummer='9')
+    rows = [
+        {'artikelnummer': '1', 'beschreibung': 'Hose', 'groesse': '98', 'preis': '3.50',
+         'created_at': 'c', 'updated_at': 'u'},
+        {'artikelnummer': 2, 'beschreibung': 'Jacke', 'groesse': None, 'preis': 7.5,
+         'created_at': 'c', 'updated_at': 'u'},
+        {'artikelnummer': '3', 'preis': '1'},
+        {'artikelnummer': '4', 'beschreibung': 'Extra', 'groesse': '', 'preis': '',
+         'created_at': '', 'updated_at': '', 'unbekannt': 'x'},
+        existing,
+    ]
+    decoded = decode_article_rows(rows)
+    assert decoded[:4] == [_per_row(ArticleDataClass, r) for r in rows[:4]]
+    assert decoded[1].groesse == 'None' and decoded[1].preis == '7.5'
+    assert decoded[4] is existing
+
+
+def test_table_post_init_uses_decoder():
+    table = MainNumberDataClass(name='stnr1', data=[{'artikelnummer': '1', 'preis': '2'}])
+    assert table.data == [ArticleDataClass(artikelnummer='1', preis='2')]
+
+    sellers = SellerListDataClass(data=[{'id': 5, 'vorname': 'A'}])
+    assert sellers.data == [SellerDataClass(id='5', vorname='A')]
+    assert decode_seller_rows([]) == []
@@ -0,0 +1,89 @@
+import json
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import pytest
+pytest.importorskip('PySide6')
+
+from data.data_manager import DataManager
+from data.search_index import SearchIndex
+from objects import ArticleDataClass, MainNumberDataClass, SellerDataClass
+
+DATASET = Path(__file__).parent / 'test_dataset.json'
+
+
+def _article(number, desc, size=''):
+    return ArticleDataClass(artikelnummer=number, beschreibung=desc, groesse=size)
+
+
+def test_prefix_and_casefold_matching():
+    tables = [MainNumberDataClass(name='stnr2', data=[_article('1', 'Blaue Jacke', '128'), _article('2', 'Hose')]),
+              MainNumberDataClass(name='stnr10', data=[_article('1', 'JACKE rot')])]
+    sellers = [SellerDataClass(id='2', vorname='Anna', nachname='Groß', email='anna@example.org')]
+    index = SearchIndex(tables, sellers)
+
+    assert index.search('jack') == ['stnr2:1', 'stnr10:1']
+    assert index.search('jacke 12') == ['stnr2:1']
+    assert index.search('GROSS') == ['verkaeufer:2']  # casefold: ß -> ss
+    assert index.search('anna example') == ['verkaeufer:2']
+    assert index.search('jacke hose') == []
+    assert index.search('') == []
+    assert index.search('j', limit=1) == ['stnr2:1']
+
+    tables[0].data[1].beschreibung = 'Jacke grün'
+    index.update_article('stnr2', tables[0].data[1])
+    assert index.search('jacke')[:2] == ['stnr2:1', 'stnr2:2']
+    tables[0].data[1].beschreibung = ''
+    index.update_article('stnr2', tables[0].data[1])
+    assert index.search('grün') == []
+    assert 'grün' not in index._vocabulary
+
+
+def test_data_manager_search_follows_edits():
+    dm = DataManager(json.loads(DATASET.read_text()))
+    hits = dm.search('item')
+    assert [h.key for h in hits] == ['stnr1:1', 'stnr1:3']
+    assert hits[0].kind == 'article' and hits[0].obj is dm.get_main_number_tables()['stnr1'].data[0]
+
+    dm.update_article('1', '2', 'Winterjacke', '116', '5')
+    assert [h.key for h in dm.search('winterj 116')] == ['stnr1:2']
+
+    with dm.batch():
+        dm.update_seller('1', vorname='Bernd')
+    assert [h.kind for h in dm.search('bernd')] == ['seller']
+
+    dm.delete_article_list('1')
+    assert dm.search('item') == []
+    dm.reset_all_changes()
+    assert [h.key for h in dm.search('item')] == ['stnr1:1', 'stnr1:3']
+
+
+def test_duplicate_article_numbers_share_a_key():
+    table = MainNumberDataClass(name='stnr1', data=[_article('1', 'zebra jacke'), _article('2', 'apfel'),
+                                                    _article('1', 'hose')])
+    index = SearchIndex([table], [])
+
+    assert index.search('zebra') == ['stnr1:1']
+    assert index.search('hose') == ['stnr1:1']
+    assert index.search('apfel') == ['stnr1:2']
+    assert index._vocabulary == sorted(set(index._vocabulary))
+
+    table.data[0].beschreibung = 'mantel'
+    index.update_article('stnr1', table.data[0])
+    assert index.search('zebra') == []
+    assert index.search('hose') == ['stnr1:1']
+    assert index.search('mantel') == ['stnr1:1']
+    assert 'zebra' not in index._vocabulary
+
+
+def test_duplicate_article_numbers_in_export_rows():
+    rows = [{'artikelnummer': '1', 'beschreibung': 'zebra jacke'}, {'artikelnummer': '2', 'beschreibung': 'apfel'},
+            {'artikelnummer': '1', 'beschreibung': 'hose'}]
+    table = MainNumberDataClass(name='stnr1', data=rows)
+    index = SearchIndex([table], [])
+
+    assert table.raw_rows() is not None
+    assert index.search('hose') == ['stnr1:1']
+    assert index.search('zebra jacke') == ['stnr1:1']
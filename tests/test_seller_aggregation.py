@@ -0,0 +1,68 @@
+import json
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import pytest
+pytest.importorskip('PySide6')
+
+from data.data_manager import DataManager
+
+DATASET = Path(__file__).parent / 'test_dataset.json'
+
+
+def _seller(id_, vorname, email):
+    return {'id': id_, 'vorname': vorname, 'nachname': '', 'telefon': '', 'email': email,
+            'passwort': '', 'created_at': '', 'updated_at': ''}
+
+
+def _data():
+    data = json.loads(DATASET.read_text())
+    tables = {entry['name']: entry for entry in data if entry.get('type') == 'table'}
+    tables['verkaeufer']['data'] = [_seller('1', 'A', 'a@b.c'), _seller('2', 'C', 'c@d.e'),
+                                    _seller('3', 'A', 'a@b.c')]
+    template = tables['stnr1']
+    for number in ('2', '3', '9'):
+        data.insert(data.index(template) + 1, dict(template, name=f'stnr{number}', data=[]))
+    return data
+
+
+def _shape(aggregated):
+    return {key: (user['info'].id if user['info'].id else None, list(user['ids']),
+                  sorted(t.name for t in user['stamms']))
+            for key, user in aggregated.items()}
+
+
+def test_aggregation_memoized_and_grouped():
+    dm = DataManager(_data())
+    aggregated = dm.get_aggregated_users()
+    assert dm.get_aggregated_users() is aggregated
+    assert list(aggregated) == ['a@b.c', 'c@d.e', '<LEER>']
+    assert aggregated['a@b.c']['ids'] == ['1', '3']
+    assert aggregated['<LEER>']['ids'] == ['9']
+
+    # Article edits do not touch the seller groups
+    dm.update_article('1', '1', 'Mantel', '', '3')
+    assert dm.get_aggregated_users() is aggregated
+
+
+def test_seller_edit_regroups_like_a_rebuild():
+    dm = DataManager(_data())
+    aggregated = dm.get_aggregated_users()
+
+    dm.delete_seller('1')
+    assert dm.get_aggregated_users() is aggregated
+    assert aggregated['a@b.c']['info'].id == '3'
+    assert _shape(aggregated) == _shape(DataManager(dm.export_to_json()).get_aggregated_users())
+
+    dm.delete_seller('2')
+    assert 'c@d.e' not in aggregated
+    assert aggregated['<LEER>']['ids'] == ['1', '2', '9']
+
+    change = next(e for e in reversed(dm.get_change_log()) if e['target'] == 'verkaeufer:1')
+    assert dm.reset_change(change['id'])
+    assert list(aggregated) == ['a@b.c', '<LEER>']
+    assert aggregated['a@b.c']['ids'] == ['1', '3']
+    assert aggregated['a@b.c']['info'].id == '1'
+    assert _shape(aggregated) == _shape(DataManager(dm.export_to_json()).get_aggregated_users())
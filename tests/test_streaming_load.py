@@ -0,0 +1,63 @@
+import json
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import pytest
+pytest.importorskip('PySide6')
+
+from data.json_handler import JsonHandler
+from data.base_data import BaseData
+
+DATASET = Path(__file__).parent / 'test_dataset.json'
+
+
+def test_iter_local_items_matches_json_load():
+    expected = json.loads(DATASET.read_text())
+    for chunk_size in (3, 17, 1 << 16):
+        items = list(JsonHandler().iter_local_items(str(DATASET), chunk_size=chunk_size))
+        assert items == expected
+
+
+def test_iter_local_items_rejects_non_array(tmp_path):
+    target = tmp_path / 'object.json'
+    target.write_text('{"type": "header"}')
+    with pytest.raises(json.JSONDecodeError):
+        list(JsonHandler().iter_local_items(str(target)))
+
+
+@pytest.mark.parametrize('text', ['[{"a": 1} {"b": 2}]', '[1, 2] 3', '[1,]', '[1, 2', '[,1]', '[] x'])
+def test_iter_local_items_rejects_malformed_arrays(tmp_path, text):
+    target = tmp_path / 'broken.json'
+    target.write_text(text)
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(text)
+    for chunk_size in (1, 4, 1 << 16):
+        with pytest.raises(json.JSONDecodeError):
+            list(JsonHandler().iter_local_items(str(target), chunk_size=chunk_size))
+
+
+def test_iter_local_items_accepts_empty_array_and_whitespace(tmp_path):
+    target = tmp_path / 'empty.json'
+    target.write_text(' [ ]\n ')
+    assert list(JsonHandler().iter_local_items(str(target), chunk_size=2)) == []
+
+
+def test_streaming_load_equals_classic_load():
+    streamed = BaseData(str(DATASET))
+    classic = BaseData(json.loads(DATASET.read_text()))
+
+    assert streamed.json_data is None
+    assert streamed.get_main_number_as_list() == classic.get_main_number_as_list()
+    assert streamed.get_seller_as_list() == classic.get_seller_as_list()
+    assert streamed.export_header == classic.export_header
+    assert streamed.settings == classic.settings
+
+
+def test_streaming_load_truncated_file(tmp_path):
+    target = tmp_path / 'broken.json'
+    target.write_text(DATASET.read_text()[:-20])
+    data = BaseData(str(target))
+    assert data.get_main_number_as_list() == []
+    assert data.get_seller_as_list() == []
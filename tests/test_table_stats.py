@@ -0,0 +1,44 @@
+import json
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import pytest
+pytest.importorskip('PySide6')
+
+from data.data_manager import DataManager
+from objects import TableStats
+
+DATASET = Path(__file__).parent / 'test_dataset.json'
+
+
+def _fresh_stats(dm, stnr):
+    counts = dm.get_article_index().status_counts(f'stnr{stnr}')
+    return TableStats(counts['vollstaendig'], counts['teilweise'], counts['offen'],
+                      dm.get_article_index().price_sum_cents(f'stnr{stnr}'))
+
+
+def test_table_stats_cached_and_kept_in_sync():
+    dm = DataManager(json.loads(DATASET.read_text()))
+    stats = dm.get_table_stats('1')
+    assert dm.get_table_stats('stnr1') is stats
+    assert stats.total == 4
+    assert dm.get_article_count('1') == stats.complete
+    assert dm.get_article_sum('1') == stats.cents / 100
+    assert dm.get_table_stats('99') == TableStats()
+
+    article = dm.get_main_number_tables()['stnr1'].data[0]
+    dm.update_article('1', article.artikelnummer, 'Mantel', '', '7,50')
+    updated = dm.get_table_stats('1')
+    assert updated is not stats
+    assert updated == _fresh_stats(dm, '1')
+
+    change = dm.get_change_log()[-1]
+    dm.delete_article_list('1')
+    assert dm.get_table_stats('1') == _fresh_stats(dm, '1')
+    assert dm.get_table_stats('1').complete == 0
+
+    assert dm.reset_change(change['id'])
+    assert dm.get_table_stats('1') == _fresh_stats(dm, '1')
+    assert dm.get_table_stats('1').complete == 1
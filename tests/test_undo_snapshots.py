@@ -0,0 +1,60 @@
+import json
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import pytest
+pytest.importorskip('PySide6')
+
+from data.data_manager import DataManager
+
+DATASET = Path(__file__).parent / 'test_dataset.json'
+
+
+def _manager():
+    return DataManager(json.loads(DATASET.read_text()))
+
+
+def test_table_delete_keeps_previous_list_and_swaps_it_back():
+    dm = _manager()
+    table = dm.get_main_number_tables()['stnr1']
+    previous = table.data
+    values = [(a.beschreibung, a.preis) for a in previous]
+    counts = dm.get_article_index().status_counts('stnr1')
+
+    dm.delete_article_list('1')
+    assert table.data is not previous
+    assert [(a.beschreibung, a.preis) for a in previous] == values  # untouched
+    assert all(a.beschreibung == '' for a in table.data)
+    assert dm.get_change_log()[-1]['old_value'].keys() == {'snapshot'}
+
+    dm.update_article('1', '1', 'Mantel', '', '5')  # edits go to the new list
+    assert previous[0].beschreibung == values[0][0]
+
+    assert dm.reset_all_changes() == 2
+    assert table.data is previous
+    assert dm.get_article_index().status_counts('stnr1') == counts
+    assert dm._change_log._snapshots == {}
+
+
+def test_dataset_delete_is_one_revertible_change():
+    dm = _manager()
+    table = dm.get_main_number_tables()['stnr1']
+    previous = table.data
+    dm.delete_dataset('1')
+    log = dm.get_change_log()
+    assert [e['action'] for e in log] == ['BATCH']
+    assert dm.get_seller('1').vorname == ''
+
+    assert dm.reset_change(log[0]['id'])
+    assert table.data is previous
+    assert dm.get_seller('1').vorname == 'A'
+
+
+def test_superseded_snapshots_are_released():
+    dm = _manager()
+    dm.delete_article_list('1')
+    dm.delete_article_list('1')  # collapses with the first delete
+    assert len(dm.get_change_log()) == 1
+    assert len(dm._change_log._snapshots) == 1
@@ -0,0 +1,86 @@
+import json
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import pytest
+pytest.importorskip('PySide6')
+
+from data.data_manager import DataManager
+from data.validation import ValidationEngine
+from objects import MainNumber, MainNumberDataClass, SellerDataClass
+
+DATASET = Path(__file__).parent / 'test_dataset.json'
+
+
+def _table(name, rows):
+    return MainNumberDataClass(type='table', name=name, data=rows)
+
+
+def _row(number, desc, price):
+    return {'artikelnummer': number, 'beschreibung': desc, 'groesse': '', 'preis': price}
+
+
+def test_engine_reports_all_categories_in_one_pass():
+    tables = [
+        _table('stnr1', [_row('1', 'Hose', '10'), _row('1', 'Jacke', '12,50'), _row('2', '', '5'),
+                         _row('3', 'Schal', 'abc'), _row('4', '', '')]),
+        _table('stnr7', [_row('1', 'Buch', '2')]),
+    ]
+    sellers = [SellerDataClass(id='1'), SellerDataClass(id='2')]
+    report = ValidationEngine().validate(tables, sellers)
+
+    assert report.counts() == {
+        'DUPLICATE_ARTICLE_NUMBER': 1, 'PRICE_COMMA': 1, 'DESCRIPTION_MISSING': 1, 'PRICE_INVALID': 1,
+        'SELLER_WITHOUT_TABLE': 1, 'ORPHAN_TABLE': 1,
+    }
+    assert [i.target for i in report.by_code('ORPHAN_TABLE')] == ['stnr7']
+    assert [i.target for i in report.by_code('SELLER_WITHOUT_TABLE')] == ['verkaeufer:2']
+    assert not report.ok
+    assert report.article_count == 6
+    # Invalid prices still count as set, like Article.is_valid
+    assert report.valid_article_count('stnr1') == 3
+    assert report.table_is_valid('stnr7')
+    assert not report.table_is_valid('stnr99')
+
+
+def test_report_cached_per_data_version():
+    dm = DataManager(json.loads(DATASET.read_text()))
+    table = dm.get_main_number_tables()['stnr1']
+    assert table.raw_rows() is not None
+    report = dm.validate()
+    assert table.raw_rows() is not None  # validation does not decode the table
+    assert dm.validate() is report
+    assert dm.validate_structure()
+
+    article = table.data[0]
+    dm.update_article('1', article.artikelnummer, '', '', '1,5')
+    updated = dm.validate()
+    assert updated is not report
+    assert updated.by_code('PRICE_COMMA')
+    assert updated.by_code('DESCRIPTION_MISSING')
+
+    dm.delete_seller('1')  # clears the seller but keeps its id
+    assert dm.validate() is not updated
+    assert dm.validate_structure()
+
+
+
+def test_cleared_rows_are_not_validated():
+    dm = DataManager(json.loads(DATASET.read_text()))
+    dm.delete_article_list('1')
+    assert not dm.validate().by_code('DESCRIPTION_MISSING')
+
+    table = _table('stnr2', [_row('1', '', '0.00'), _row('2', 'Hose', '0.00'), _row('3', '', '0,00')])
+    report = ValidationEngine().validate([table], [SellerDataClass(id='2')])
+    assert [i.target for i in report.by_code('DESCRIPTION_MISSING')] == ['stnr2:3']
+
+
+def test_whitespace_price_is_no_price():
+    table = _table('stnr1', [_row('1', 'Hose', '  '), _row('2', 'Jacke', ' 3 ')])
+    report = ValidationEngine().validate([table], [SellerDataClass(id='1')])
+    assert report.counts() == {'PRICE_MISSING': 1}
+    assert [i.target for i in report.by_code('PRICE_MISSING')] == ['stnr1:1']
+    assert report.valid_article_count('stnr1') == 1
+    assert MainNumber(table).article_quantity() == 1  # generators count the same articles